@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: repeated XPath parameter scans vs the single-pass DecodedComponent
+
+Builds a component-heavy synthetic job and replays the elementParameter
+lookups the extractors perform per component, once with node.find/findall
+XPath scans (the pre-decoder access pattern) and once through a
+DecodedComponent index.
+
+Usage: python benchmarks/bench_component_decoder.py [components] [params_per_component]
+"""
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from talend_parser.talend_parser import DecodedComponent  # noqa: E402
+
+COMPONENT_TYPES = [
+    "tDBInput",
+    "tDBOutput",
+    "tDBRow",
+    "tDBConnection",
+    "tMap",
+    "tDie",
+    "tLogRow",
+    "tFilterRow",
+]
+
+# Parameter lookups issued per component by the extractors
+SQL_PARAMS = ["QUERY", "DBTABLE", "TABLE", "DBQUERY", "SQL_QUERY", "QUERY_BAND"]
+SINGLE_LOOKUPS = {
+    "tDBInput": ["TABLE", "DBTABLE", "QUERY"],
+    "tDBOutput": ["DATA_ACTION", "TABLE", "DBTABLE", "QUERY"],
+    "tDBRow": ["QUERY", "TABLE", "DBTABLE", "QUERY"],
+    "tDBConnection": [
+        "AUTO_COMMIT",
+        "USE_BATCH",
+        "BATCH_SIZE",
+        "COMMIT_EVERY",
+        "USE_BATCH",
+        "BATCH_SIZE",
+        "ENABLE_PARALLEL_EXECUTION",
+        "MAX_MEMORY",
+        "TIMEOUT",
+        "MAX_ROWS",
+        "AUTO_COMMIT",
+    ],
+    "tMap": [],
+    "tDie": ["MESSAGE", "CODE", "PRIORITY"],
+    "tLogRow": ["PRINT_CONTENT_WITH_LOG4J", "FIELDSEPARATOR", "PRINT_HEADER"],
+    "tFilterRow": [],
+}
+
+
+def build_job(components: int, params_per_component: int) -> ET.Element:
+    """Build a synthetic job root with parameter-heavy components"""
+    root = ET.Element("ProcessType")
+    for i in range(components):
+        comp_type = COMPONENT_TYPES[i % len(COMPONENT_TYPES)]
+        node = ET.SubElement(
+            root, "node", componentName=comp_type, uniqueName=f"{comp_type}_{i}"
+        )
+        for p in range(params_per_component):
+            ET.SubElement(
+                node, "elementParameter", field="TEXT", name=f"PARAM_{p}", value=str(p)
+            )
+        ET.SubElement(
+            node,
+            "elementParameter",
+            field="MEMO_SQL",
+            name="QUERY",
+            value=f'"SELECT * FROM table_{i}"',
+        )
+        conn = ET.SubElement(node, "elementParameter", field="TABLE", name="CONNECTION")
+        ET.SubElement(conn, "elementValue", elementRef="FLOW", value=f"row{i}")
+        metadata = ET.SubElement(node, "metadata", connector="FLOW", name=f"row{i}")
+        for c in range(10):
+            ET.SubElement(metadata, "column", name=f"col{c}", type="id_String")
+    return root
+
+
+def repeated_scans(root: ET.Element) -> int:
+    """Pre-decoder access pattern: one XPath scan per lookup"""
+    hits = 0
+    for node in root.findall(".//node"):
+        comp_type = node.get("componentName", "")
+        hits += len(node.findall('.//elementParameter[@field="TABLE"]'))
+        for name in SQL_PARAMS:
+            hits += len(node.findall(f".//elementParameter[@name='{name}']"))
+        for name in SINGLE_LOOKUPS[comp_type]:
+            if node.find(f".//elementParameter[@name='{name}']") is not None:
+                hits += 1
+        hits += len(node.findall(".//metadata"))
+        hits += len(node.findall(".//nodeData"))
+    return hits
+
+
+def decoded_lookups(root: ET.Element) -> int:
+    """Single pass per component, then dict lookups"""
+    hits = 0
+    for node in root.findall(".//node"):
+        component = DecodedComponent(node)
+        hits += len(
+            [e for e in component.params("CONNECTION") if e.get("field") == "TABLE"]
+        )
+        for name in SQL_PARAMS:
+            hits += len(component.params(name))
+        for name in SINGLE_LOOKUPS[component.comp_type]:
+            if component.param(name) is not None:
+                hits += 1
+        hits += len(component.metadata)
+        hits += len(component.node_data)
+    return hits
+
+
+def best_of(func, root: ET.Element, repeat: int = 5) -> float:
+    """Best wall time of several runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(root)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="XPath parameter scans vs DecodedComponent benchmark"
+    )
+    arg_parser.add_argument("components", type=int, nargs="?", default=400)
+    arg_parser.add_argument("params_per_component", type=int, nargs="?", default=80)
+    args = arg_parser.parse_args()
+
+    root = build_job(args.components, args.params_per_component)
+    before = best_of(repeated_scans, root)
+    after = best_of(decoded_lookups, root)
+
+    print(
+        f"Components: {args.components}, "
+        f"parameters/component: {args.params_per_component}"
+    )
+    print(f"  Repeated XPath scans: {before * 1000:8.2f} ms")
+    print(f"  DecodedComponent:     {after * 1000:8.2f} ms")
+    print(f"  Speedup:              {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
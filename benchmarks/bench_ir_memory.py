@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bytes per extracted record, plain dataclasses vs the slotted IR
+
+Parses synthetic tMap/SQL components job by job (each tree is released
+before the next, as in the parser) and keeps the extracted records, once as
+the pre-slots dataclasses with per-attribute string copies and once as the
+slotted, interned ExtractedSQL/TMapExpression records. Memory is measured
+with tracemalloc.
+
+Usage: python benchmarks/bench_ir_memory.py [jobs] [expressions_per_job]
+"""
+
+import argparse
+import sys
+import tracemalloc
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from talend_parser.talend_parser import ExtractedSQL, TMapExpression  # noqa: E402
+
+# Expression shapes that repeat verbatim across real exports
+EXPRESSIONS = [
+    "row1.{col} == null ? \"\" : row1.{col}",
+    "StringHandling.TRIM(row1.{col})",
+    "TalendDate.formatDate(\"yyyy-MM-dd\", row1.{col})",
+    "row1.{col} == null ? null : row1.{col}.toUpperCase()",
+    "Relational.ISNULL(row1.{col}) ? 0 : row1.{col}",
+]
+SQL_PER_JOB = 4
+
+
+@dataclass
+class LegacyExtractedSQL:
+    """ExtractedSQL before the slotted IR"""
+
+    job_name: str
+    component_name: str
+    component_type: str
+    sql_operation: str
+    raw_sql: str
+    cleaned_sql: str
+    tables: List[str]
+    context_variables: List[str]
+
+
+@dataclass
+class LegacyTMapExpression:
+    """TMapExpression before the slotted IR"""
+
+    job_name: str
+    component_name: str
+    input_column: str
+    output_column: str
+    expression: str
+    data_type: str
+
+
+def build_job_xml(job: int, expressions: int) -> bytes:
+    """One job with a tMap of `expressions` columns and a few SQL components"""
+    root = ET.Element("ProcessType")
+    tmap = ET.SubElement(root, "node", componentName="tMap", uniqueName="tMap_1")
+    metadata = ET.SubElement(tmap, "metadata", connector="FLOW", name="out1")
+    for i in range(expressions):
+        col = f"col_{i % 40}"
+        ET.SubElement(
+            metadata,
+            "column",
+            name=col,
+            originalDbColumnName=col,
+            type="id_String",
+            expression=EXPRESSIONS[i % len(EXPRESSIONS)].format(col=col),
+        )
+    for i in range(SQL_PER_JOB):
+        node = ET.SubElement(
+            root, "node", componentName="tDBInput", uniqueName=f"tDBInput_{i}"
+        )
+        ET.SubElement(
+            node,
+            "elementParameter",
+            name="QUERY",
+            value=f'"SELECT id, name FROM \\"+context.schema+\\".table_{i} WHERE job = {job}"',
+        )
+    return ET.tostring(root)
+
+
+def extract(jobs: List[bytes], sql_cls, tmap_cls, keep_raw_sql: bool = True) -> list:
+    """Parse each job, extract records and release the tree"""
+    records = []
+    for job, content in enumerate(jobs):
+        root = ET.fromstring(content)
+        job_name = f"Job_{job}_0.1"
+        for node in root.iter("node"):
+            comp_name = node.get("uniqueName", "")
+            comp_type = node.get("componentName", "")
+            for column in node.iter("column"):
+                records.append(
+                    tmap_cls(
+                        job_name=job_name,
+                        component_name=comp_name,
+                        input_column=column.get("originalDbColumnName", ""),
+                        output_column=column.get("name", ""),
+                        expression=column.get("expression", ""),
+                        data_type=column.get("type", ""),
+                    )
+                )
+            for param in node.iter("elementParameter"):
+                raw_sql = param.get("value", "")
+                cleaned_sql = raw_sql.strip('"').replace('\\"', '"')
+                records.append(
+                    sql_cls(
+                        job_name=job_name,
+                        component_name=comp_name,
+                        component_type=comp_type,
+                        sql_operation="SELECT",
+                        raw_sql=raw_sql if keep_raw_sql else "",
+                        cleaned_sql=cleaned_sql,
+                        tables=[cleaned_sql.split(".")[-1].split()[0]],
+                        context_variables=["schema"],
+                    )
+                )
+        del root
+    return records
+
+
+def measure(jobs: List[bytes], *args) -> int:
+    """Bytes still allocated for the extracted records"""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = extract(jobs, *args)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return current - baseline
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Bytes per extracted record benchmark")
+    arg_parser.add_argument("jobs", type=int, nargs="?", default=200)
+    arg_parser.add_argument("expressions_per_job", type=int, nargs="?", default=500)
+    args = arg_parser.parse_args()
+    job_count, expressions = args.jobs, args.expressions_per_job
+
+    jobs = [build_job_xml(job, expressions) for job in range(job_count)]
+    records = job_count * (expressions + SQL_PER_JOB)
+
+    before = measure(jobs, LegacyExtractedSQL, LegacyTMapExpression)
+    after = measure(jobs, ExtractedSQL, TMapExpression)
+    dropped = measure(jobs, ExtractedSQL, TMapExpression, False)
+
+    print(
+        f"Jobs: {job_count}, records: {records:,} "
+        f"({expressions} tMap + {SQL_PER_JOB} SQL per job)"
+    )
+    print(f"  Plain dataclasses:        {before / records:8.1f} bytes/record")
+    print(f"  Slotted + interned:       {after / records:8.1f} bytes/record")
+    print(f"  ... and raw_sql dropped:  {dropped / records:8.1f} bytes/record")
+    print(f"  Reduction:                {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: parse_folder throughput, peak memory and write_outputs time
+
+Generates deterministic synthetic exports (benchmarks/synthetic_corpus.py)
+at each size and measures every size in a fresh interpreter, so peak RSS
+belongs to that run alone:
+
+    jobs_per_s / mb_per_s   parse_folder throughput over the .item bytes
+    parse_s                 parse_folder wall time (incl. post-processing)
+    write_outputs_s         write_outputs wall time
+    peak_rss_mb             process peak resident set size
+
+Results are compared against a JSON baseline committed under
+benchmarks/baselines/, so a regression shows up as a diff between commits.
+Token statistics are off by default (they measure tiktoken, not the parser);
+--token-stats turns them on.
+
+Usage: python benchmarks/bench_parse_folder.py [--sizes 10 1000 10000]
+    [--workers N] [--token-stats] [--save] [--check] [--tolerance 0.15]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from synthetic_corpus import CorpusSpec, write_corpus  # noqa: E402
+
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "parse_folder.json"
+DEFAULT_SIZES = [10, 1000, 10000]
+BASE_SPEC = CorpusSpec(components=14, tmap_columns=20, sql_length=300, fanout=3)
+
+# Metric -> True when higher is better
+METRICS = {
+    "jobs_per_s": True,
+    "mb_per_s": True,
+    "parse_s": False,
+    "write_outputs_s": False,
+    "peak_rss_mb": False,
+}
+
+# Runs shorter than this are reported but never flagged (timer noise)
+MIN_FLAGGED_SECONDS = 0.5
+
+
+def corpus_for(spec: CorpusSpec, root: Path) -> Path:
+    """Generate the corpus for spec once, reusing it across runs"""
+    digest = hashlib.sha1(json.dumps(spec.describe(), sort_keys=True).encode()).hexdigest()
+    folder = root / f"corpus-{spec.jobs}-{digest[:10]}"
+    marker = folder / ".complete"
+    if not marker.exists():
+        write_corpus(spec, folder)
+        marker.touch()
+    return folder
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_one(corpus: Path, workers: int, token_stats: bool) -> Dict[str, Any]:
+    """Measure one corpus in this process"""
+    logging.disable(logging.INFO)
+    from talend_parser.talend_parser import TalendParserLLMOptimized
+
+    items = list(corpus.rglob("*.item"))
+    input_mb = sum(item.stat().st_size for item in items) / (1024 * 1024)
+
+    parser = TalendParserLLMOptimized(token_stats=token_stats)
+    start = time.perf_counter()
+    parser.parse_folder(str(corpus), workers=workers, build_output=False)
+    parse_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        parser.write_outputs(output_dir)
+        write_s = time.perf_counter() - start
+
+    return {
+        "jobs": len(items),
+        "input_mb": round(input_mb, 2),
+        "parse_s": round(parse_s, 3),
+        "jobs_per_s": round(len(items) / parse_s, 1),
+        "mb_per_s": round(input_mb / parse_s, 2),
+        "write_outputs_s": round(write_s, 3),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure(corpus: Path, workers: int, token_stats: bool) -> Dict[str, Any]:
+    """Run run_one in a fresh interpreter and return its result"""
+    command = [sys.executable, __file__, "--run-one", str(corpus), "--workers", str(workers)]
+    if token_stats:
+        command.append("--token-stats")
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Print a per-metric comparison and return the regressions found"""
+    regressions = []
+    for size, result in results.items():
+        previous = baseline.get("results", {}).get(size)
+        if previous is None:
+            print(f"  {size:>6} jobs: no baseline")
+            continue
+        flaggable = previous.get("parse_s", 0) >= MIN_FLAGGED_SECONDS
+        for metric, higher_is_better in METRICS.items():
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = " REGRESSION" if flaggable and worse > tolerance else ""
+            print(f"  {size:>6} jobs {metric:<16} {old:>10} -> {new:>10} ({change:+.1%}){flag}")
+            if flag:
+                regressions.append(f"{size} jobs {metric} {change:+.1%}")
+    return regressions
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="parse_folder benchmark suite")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    arg_parser.add_argument("--workers", type=int, default=1)
+    arg_parser.add_argument("--token-stats", action="store_true")
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    arg_parser.add_argument("--save", action="store_true", help="Overwrite the baseline")
+    arg_parser.add_argument(
+        "--check", action="store_true", help="Exit 1 when a metric regresses"
+    )
+    arg_parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="Allowed relative slowdown"
+    )
+    arg_parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "talend2dbt-bench",
+        help="Where generated corpora are kept between runs",
+    )
+    arg_parser.add_argument("--run-one", type=Path, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.workers, args.token_stats)))
+        return
+
+    results = {}
+    for size in args.sizes:
+        corpus = corpus_for(replace(BASE_SPEC, jobs=size), args.corpus_dir)
+        result = measure(corpus, args.workers, args.token_stats)
+        results[str(size)] = result
+        print(
+            f"{size:>6} jobs ({result['input_mb']:.1f} MB): "
+            f"{result['jobs_per_s']:>8.1f} jobs/s {result['mb_per_s']:>7.2f} MB/s  "
+            f"parse {result['parse_s']:.2f}s  write_outputs {result['write_outputs_s']:.2f}s  "
+            f"peak {result['peak_rss_mb']} MB"
+        )
+
+    run = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "settings": {
+            "workers": args.workers,
+            "token_stats": args.token_stats,
+            "spec": {k: v for k, v in BASE_SPEC.describe().items() if k != "jobs"},
+        },
+        "results": results,
+    }
+
+    regressions: List[str] = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("settings") != run["settings"]:
+            print("Baseline was recorded with different settings; comparison is indicative")
+        else:
+            # Saving a subset of sizes keeps the other sizes' baselines
+            run["results"] = {**baseline.get("results", {}), **results}
+        print(f"\nAgainst {args.baseline}:")
+        regressions = compare(results, baseline, args.tolerance)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(run, indent=2) + "\n")
+        print(f"\nSaved baseline: {args.baseline}")
+
+    if args.check and regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI startup time per subcommand
+
+Runs every talend-parser / dbt-generator subcommand the slash commands
+invoke in a fresh interpreter, several times, against a tiny synthetic
+export and dbt project, and reports the median and best wall time. Also
+lists which heavy optional modules (yaml, tiktoken, multiprocessing) each
+command ended up importing, so a regression to eager imports is visible.
+
+Usage: python benchmarks/bench_startup.py [repeats]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from synthetic_corpus import CorpusSpec, write_corpus  # noqa: E402
+
+HEAVY_MODULES = ["yaml", "tiktoken", "multiprocessing", "sqlite3"]
+
+# Runs a CLI entry point, then reports which heavy modules it imported
+RUNNER = """
+import sys
+from importlib import import_module
+module, argv = sys.argv[1], sys.argv[2:]
+sys.argv = [module] + argv
+try:
+    import_module(module).main()
+except SystemExit:
+    pass
+loaded = [name for name in {heavy!r} if name in sys.modules]
+sys.stderr.write("LOADED " + ",".join(loaded) + "\\n")
+"""
+
+
+def build_fixtures(root: Path) -> Dict[str, Path]:
+    """Tiny export, its extraction (with a SQLite store) and a dbt project"""
+    corpus = root / "talend"
+    write_corpus(CorpusSpec(jobs=3), corpus)
+    extraction = root / "talend_processed"
+    store = root / "store.db"
+    run_cli(
+        "talend_parser.talend_parser",
+        [str(corpus), str(extraction), "--no-token-stats", "--sqlite", str(store)],
+    )
+
+    project = root / "dbt_project"
+    (project / "models" / "staging").mkdir(parents=True)
+    (project / "dbt_project.yml").write_text("name: bench\nversion: '1.0.0'\n")
+    (project / "models" / "staging" / "_sources.yml").write_text(
+        "version: 2\nsources:\n  - name: raw\n    tables:\n      - name: orders\n"
+    )
+    (project / "models" / "staging" / "stg_raw__orders.sql").write_text(
+        "select * from {{ source('raw', 'orders') }}\n"
+    )
+    return {"corpus": corpus, "extraction": extraction, "store": store, "project": project}
+
+
+def run_cli(module: str, argv: List[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(REPO_ROOT), str(BENCH_DIR)]))
+    return subprocess.run(
+        [sys.executable, "-c", RUNNER.format(heavy=HEAVY_MODULES), module, *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="CLI startup time per subcommand")
+    arg_parser.add_argument("repeats", type=int, nargs="?", default=5)
+    repeats = arg_parser.parse_args().repeats
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures = build_fixtures(Path(tmp))
+        parser = "talend_parser.talend_parser"
+        generator = "dbt_generator.generator"
+        project = str(fixtures["project"])
+        commands = {
+            "talend-parser --help": (parser, ["--help"]),
+            "talend-parser query --job": (
+                parser,
+                ["query", str(fixtures["store"]), "--job", "Load_sales_00000_0.1"],
+            ),
+            "talend-parser (3 jobs, --no-token-stats)": (
+                parser,
+                [str(fixtures["corpus"]), str(Path(tmp) / "out"), "--no-token-stats"],
+            ),
+            "dbt-generator validate --mode inputs": (
+                generator,
+                ["validate", "--mode", "inputs", "--input", str(fixtures["extraction"])],
+            ),
+            "dbt-generator validate --mode project": (
+                generator,
+                ["validate", "--mode", "project", "--output", project],
+            ),
+            "dbt-generator count-sources": (generator, ["count-sources", "--project", project]),
+            "dbt-generator file-count": (generator, ["file-count", "--project", project]),
+            "dbt-generator metrics": (
+                generator,
+                ["metrics", "--project", project, "--talend-jobs", "3"],
+            ),
+        }
+
+        print(f"{'command':<44} {'median':>9} {'best':>9}  heavy imports")
+        for label, (module, argv) in commands.items():
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                completed = run_cli(module, argv)
+                timings.append(time.perf_counter() - start)
+            loaded = [
+                line[len("LOADED ") :]
+                for line in completed.stderr.splitlines()
+                if line.startswith("LOADED ")
+            ]
+            print(
+                f"{label:<44} {statistics.median(timings) * 1000:7.1f}ms "
+                f"{min(timings) * 1000:7.1f}ms  {loaded[-1] if loaded else '?'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic Talend export for benchmarks
+
+Writes ``process/<domain>/<Job>_0.1.item`` files shaped like real exports,
+each next to a .properties file holding the job's repository id: a context
+group, a DB connection, subjobs of tDBInput -> tMap -> tFilterRow ->
+tDBOutput chained with FLOW connections and SUBJOB_OK triggers, tDBRow /
+tLogRow / tDie side components, and tRunJob calls laid out as a call tree
+(job i calls jobs i*fanout+1 .. i*fanout+fanout). The same spec and seed
+always produce byte-identical files.
+
+Usage: python benchmarks/synthetic_corpus.py DEST [--jobs N] [--components N]
+    [--tmap-columns N] [--sql-length CHARS] [--fanout N] [--file-size BYTES]
+    [--seed N]
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import quoteattr
+
+DOMAINS = ["sales", "finance", "customer", "product", "inventory", "hr"]
+VERBS = ["Load", "Extract", "Merge", "Refresh", "Build", "Sync"]
+CONTEXT_VARS = ["schema_src", "schema_tgt", "run_date", "batch_id", "max_rows", "env"]
+DATA_ACTIONS = ["INSERT", "UPDATE", "INSERT_OR_UPDATE", "UPSERT"]
+TALEND_TYPES = ["id_String", "id_Integer", "id_Long", "id_BigDecimal", "id_Date"]
+
+# tMap output expression shapes; real exports repeat these verbatim
+EXPRESSIONS = [
+    "row{n}.{col}",
+    "StringHandling.TRIM(row{n}.{col})",
+    'row{n}.{col} == null ? "" : row{n}.{col}.toUpperCase()',
+    'TalendDate.formatDate("yyyy-MM-dd", row{n}.{col})',
+    "Relational.ISNULL(row{n}.{col}) ? 0 : row{n}.{col}",
+]
+
+# Components of one subjob, chained by FLOW connections
+SUBJOB_TEMPLATE = ["tDBInput", "tMap", "tFilterRow", "tDBOutput"]
+SIDE_COMPONENTS = ["tDBRow", "tLogRow", "tAggregateRow", "tDie", "tWarn"]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic export"""
+
+    jobs: int = 100
+    components: int = 12
+    tmap_columns: int = 20
+    sql_length: int = 300
+    fanout: int = 3
+    file_size: int = 0
+    seed: int = 0
+
+    def describe(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def job_name(spec: CorpusSpec, index: int) -> str:
+    """Logical job name (without the _0.1 version suffix)"""
+    domain = DOMAINS[index % len(DOMAINS)]
+    verb = VERBS[(index // len(DOMAINS)) % len(VERBS)]
+    return f"{verb}_{domain}_{index:05d}"
+
+
+def job_id(index: int) -> str:
+    """Repository id of job ``index`` (its .properties id, tRunJob's PROCESS_TYPE_PROCESS)"""
+    return f"_synthetic{index:05d}"
+
+
+def job_properties(spec: CorpusSpec, index: int) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<xmi:XMI xmi:version="2.0" xmlns:xmi="http://www.omg.org/XMI" '
+        'xmlns:TalendProperties="http://www.talend.org/properties">\n'
+        f'  <TalendProperties:Property id="{job_id(index)}" '
+        f'label="{job_name(spec, index)}" version="0.1"/>\n'
+        "</xmi:XMI>\n"
+    )
+
+
+def child_indexes(spec: CorpusSpec, index: int) -> List[int]:
+    """Jobs called by job ``index`` through tRunJob"""
+    first = index * spec.fanout + 1
+    return [child for child in range(first, first + spec.fanout) if child < spec.jobs]
+
+
+def _node(comp_type: str, name: str, params: List[Tuple[str, str]], body: str = "") -> str:
+    lines = [
+        f'  <node componentName="{comp_type}" componentVersion="0.102" '
+        f'offsetLabelX="0" offsetLabelY="0" posX="0" posY="0">',
+        f'    <elementParameter field="TEXT" name="UNIQUE_NAME" value="{name}"/>',
+    ]
+    for param, value in params:
+        lines.append(
+            f'    <elementParameter field="TEXT" name="{param}" value={quoteattr(value)}/>'
+        )
+    if body:
+        lines.append(body)
+    lines.append("  </node>")
+    return "\n".join(lines) + "\n"
+
+
+def _select(spec: CorpusSpec, rng: random.Random, table: str) -> str:
+    """A SELECT of roughly spec.sql_length characters, as Talend quotes it"""
+    columns: List[str] = []
+    while sum(len(column) + 2 for column in columns) < max(spec.sql_length - 80, 10):
+        columns.append(f"col_{len(columns)}")
+    return (
+        f'"SELECT {", ".join(columns)} FROM "+context.schema_src+".{table} '
+        f"WHERE batch_id = \"+context.batch_id+\" AND amount > {rng.randint(0, 9)}\""
+    )
+
+
+def _tmap_body(spec: CorpusSpec, rng: random.Random, flow: int) -> str:
+    columns_in = []
+    columns_out = []
+    for c in range(spec.tmap_columns):
+        col = f"col_{c}"
+        col_type = TALEND_TYPES[c % len(TALEND_TYPES)]
+        expression = EXPRESSIONS[rng.randrange(len(EXPRESSIONS))].format(n=flow, col=col)
+        columns_in.append(
+            f'      <column name="{col}" type="{col_type}" nullable="true" '
+            f'originalDbColumnName="{col}"/>'
+        )
+        columns_out.append(
+            f'      <column name="{col}" type="{col_type}" nullable="true" '
+            f"originalDbColumnName={quoteattr(col)} expression={quoteattr(expression)}/>"
+        )
+    return "\n".join(
+        [
+            f'    <metadata connector="FLOW" name="row{flow}">',
+            *columns_in,
+            "    </metadata>",
+            f'    <metadata connector="OUTPUT" name="out{flow}">',
+            *columns_out,
+            "    </metadata>",
+            "    <nodeData>",
+            f'      <inputTables name="row{flow}" matchingMode="UNIQUE_MATCH" '
+            f'lookupMode="LOAD_ONCE" expressionFilter="row{flow}.col_0 != null"/>',
+            f'      <outputTables name="out{flow}" expressionFilter="row{flow}.col_1 != null"/>',
+            f'      <outputTables name="reject{flow}" reject="true"/>',
+            '      <varTables name="Var">',
+            f'        <mapperTableEntries name="v{flow}" '
+            f'expression="row{flow}.col_0 + row{flow}.col_1" type="id_Integer"/>',
+            "      </varTables>",
+            "    </nodeData>",
+        ]
+    )
+
+
+def build_job(spec: CorpusSpec, index: int) -> str:
+    """Full .item XML of one job"""
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    table_pool = max(spec.jobs // 2, 4)
+
+    def table() -> str:
+        return f"tbl_{DOMAINS[index % len(DOMAINS)]}_{rng.randrange(table_pool)}"
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<talendfile:ProcessType xmlns:talendfile="platform:/resource/'
+        'org.talend.model/model/TalendFile.xsd" defaultContext="Default">\n',
+        '  <context confirmationNeeded="false" name="Default">\n',
+    ]
+    for var in CONTEXT_VARS:
+        parts.append(
+            f'    <contextParameter name="{var}" prompt="{var}?" type="id_String" '
+            f'value="{var}_{index % 3}"/>\n'
+        )
+    parts.append("  </context>\n")
+    parts.append(
+        "  <parameters>\n"
+        '    <elementParameter field="TEXT" name="JOB_RUN_VM_ARGUMENTS" value=" -Xmx1024M"/>\n'
+        '    <elementParameter field="CHECK" name="MULTI_THREAD_EXECUTION" value="false"/>\n'
+        "  </parameters>\n"
+    )
+
+    connections: List[Tuple[str, str, str]] = []
+    parts.append(
+        _node(
+            "tDBConnection",
+            "tDBConnection_1",
+            [("AUTO_COMMIT", "false"), ("USE_BATCH", "true"), ("BATCH_SIZE", "1000")],
+        )
+    )
+    previous_start = "tDBConnection_1"
+    counts: Dict[str, int] = {}
+
+    def name_for(comp_type: str) -> str:
+        counts[comp_type] = counts.get(comp_type, 0) + 1
+        return f"{comp_type}_{counts[comp_type]}"
+
+    # Subjobs until the component budget is spent, then side components
+    remaining = max(spec.components - 2, len(SUBJOB_TEMPLATE))
+    flow = 0
+    while remaining >= len(SUBJOB_TEMPLATE):
+        flow += 1
+        chain = []
+        for comp_type in SUBJOB_TEMPLATE:
+            name = name_for(comp_type)
+            chain.append(name)
+            if comp_type == "tDBInput":
+                parts.append(_node(comp_type, name, [("QUERY", _select(spec, rng, table()))]))
+            elif comp_type == "tMap":
+                parts.append(_node(comp_type, name, [], _tmap_body(spec, rng, flow)))
+            elif comp_type == "tFilterRow":
+                parts.append(_node(comp_type, name, [("CONDITIONS", "col_0 > 0")]))
+            else:
+                parts.append(
+                    _node(
+                        comp_type,
+                        name,
+                        [("TABLE", f'"{table()}"'), ("DATA_ACTION", rng.choice(DATA_ACTIONS))],
+                    )
+                )
+        connections.extend((a, b, "FLOW") for a, b in zip(chain, chain[1:]))
+        connections.append((previous_start, chain[0], "SUBJOB_OK"))
+        previous_start = chain[0]
+        remaining -= len(SUBJOB_TEMPLATE)
+
+    for i in range(remaining):
+        comp_type = SIDE_COMPONENTS[i % len(SIDE_COMPONENTS)]
+        name = name_for(comp_type)
+        if comp_type == "tDBRow":
+            delete = f"\"DELETE FROM {table()} WHERE run_date = '\"+context.run_date+\"'\""
+            params = [("QUERY", delete)]
+        elif comp_type in ("tDie", "tWarn"):
+            params = [("MESSAGE", f'"{comp_type} in {job_name(spec, index)}"'), ("CODE", "4")]
+        else:
+            params = []
+        parts.append(_node(comp_type, name, params))
+        connections.append((previous_start, name, "SUBJOB_OK"))
+
+    for child in child_indexes(spec, index):
+        name = name_for("tRunJob")
+        parts.append(
+            _node(
+                "tRunJob",
+                name,
+                [
+                    ("PROCESS", job_name(spec, child)),
+                    ("PROCESS:PROCESS_TYPE_PROCESS", job_id(child)),
+                    ("PROCESS:PROCESS_TYPE_VERSION", "0.1"),
+                ],
+            )
+        )
+        connections.append((previous_start, name, "SUBJOB_OK"))
+
+    parts.append(
+        _node("tDBCommit", "tDBCommit_1", [("CONNECTION", "tDBConnection_1"), ("CLOSE", "true")])
+    )
+    for source, target, connector in connections:
+        parts.append(
+            f'  <connection connectorName="{connector}" label="{source}_{target}" '
+            f'lineStyle="0" metaname="{source}" offsetLabelX="0" offsetLabelY="0" '
+            f'source="{source}" target="{target}"/>\n'
+        )
+
+    # Pad to the requested size the way designer screenshots inflate real items
+    size = sum(len(part) for part in parts)
+    if spec.file_size > size:
+        padding = spec.file_size - size - 60
+        parts.append(f'  <screenshots key="process" value="{"A" * max(padding, 0)}"/>\n')
+
+    parts.append("</talendfile:ProcessType>\n")
+    return "".join(parts)
+
+
+def write_corpus(spec: CorpusSpec, dest: Path) -> List[Path]:
+    """Write the corpus under dest/process, returning the .item paths"""
+    paths = []
+    for index in range(spec.jobs):
+        folder = Path(dest) / "process" / DOMAINS[index % len(DOMAINS)]
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{job_name(spec, index)}_0.1.item"
+        path.write_text(build_job(spec, index), encoding="utf-8")
+        path.with_suffix(".properties").write_text(job_properties(spec, index), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("dest", help="Output folder")
+    defaults = CorpusSpec()
+    arg_parser.add_argument("--jobs", type=int, default=defaults.jobs)
+    arg_parser.add_argument("--components", type=int, default=defaults.components)
+    arg_parser.add_argument("--tmap-columns", type=int, default=defaults.tmap_columns)
+    arg_parser.add_argument("--sql-length", type=int, default=defaults.sql_length)
+    arg_parser.add_argument("--fanout", type=int, default=defaults.fanout)
+    arg_parser.add_argument(
+        "--file-size", type=int, default=defaults.file_size, help="Pad items to BYTES"
+    )
+    arg_parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = arg_parser.parse_args()
+
+    spec = CorpusSpec(
+        jobs=args.jobs,
+        components=args.components,
+        tmap_columns=args.tmap_columns,
+        sql_length=args.sql_length,
+        fanout=args.fanout,
+        file_size=args.file_size,
+        seed=args.seed,
+    )
+    paths = write_corpus(spec, Path(args.dest))
+    size = sum(path.stat().st_size for path in paths)
+    print(f"Wrote {len(paths)} jobs ({size / (1024 * 1024):.1f} MB) to {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
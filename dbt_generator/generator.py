@@ -19,22 +19,83 @@ Philosophy: Python for infrastructure, LLM for intelligence.
 
 import json
 import logging
+import os
 import shutil
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _yaml() -> Any:
+    """PyYAML, imported on first use so commands that never touch YAML start fast"""
+    import yaml
+
+    return yaml
+
+
+class Tracer:
+    """Timing spans written as a Chrome trace-event file (--trace)
+
+    A single-process counterpart of the parser's tracer, so this script runs
+    without the talend_parser package; both traces load in chrome://tracing,
+    Perfetto or speedscope.
+    """
+
+    def __init__(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self.events: list[dict[str, Any]] = []
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[None]:
+        """Context manager timing the enclosed block"""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def write(self, path: str | Path, process_name: str = "main") -> None:
+        """Write the recorded spans as a Chrome trace-event JSON file"""
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": process_name},
+        }
+        with open(path, "w") as f:
+            json.dump({"traceEvents": [metadata, *self.events], "displayTimeUnit": "ms"}, f)
+
+
 class DBTGenerator:
     """Minimal Python helper for DBT migration file operations"""
 
-    def __init__(self, input_dir: Path, output_dir: Path, mode: str = "new"):
+    def __init__(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        mode: str = "new",
+        tracer: Tracer | None = None,
+    ):
         """
         Initialize DBT Generator
 
@@ -42,10 +103,12 @@ class DBTGenerator:
             input_dir: Path to pre-processed Talend output
             output_dir: Path for DBT project output
             mode: 'new' for new project, 'merge' for existing project
+            tracer: Tracer recording spans for --trace (optional)
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.mode = mode
+        self.tracer = tracer
 
         logger.info(
             f"DBTGenerator initialized: mode={mode}, input={input_dir}, output={output_dir}"
@@ -82,12 +145,66 @@ class DBTGenerator:
         logger.info("All Talend data loaded successfully")
         return data
 
+    def load_manifest(self) -> dict[str, Any]:
+        """Load manifest.json written by `talend-parser --sharded`"""
+        return self._load_json("manifest.json")
+
+    def load_job_shards(self, job_names: list[str] | None = None) -> dict[str, Any]:
+        """
+        Load per-job shards instead of the full talend_extraction.json
+
+        Args:
+            job_names: Jobs to load; all jobs in the manifest when omitted.
+                Child jobs referenced by tRunJob are not pulled in implicitly.
+
+        Returns:
+            Dict mapping job name to its shard contents
+        """
+        manifest = self.load_manifest()
+        shards = {entry["job"]: entry for entry in manifest["shards"]}
+
+        if job_names is None:
+            job_names = list(shards)
+        missing = [job for job in job_names if job not in shards]
+        if missing:
+            raise KeyError(f"Jobs not in manifest: {', '.join(missing)}")
+
+        logger.info(f"Loading {len(job_names)} of {len(shards)} job shards...")
+        return {job: self._load_json(shards[job]["file"]) for job in job_names}
+
+    def load_bundle_index(self) -> dict[str, Any]:
+        """Load bundles/index.json written by `talend-parser --bundle-tokens`"""
+        return self._load_json("bundles/index.json")
+
+    def load_bundle(self, number: int) -> dict[str, Any]:
+        """
+        Load one token-budget bundle (the job shards for one LLM session)
+
+        Args:
+            number: Bundle number from bundles/index.json (1-based)
+
+        Returns:
+            Bundle dict with its job list and per-job shards
+        """
+        index = self.load_bundle_index()
+        for entry in index["bundles"]:
+            if entry["bundle"] == number:
+                logger.info(f"Loading bundle {number}: {len(entry['jobs'])} jobs")
+                return self._load_json(entry["file"])
+        raise KeyError(f"Bundle {number} not in index (1-{index['total_bundles']})")
+
+    def _span(self, name: str, **args: Any) -> AbstractContextManager:
+        """Timing span for --trace (no-op when tracing is off)"""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, "generator", **args)
+
     def _load_json(self, filename: str) -> dict[str, Any]:
         """Load JSON file from input directory"""
         path = self.input_dir / filename
         logger.debug(f"Loading JSON: {path}")
 
-        with open(path) as f:
+        with self._span("load_json", file=filename), open(path) as f:
             return json.load(f)
 
     def _load_yaml(self, filename: str) -> dict[str, Any]:
@@ -95,15 +212,16 @@ class DBTGenerator:
         path = self.input_dir / filename
         logger.debug(f"Loading YAML: {path}")
 
-        with open(path) as f:
-            return yaml.safe_load(f)
+        with self._span("load_yaml", file=filename), open(path) as f:
+            return _yaml().safe_load(f)
 
     def _load_text(self, filename: str) -> str:
         """Load text file from input directory"""
         path = self.input_dir / filename
         logger.debug(f"Loading text: {path}")
 
-        return path.read_text()
+        with self._span("load_text", file=filename):
+            return path.read_text()
 
     # =========================================================================
     # PROJECT STRUCTURE (File system operations only)
@@ -278,7 +396,7 @@ class DBTGenerator:
 
         # Load project metadata (just parse, no interpretation)
         with open(dbt_project_yml) as f:
-            project_config = yaml.safe_load(f)
+            project_config = _yaml().safe_load(f)
 
         project_name = project_config.get("name", "unknown")
 
@@ -353,7 +471,7 @@ class DBTGenerator:
             return None
 
         with open(sources_file) as f:
-            sources = yaml.safe_load(f)
+            sources = _yaml().safe_load(f)
             return sources if sources else None
 
     def save_sources_yml(self, sources_data: dict) -> str:
@@ -370,7 +488,7 @@ class DBTGenerator:
         sources_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(sources_file, "w") as f:
-            yaml.dump(sources_data, f, sort_keys=False, indent=2)
+            _yaml().dump(sources_data, f, sort_keys=False, indent=2)
 
         logger.info(f"Saved _sources.yml to: {sources_file}")
         return str(sources_file)
@@ -497,7 +615,7 @@ class DBTGenerator:
             return 0
 
         with open(sources_file) as f:
-            sources_data = yaml.safe_load(f)
+            sources_data = _yaml().safe_load(f)
 
         total_sources = 0
         for source_group in sources_data.get("sources", []):
@@ -814,6 +932,12 @@ def main():
         description="DBT Generator - Python helpers for Talend-to-DBT migration"
     )
 
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write timing spans for the command as a Chrome trace (JSON)",
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
     # Load command
@@ -821,6 +945,22 @@ def main():
     load_parser.add_argument("--input", required=True, help="Input directory with Talend data")
     load_parser.add_argument("--output", required=True, help="Output JSON file path")
 
+    # Load-jobs command
+    load_jobs_parser = subparsers.add_parser(
+        "load-jobs", help="Load selected per-job shards (talend-parser --sharded)"
+    )
+    load_jobs_parser.add_argument("--input", required=True, help="Input directory with Talend data")
+    load_jobs_parser.add_argument("--jobs", nargs="+", help="Job names (default: all)")
+    load_jobs_parser.add_argument("--output", required=True, help="Output JSON file path")
+
+    # Load bundle command
+    load_bundle_parser = subparsers.add_parser(
+        "load-bundle", help="Load one token-budget bundle (talend-parser --bundle-tokens)"
+    )
+    load_bundle_parser.add_argument("--input", required=True, help="Input directory with Talend data")
+    load_bundle_parser.add_argument("--bundle", type=int, required=True, help="Bundle number")
+    load_bundle_parser.add_argument("--output", required=True, help="Output JSON file path")
+
     # Setup command
     setup_parser = subparsers.add_parser("setup", help="Setup project structure")
     setup_parser.add_argument("--input", required=True, help="Input directory")
@@ -888,9 +1028,20 @@ def main():
         parser.print_help()
         return
 
-    # Execute command
+    if not args.trace:
+        run_command(args)
+        return
+
+    tracer = Tracer()
+    with tracer.span(args.command, "command"):
+        run_command(args, tracer)
+    tracer.write(args.trace, process_name="dbt-generator")
+
+
+def run_command(args: Any, tracer: Tracer | None = None) -> None:
+    """Execute a parsed dbt-generator subcommand"""
     if args.command == "load":
-        gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"))
+        gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"), tracer=tracer)
         data = gen.load_talend_data()
 
         with open(args.output, "w") as f:
@@ -898,28 +1049,51 @@ def main():
 
         print(json.dumps({"status": "success", "output": args.output}))
 
+    elif args.command == "load-jobs":
+        gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"), tracer=tracer)
+        shards = gen.load_job_shards(args.jobs)
+
+        with open(args.output, "w") as f:
+            json.dump(shards, f, indent=2)
+
+        print(json.dumps({"status": "success", "output": args.output, "jobs": len(shards)}))
+
+    elif args.command == "load-bundle":
+        gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"), tracer=tracer)
+        bundle = gen.load_bundle(args.bundle)
+
+        with open(args.output, "w") as f:
+            json.dump(bundle, f, indent=2)
+
+        print(json.dumps({"status": "success", "output": args.output, "jobs": bundle["jobs"]}))
+
     elif args.command == "setup":
-        gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path(args.output), mode=args.mode)
+        gen = DBTGenerator(
+            input_dir=Path(args.input),
+            output_dir=Path(args.output),
+            mode=args.mode,
+            tracer=tracer,
+        )
         result = gen.setup_project_structure(domains=args.domains)
         print(json.dumps(result, indent=2))
 
     elif args.command == "validate":
         if args.mode == "inputs":
-            gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"))
+            gen = DBTGenerator(input_dir=Path(args.input), output_dir=Path("/tmp"), tracer=tracer)
             result = gen.validate_inputs()
         else:
-            gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.output))
+            gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.output), tracer=tracer)
             result = gen.validate_existing_project()
 
         print(json.dumps(result, indent=2))
 
     elif args.command == "backup-sources":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.output))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.output), tracer=tracer)
         backup_path = gen.backup_sources_yml()
         print(json.dumps({"backup_path": backup_path}))
 
     elif args.command == "metrics":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project), tracer=tracer)
 
         # Count models and placeholders
         counts = gen.count_models_and_placeholders()
@@ -945,22 +1119,22 @@ def main():
         print(json.dumps(result, indent=2))
 
     elif args.command == "count-sources":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project), tracer=tracer)
         count = gen.count_sources_in_yml()
         print(count)
 
     elif args.command == "fix-test-syntax":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project), tracer=tracer)
         result = gen.fix_deprecated_test_syntax()
         print(json.dumps(result, indent=2))
 
     elif args.command == "file-count":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project), tracer=tracer)
         counts = gen.count_project_files()
         print(json.dumps(counts, indent=2))
 
     elif args.command == "quality-report":
-        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project))
+        gen = DBTGenerator(input_dir=Path("/tmp"), output_dir=Path(args.project), tracer=tracer)
 
         # Parse JSON arguments
         tool_versions = json.loads(args.tool_versions)
@@ -5,18 +5,49 @@ Mission: Extract Talend .item files into clean, context-friendly format for LLM
 Focus: Mmize tokens, maximize context, enable accurate DBT/BigQuery migrationini
 """
 
+import io
 import json
 import logging
+import os
+import pickle
 import re
+import sqlite3
+import sys
+import threading
+import time
 import xml.etree.ElementTree as ET
-from pathlib import Path
-from typing import Dict, List, Any, DefaultDict, Set
-from dataclasses import dataclass
-from collections import defaultdict
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import (
+    IO,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from dataclasses import asdict, dataclass, field, replace
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import functools
 import hashlib
+from itertools import chain
 from datetime import datetime
-import yaml
-import tiktoken
+
+# yaml, tiktoken and multiprocessing are imported where first needed, so
+# `talend-parser query`, --help and runs without token statistics start fast
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +59,52 @@ logger = logging.getLogger(__name__)
 # CONFIGURATION
 # ============================================================
 
+# Bump whenever extraction output or the cache entry layout changes, so cached
+# job results are invalidated
+PARSER_VERSION = "3.7.0"
+
+# tMap expressions shorter than this are always written inline
+INTERN_MIN_EXPRESSION_LENGTH = 16
+
+# Threads used for token counting (tiktoken releases the GIL while encoding)
+TOKEN_STATS_THREADS = min(8, os.cpu_count() or 1)
+
+# Approximate token counting (--estimate-tokens): each file is cut into
+# chunks of this many characters; one chunk per file plus every Nth chunk
+# (chosen by hash) is encoded exactly, the rest is extrapolated from the
+# bytes -> tokens ratio calibrated per file type
+TOKEN_ESTIMATE_CHUNK_CHARS = 4096
+TOKEN_ESTIMATE_SAMPLE_EVERY = 16
+TOKEN_FILE_TYPES = {
+    ".item": "xml",
+    ".xml": "xml",
+    ".properties": "text",
+    ".json": "json",
+    ".sql": "sql",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+}
+
+# Process-level <connection> types that sequence subjobs/components rather
+# than carry rows; every other connector (FLOW, MAIN, LOOKUP, REJECT, FILTER,
+# ...) is a data flow inside a subjob
+TRIGGER_CONNECTORS = {
+    "SUBJOB_OK",
+    "SUBJOB_ERROR",
+    "COMPONENT_OK",
+    "COMPONENT_ERROR",
+    "ON_SUBJOB_OK",
+    "ON_SUBJOB_ERROR",
+    "ON_COMPONENT_OK",
+    "ON_COMPONENT_ERROR",
+    "RUN_IF",
+    "RUN_BEFORE",
+    "RUN_AFTER",
+    "ITERATE",
+    "SYNCHRONIZE",
+    "PARALLELIZE",
+}
+
 # Components to EXCLUDE (pre/post processing, minimal connection management)
 # Note: Error components (tDie, tWarn, tLogRow) are now extracted for patterns
 EXCLUDED_COMPONENTS = {
@@ -57,9 +134,15 @@ EXCLUDED_COMPONENTS = {
 # ============================================================
 # DATA CLASSES
 # ============================================================
+# Records are slotted (no per-instance __dict__) and intern the names they
+# share with thousands of siblings (jobs, components, tables, columns, types)
+
+
+def _intern_all(values: List[str]) -> List[str]:
+    return [sys.intern(value) for value in values]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSQL:
     """Clean SQL extraction for LLM consumption"""
 
@@ -71,19 +154,60 @@ class ExtractedSQL:
     cleaned_sql: str
     tables: List[str]
     context_variables: List[str]
+    # Set by _deduplicate_sql: canonical fingerprint, the representative's
+    # fingerprint for non-representative cluster members, cluster size, and
+    # for fingerprint duplicates the literals that differ from the
+    # representative (None when they cannot be paired up)
+    fingerprint: str = ""
+    cluster: str = ""
+    cluster_size: int = 1
+    literals: Optional[List[List[str]]] = None
+
+    def __post_init__(self) -> None:
+        self.intern_names()
+
+    def intern_names(self) -> None:
+        """Share name strings with every other record (e.g. after unpickling)"""
+        self.job_name = sys.intern(self.job_name)
+        self.component_name = sys.intern(self.component_name)
+        self.component_type = sys.intern(self.component_type)
+        self.sql_operation = sys.intern(self.sql_operation)
+        self.tables = _intern_all(self.tables)
+        self.context_variables = _intern_all(self.context_variables)
+
+    @property
+    def is_fingerprint_duplicate(self) -> bool:
+        """Same canonical form as its cluster representative"""
+        return bool(self.cluster) and self.cluster == self.fingerprint
 
     def to_llm_format(self) -> Dict:
         """Format for minimal token consumption"""
-        return {
+        result = {
             "component": f"{self.component_name} ({self.component_type})",
             "operation": self.sql_operation,
             "tables": self.tables,
             "context_vars": self.context_variables,
-            "sql": self.cleaned_sql,
         }
-
-
-@dataclass
+        if self.is_fingerprint_duplicate:
+            # Differs from the representative only in literals, casing,
+            # aliases or context variables; point to it and keep the values
+            # that differ, or the SQL when those do not pair up
+            result["same_as"] = self.cluster
+            if self.literals is None:
+                result["sql"] = self.cleaned_sql
+            elif self.literals:
+                result["literals"] = self.literals
+            return result
+        result["sql"] = self.cleaned_sql
+        if self.cluster_size > 1:
+            result["fingerprint"] = self.fingerprint
+            result["cluster_size"] = self.cluster_size
+        elif self.cluster:
+            result["cluster"] = self.cluster
+        return result
+
+
+@dataclass(slots=True)
 class TMapExpression:
     """Clean tMap extraction for LLM consumption"""
 
@@ -94,6 +218,1763 @@ class TMapExpression:
     expression: str
     data_type: str
 
+    def __post_init__(self) -> None:
+        self.intern_names()
+
+    def intern_names(self) -> None:
+        """Share name strings with every other record (e.g. after unpickling)
+
+        Expressions are interned too: null-guards and TalendDate/
+        StringHandling calls repeat verbatim across jobs.
+        """
+        self.job_name = sys.intern(self.job_name)
+        self.component_name = sys.intern(self.component_name)
+        self.input_column = sys.intern(self.input_column)
+        self.output_column = sys.intern(self.output_column)
+        self.expression = sys.intern(self.expression)
+        self.data_type = sys.intern(self.data_type)
+
+
+@dataclass(slots=True)
+class ComponentNode:
+    """Dependency-graph entry for one component in jobs_summary"""
+
+    comp_type: str
+    x: Any = 0
+    y: Any = 0
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.comp_type = sys.intern(self.comp_type)
+
+    def to_llm_format(self) -> Dict:
+        return {
+            "type": self.comp_type,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+            "position": {"x": self.x, "y": self.y},
+        }
+
+
+def dependency_graph_entry(graph: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready copy of a job's dependency_graph"""
+    if not graph:
+        return graph
+    return {
+        **graph,
+        "components": {
+            name: node.to_llm_format() for name, node in graph["components"].items()
+        },
+    }
+
+
+# ============================================================
+# COMPONENT DECODING
+# ============================================================
+
+
+class DecodedComponent:
+    """Single-pass view of a component <node> shared by all extractors
+
+    Walks the node once and indexes its elementParameters by name (in
+    document order) together with its <metadata>, <nodeData> and
+    <connection> children, so extractors use dict lookups instead of
+    re-scanning the subtree with XPath for every parameter.
+    """
+
+    __slots__ = (
+        "node",
+        "comp_type",
+        "comp_name",
+        "parameters",
+        "metadata",
+        "node_data",
+        "connections",
+    )
+
+    def __init__(self, node: ET.Element) -> None:
+        self.node = node
+        self.comp_type = node.get("componentName", "")
+        self.comp_name = node.get("uniqueName", "")
+        self.parameters: Dict[str, List[ET.Element]] = {}
+        self.metadata: List[ET.Element] = []
+        self.node_data: List[ET.Element] = []
+        self.connections: List[ET.Element] = []
+
+        for elem in node.iter():
+            tag = elem.tag
+            if tag == "elementParameter":
+                name = elem.get("name", "")
+                if name in self.parameters:
+                    self.parameters[name].append(elem)
+                else:
+                    self.parameters[name] = [elem]
+            elif tag == "metadata":
+                self.metadata.append(elem)
+            elif tag == "nodeData":
+                self.node_data.append(elem)
+            elif tag == "connection":
+                self.connections.append(elem)
+
+        # Exported jobs carry the name as a UNIQUE_NAME parameter rather
+        # than a uniqueName attribute
+        if not self.comp_name:
+            self.comp_name = self.value("UNIQUE_NAME", "") or ""
+
+    def param(self, name: str) -> Optional[ET.Element]:
+        """First elementParameter with this name (like node.find)"""
+        elems = self.parameters.get(name)
+        return elems[0] if elems else None
+
+    def params(self, name: str) -> List[ET.Element]:
+        """All elementParameters with this name (like node.findall)"""
+        return self.parameters.get(name, [])
+
+    def value(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Value of the first elementParameter with this name"""
+        elem = self.param(name)
+        return elem.get("value", default) if elem is not None else default
+
+    def group_value(self, group: str, name: str) -> Optional[str]:
+        """Value of a parameter inside a parameter group
+
+        Exports name these ``<group>:<name>`` (PROCESS:PROCESS_TYPE_VERSION);
+        the bare ``<name>`` is accepted too.
+        """
+        return self.value(f"{group}:{name}") or self.value(name)
+
+    def repository_value(self, kind: str) -> Optional[str]:
+        """Repository reference of a PROPERTY or SCHEMA parameter group
+
+        Set only when ``<kind>:<kind>_TYPE`` is REPOSITORY: the metadata item
+        id for PROPERTY, "<id> - <table>" for SCHEMA.
+        """
+        if self.group_value(kind, f"{kind}_TYPE") != "REPOSITORY":
+            return None
+        reference = self.group_value(kind, f"REPOSITORY_{kind}_TYPE")
+        return reference.strip('"') if reference else None
+
+    def table_param(self, name: str) -> Optional[ET.Element]:
+        """First TABLE-field elementParameter with this name"""
+        for elem in self.params(name):
+            if elem.get("field") == "TABLE":
+                return elem
+        return None
+
+    def metadata_for(self, connector: str) -> List[ET.Element]:
+        """<metadata> elements for one connector type (FLOW, OUTPUT, ...)"""
+        return [m for m in self.metadata if m.get("connector") == connector]
+
+
+# ============================================================
+# SQL FINGERPRINTING
+# ============================================================
+
+# MinHash signature length and LSH banding (8 bands x 4 rows); candidates
+# sharing a band are confirmed with the exact shingle Jaccard similarity.
+# Signatures use one-permutation hashing: each shingle hash lands in one of
+# MINHASH_PERMUTATIONS bins, so a signature costs one pass over the shingles.
+MINHASH_PERMUTATIONS = 32
+LSH_BANDS = 8
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+_SQL_KEYWORDS_AFTER_TABLE = set(
+    "where join inner left right full cross outer on group order limit union "
+    "having set using values select when then as natural".split()
+)
+
+# Values canonicalize_sql turns into placeholders: context variable
+# references, string and numeric literals
+_SQL_LITERAL_PATTERN = re.compile(
+    r"[\"']\s*\+\s*context\.\w+\s*\+\s*[\"']|\$\{context\.[^}]+\}|\bcontext\.\w+"
+    r"|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b"
+)
+
+
+def canonicalize_sql(sql: str) -> str:
+    """Canonical form of a cleaned SQL statement
+
+    Literals, context variable references and table aliases become
+    placeholders, quoted identifiers are unquoted, and case and whitespace
+    are normalized, so copy-pasted queries that differ only in those
+    details share one canonical form.
+    """
+    canonical = re.sub(r"[\"']\s*\+\s*context\.\w+\s*\+\s*[\"']", "ctx", sql)
+    canonical = re.sub(r"\$\{context\.[^}]+\}|\bcontext\.\w+", "ctx", canonical)
+    canonical = re.sub(r"'(?:[^']|'')*'", "?", canonical)
+    canonical = re.sub(r"\b\d+(?:\.\d+)?\b", "?", canonical)
+    canonical = re.sub(r"\"([^\"]*)\"|`([^`]*)`|\[([^\]]*)\]", r"\1\2\3", canonical)
+    canonical = canonical.lower()
+
+    # Table aliases: FROM/JOIN <table> [AS] <alias>
+    aliases = []
+    for match in re.finditer(
+        r"\b(?:from|join)\s+[\w.?]+\s+(?:as\s+)?([a-z_]\w*)", canonical
+    ):
+        alias = match.group(1)
+        if alias not in _SQL_KEYWORDS_AFTER_TABLE and alias not in aliases:
+            aliases.append(alias)
+    for alias in aliases:
+        canonical = re.sub(rf"\b{re.escape(alias)}\b", "?a", canonical)
+
+    canonical = re.sub(r"\s+", " ", canonical)
+    canonical = canonical.replace(" as ?a", " ?a")
+    canonical = re.sub(r"\s*([(),=<>+*/;-])\s*", r"\1", canonical)
+    canonical = re.sub(r"\bin\((?:\?,)*\?\)", "in(?)", canonical)
+    return canonical.strip()
+
+
+def sql_literals(sql: str) -> List[str]:
+    """Literals and context variable references of a statement, in order"""
+    return _SQL_LITERAL_PATTERN.findall(sql)
+
+
+def differing_literals(sql: str, representative: str) -> Optional[List[List[str]]]:
+    """[representative's, this statement's] literal pairs that differ
+
+    For two statements with the same canonical form. None when their
+    literals do not line up one to one (e.g. IN lists of different length).
+    """
+    literals = sql_literals(sql)
+    rep_literals = sql_literals(representative)
+    if len(literals) != len(rep_literals):
+        return None
+    return [[rep, own] for rep, own in zip(rep_literals, literals) if rep != own]
+
+
+def sql_fingerprint(canonical: str) -> str:
+    """Short stable digest of a canonical SQL form"""
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _sql_shingles(canonical: str) -> Set[int]:
+    """Hashed token 3-grams of a canonical SQL form"""
+    tokens = re.findall(r"\w+|[^\w\s]", canonical)
+    grams = [
+        " ".join(tokens[i : i + 3]) for i in range(max(1, len(tokens) - 2))
+    ]
+    return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+
+def _minhash_signature(shingles: Set[int]) -> Tuple[int, ...]:
+    """One-permutation MinHash signature with rotation densification"""
+    bins: List[Optional[int]] = [None] * MINHASH_PERMUTATIONS
+    for shingle in shingles:
+        index = shingle % MINHASH_PERMUTATIONS
+        value = shingle // MINHASH_PERMUTATIONS
+        current = bins[index]
+        if current is None or value < current:
+            bins[index] = value
+
+    # Empty bins borrow the next non-empty bin's minimum (tagged with the
+    # distance) so short statements still get a full-length signature
+    signature = []
+    for index in range(MINHASH_PERMUTATIONS):
+        for distance in range(MINHASH_PERMUTATIONS):
+            value = bins[(index + distance) % MINHASH_PERMUTATIONS]
+            if value is not None:
+                signature.append(value * MINHASH_PERMUTATIONS + distance)
+                break
+    return tuple(signature)
+
+
+def cluster_near_duplicates(
+    canonical_forms: List[str], partitions: Optional[List[str]] = None
+) -> List[int]:
+    """Group near-duplicate canonical SQL forms with MinHash/LSH
+
+    Args:
+        canonical_forms: Canonical SQL forms (see canonicalize_sql)
+        partitions: Optional key per form; only forms with the same key
+            (e.g. SQL operation) can share a cluster
+
+    Returns:
+        For each form, the index of its cluster representative (the first
+        member in input order)
+    """
+    parent = list(range(len(canonical_forms)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    shingles = [_sql_shingles(canonical) for canonical in canonical_forms]
+    rows = MINHASH_PERMUTATIONS // LSH_BANDS
+    buckets: Dict[Tuple[Any, ...], int] = {}
+
+    for i, shingle_set in enumerate(shingles):
+        signature = _minhash_signature(shingle_set)
+        partition = partitions[i] if partitions else ""
+        for band in range(LSH_BANDS):
+            key = (partition, band, signature[band * rows : (band + 1) * rows])
+            anchor = buckets.setdefault(key, i)
+            if anchor == i or find(anchor) == find(i):
+                continue
+            other = shingles[anchor]
+            similarity = len(shingle_set & other) / len(shingle_set | other)
+            if similarity >= NEAR_DUPLICATE_THRESHOLD:
+                union(anchor, i)
+
+    return [find(i) for i in range(len(canonical_forms))]
+
+
+# ============================================================
+# TABLE LINEAGE
+# ============================================================
+
+
+def normalize_table_name(table: str) -> str:
+    """Spelling of a table name used as its key (SQL names are case-insensitive)"""
+    return table.lower()
+
+
+# Statement-level operations that modify their target table
+WRITE_OPERATIONS = {
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "MERGE",
+    "MERGE_USING",
+    "CREATE",
+    "DROP",
+    "ALTER",
+    "TRUNCATE",
+    "CTE_INSERT",
+    "CTE_UPDATE",
+    "CTE_DELETE",
+    "CTE_MERGE",
+    "BLOCK_INSERT",
+    "BLOCK_UPDATE",
+    "BLOCK_DELETE",
+    "BLOCK_MERGE",
+    "MULTI_STATEMENT",
+}
+
+# Target table of a write statement (schema prefix may be a context variable)
+WRITE_TARGET_PATTERN = re.compile(
+    r"(?:INSERT\s+(?:OVERWRITE\s+)?(?:INTO|TABLE)|UPDATE|DELETE\s+FROM|MERGE\s+INTO"
+    r"|TRUNCATE\s+TABLE|CREATE\s+(?:OR\s+REPLACE\s+)?(?:TEMP\w*\s+)?TABLE"
+    r"(?:\s+IF\s+NOT\s+EXISTS)?|DROP\s+TABLE(?:\s+IF\s+EXISTS)?|ALTER\s+TABLE)"
+    r"\s+(?:[^\s(]*\.)?([a-zA-Z_][a-zA-Z0-9_]*)",
+    re.IGNORECASE,
+)
+
+
+def sql_write_targets(sql: ExtractedSQL) -> Set[str]:
+    """Tables a statement writes (the target of INSERT/UPDATE/MERGE/...)"""
+    if sql.sql_operation not in WRITE_OPERATIONS:
+        return set()
+    return {
+        normalize_table_name(match.group(1))
+        for match in WRITE_TARGET_PATTERN.finditer(sql.cleaned_sql)
+    }
+
+
+def job_table_access(
+    sql_records: Iterable[ExtractedSQL], component_tables: Dict[str, Dict[str, Any]]
+) -> Tuple[List[str], List[str]]:
+    """Tables one job reads and writes
+
+    Combines SQL statements (write targets vs. other referenced tables) with
+    the tables input and output components name in their settings (the job
+    summary's component_tables), e.g. a tDBOutput with a TABLE and no SQL.
+    """
+    reads: Dict[str, None] = {}
+    writes: Dict[str, None] = {}
+    for sql in sql_records:
+        targets = sql_write_targets(sql)
+        for table in sql.tables:
+            (writes if table in targets else reads)[table] = None
+    for comp in component_tables.values():
+        access = writes if comp["operation"] in WRITE_OPERATIONS else reads
+        for table in comp["tables"]:
+            access[table] = None
+    return list(reads), list(writes)
+
+
+def strongly_connected_components(
+    nodes: Iterable[str], successors: Callable[[str], Iterable[str]]
+) -> List[List[str]]:
+    """Strongly connected components in topological order (Tarjan, iterative)
+
+    Tarjan emits components sinks-first; the result is reversed so every
+    component comes after all the components with edges into it. Members
+    keep discovery order. O(V + E).
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, pending = work[-1]
+            for successor in pending:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors(successor))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+
+    components.reverse()
+    return components
+
+
+class TableLineageGraph:
+    """Producer -> consumer lineage between jobs through the tables they share
+
+    Adjacency is indexed both ways (job -> tables read/written, table ->
+    reading/writing jobs), so closures and the topological order are
+    O(V + E) and replacing one job's reads/writes only touches its own
+    edges. Insertion-ordered dicts serve as ordered sets to keep every
+    result deterministic.
+    """
+
+    def __init__(self) -> None:
+        self.job_reads: Dict[str, Dict[str, None]] = {}
+        self.job_writes: Dict[str, Dict[str, None]] = {}
+        self.table_readers: Dict[str, Dict[str, None]] = {}
+        self.table_writers: Dict[str, Dict[str, None]] = {}
+
+    def set_job(self, job: str, reads: Iterable[str], writes: Iterable[str]) -> None:
+        """Add a job, or replace the reads/writes of a job that changed"""
+        self.remove_job(job)
+        self.job_reads[job] = dict.fromkeys(map(normalize_table_name, reads))
+        self.job_writes[job] = dict.fromkeys(map(normalize_table_name, writes))
+        for table in self.job_reads[job]:
+            self.table_readers.setdefault(table, {})[job] = None
+        for table in self.job_writes[job]:
+            self.table_writers.setdefault(table, {})[job] = None
+
+    def remove_job(self, job: str) -> None:
+        """Drop a job and its edges"""
+        for tables, index in (
+            (self.job_reads.pop(job, {}), self.table_readers),
+            (self.job_writes.pop(job, {}), self.table_writers),
+        ):
+            for table in tables:
+                index[table].pop(job, None)
+                if not index[table]:
+                    del index[table]
+
+    def consumers(self, job: str) -> Iterator[str]:
+        """Jobs that read a table this job writes"""
+        for table in self.job_writes.get(job, {}):
+            for reader in self.table_readers.get(table, {}):
+                if reader != job:
+                    yield reader
+
+    def producers(self, job: str) -> Iterator[str]:
+        """Jobs that write a table this job reads"""
+        for table in self.job_reads.get(job, {}):
+            for writer in self.table_writers.get(table, {}):
+                if writer != job:
+                    yield writer
+
+    def _closure(
+        self, start: Iterable[str], step: Callable[[str], Iterator[str]]
+    ) -> List[str]:
+        """Jobs reachable from `start` (included), breadth-first"""
+        seen = dict.fromkeys(start)
+        queue = deque(seen)
+        while queue:
+            for neighbour in step(queue.popleft()):
+                if neighbour not in seen:
+                    seen[neighbour] = None
+                    queue.append(neighbour)
+        return list(seen)
+
+    def downstream_jobs(self, job: str) -> List[str]:
+        """Every job affected, directly or transitively, by a change to `job`"""
+        return self._closure([job], self.consumers)[1:]
+
+    def upstream_jobs(self, job: str) -> List[str]:
+        """Every job `job` depends on, directly or transitively"""
+        return self._closure([job], self.producers)[1:]
+
+    def downstream_tables(self, table: str) -> List[str]:
+        """Tables derived, directly or transitively, from `table`"""
+        table = normalize_table_name(table)
+        jobs = self._closure(self.table_readers.get(table, {}), self.consumers)
+        tables = dict.fromkeys(t for job in jobs for t in self.job_writes[job])
+        tables.pop(table, None)
+        return list(tables)
+
+    def upstream_tables(self, table: str) -> List[str]:
+        """Tables `table` is derived from, directly or transitively"""
+        table = normalize_table_name(table)
+        jobs = self._closure(self.table_writers.get(table, {}), self.producers)
+        tables = dict.fromkeys(t for job in jobs for t in self.job_reads[job])
+        tables.pop(table, None)
+        return list(tables)
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Job groups that feed each other, producers-first"""
+        return strongly_connected_components(self.job_reads, self.consumers)
+
+    def topological_order(self) -> Tuple[List[str], List[List[str]]]:
+        """Jobs ordered producers-first, plus the groups that form cycles
+
+        Jobs in a cycle (e.g. sharing a read/write audit table) are kept
+        together at the position of their group.
+        """
+        components = self.strongly_connected_components()
+        order = [job for component in components for job in component]
+        cycles = [component for component in components if len(component) > 1]
+        return order, cycles
+
+    def to_llm_format(self) -> Dict[str, Any]:
+        order, cycles = self.topological_order()
+        return {
+            "job_order": order,
+            "cyclic_groups": cycles,
+            "tables": {
+                table: {
+                    "written_by": list(self.table_writers.get(table, {})),
+                    "read_by": list(self.table_readers.get(table, {})),
+                }
+                for table in sorted(set(self.table_readers) | set(self.table_writers))
+            },
+        }
+
+
+# ============================================================
+# ORCHESTRATION CALL GRAPH
+# ============================================================
+
+# Version suffix of a job item's file stem (Child_Load_0.1 -> Child_Load)
+JOB_VERSION_PATTERN = re.compile(r"_(\d+(?:\.\d+)*)$")
+
+
+def read_item_properties(item_file: "ItemPath") -> Dict[str, str]:
+    """id/label/version of an item from the .properties file next to it
+
+    Only the leading Property element is read; returns an empty dict when
+    the .properties file is missing or unreadable.
+    """
+    try:
+        with item_file.with_suffix(".properties").open("rb") as f:
+            for _, element in ET.iterparse(f, events=("start",)):
+                if element.tag.rpartition("}")[2] == "Property":
+                    return {
+                        key: element.get(key, "")
+                        for key in ("id", "label", "version")
+                        if element.get(key)
+                    }
+    except (OSError, ET.ParseError):
+        pass
+    return {}
+
+
+def job_repository_ids(item_files: Iterable["ItemPath"]) -> Dict[str, str]:
+    """Repository id -> job name (without version) from the jobs' .properties
+
+    tRunJob components may reference the job they run by id only; every
+    saved version of a job shares its id.
+    """
+    job_ids = {}
+    for item_file in item_files:
+        properties = read_item_properties(item_file)
+        if "id" in properties:
+            job_ids[properties["id"]] = properties.get("label") or JOB_VERSION_PATTERN.sub(
+                "", item_file.stem
+            )
+    return job_ids
+
+
+class JobCallGraph:
+    """Job -> child-job call graph resolved from tRunJob references
+
+    References are the PROCESS name or repository id (with
+    PROCESS_TYPE_VERSION appended when pinned) recorded in
+    jobs_summary[job]["child_jobs"]; ids are first mapped to job names via
+    job_ids (see job_repository_ids). A reference resolves to the job with
+    that exact name, else to the latest version of a job with that base name
+    (also for a pinned version that was not parsed, see
+    select_latest_versions); anything else is kept as unresolved.
+    """
+
+    def __init__(
+        self,
+        jobs_summary: Dict[str, Dict[str, Any]],
+        job_ids: Optional[Dict[str, str]] = None,
+    ) -> None:
+        job_ids = job_ids or {}
+        self.children: Dict[str, List[str]] = {}
+        self.callers: Dict[str, List[str]] = {job: [] for job in jobs_summary}
+        self.unresolved: Dict[str, List[str]] = {}
+
+        latest: Dict[str, Tuple[Tuple[int, ...], str]] = {}
+        for job in jobs_summary:
+            match = JOB_VERSION_PATTERN.search(job)
+            if match:
+                version = tuple(int(part) for part in match.group(1).split("."))
+                base = job[: match.start()]
+                if base not in latest or version > latest[base][0]:
+                    latest[base] = (version, job)
+
+        for job, info in jobs_summary.items():
+            resolved: Dict[str, None] = {}
+            for ref in info.get("child_jobs", []):
+                pinned = JOB_VERSION_PATTERN.search(ref)
+                if ref in job_ids:
+                    ref = job_ids[ref]
+                elif pinned and ref[: pinned.start()] in job_ids:
+                    ref = job_ids[ref[: pinned.start()]] + pinned.group(0)
+                    pinned = JOB_VERSION_PATTERN.search(ref)
+                child = ref if ref in self.callers else latest.get(ref, (None, None))[1]
+                if not child and pinned:
+                    child = latest.get(ref[: pinned.start()], (None, None))[1]
+                if child:
+                    resolved[child] = None
+                else:
+                    self.unresolved.setdefault(job, []).append(ref)
+            self.children[job] = list(resolved)
+            for child in resolved:
+                self.callers[child].append(job)
+
+    def callees(self, job: str) -> List[str]:
+        return self.children.get(job, [])
+
+    def roots(self) -> List[str]:
+        """Root orchestrators: jobs that call others but are never called"""
+        return [job for job in self.children if self.children[job] and not self.callers[job]]
+
+    def role(self, job: str) -> Optional[str]:
+        """Orchestration role from the call graph, None if not part of it"""
+        has_children = bool(self.children.get(job))
+        has_callers = bool(self.callers.get(job))
+        if has_children:
+            return "orchestrator_mid" if has_callers else "orchestrator_top"
+        return "processor" if has_callers else None
+
+    def reachable(self, job: str) -> List[str]:
+        """Jobs `job` runs, directly or through intermediate orchestrators"""
+        seen = {job: None}
+        queue = deque([job])
+        while queue:
+            for child in self.children.get(queue.popleft(), []):
+                if child not in seen:
+                    seen[child] = None
+                    queue.append(child)
+        return list(seen)[1:]
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of jobs that (transitively) call each other"""
+        return [
+            component
+            for component in strongly_connected_components(self.children, self.callees)
+            if len(component) > 1 or component[0] in self.children[component[0]]
+        ]
+
+    def depths(self) -> Dict[str, int]:
+        """Longest call chain from a root to each job (cycles share a level)"""
+        components = strongly_connected_components(self.children, self.callees)
+        component_of = {
+            job: position for position, component in enumerate(components) for job in component
+        }
+        depth: Dict[str, int] = {}
+        for position, component in enumerate(components):
+            level = 0
+            for job in component:
+                for caller in self.callers[job]:
+                    if component_of[caller] != position:
+                        level = max(level, depth[caller] + 1)
+            for job in component:
+                depth[job] = level
+        return depth
+
+    def to_llm_format(self) -> Dict[str, Any]:
+        depth = self.depths()
+        orchestrated = [job for job in self.children if self.role(job)]
+        level_count = max((depth[job] + 1 for job in orchestrated), default=0)
+        levels: List[List[str]] = [[] for _ in range(level_count)]
+        for job in orchestrated:
+            levels[depth[job]].append(job)
+
+        return {
+            "edges": {job: children for job, children in self.children.items() if children},
+            "unresolved": self.unresolved,
+            "roots": self.roots(),
+            "levels": levels,
+            "cycles": self.cycles(),
+            "reachable_from_roots": {root: self.reachable(root) for root in self.roots()},
+            "standalone_jobs": [job for job in self.children if not self.role(job)],
+        }
+
+
+# ============================================================
+# ARCHIVE INPUT
+# ============================================================
+
+
+@functools.lru_cache(maxsize=None)
+def _open_archive(archive: Path) -> Any:
+    """zipfile.ZipFile for an export, opened once per process"""
+    import zipfile
+
+    return zipfile.ZipFile(archive)
+
+
+class ArchiveMember:
+    """A file inside a .zip export, used wherever parse_folder takes a Path
+
+    Implements the part of the Path API the parser needs, reading (and
+    decompressing) the member straight from the archive, so exports never
+    have to be unpacked to disk. Members are picklable; each worker process
+    opens the archive itself and decompresses the members it parses.
+    """
+
+    __slots__ = ("archive", "member")
+
+    def __init__(self, archive: Path, member: Union[str, PurePosixPath]) -> None:
+        self.archive = archive
+        self.member = PurePosixPath(member)
+
+    def __str__(self) -> str:
+        return f"{self.archive}/{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({str(self.archive)!r}, {str(self.member)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ArchiveMember)
+            and self.archive == other.archive
+            and self.member == other.member
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.archive, self.member))
+
+    @property
+    def name(self) -> str:
+        return self.member.name
+
+    @property
+    def stem(self) -> str:
+        return self.member.stem
+
+    @property
+    def suffix(self) -> str:
+        return self.member.suffix
+
+    @property
+    def parent(self) -> "ArchiveMember":
+        return ArchiveMember(self.archive, self.member.parent)
+
+    def with_suffix(self, suffix: str) -> "ArchiveMember":
+        return ArchiveMember(self.archive, self.member.with_suffix(suffix))
+
+    def relative_to(self, other: Path) -> PurePosixPath:
+        """Member path inside the archive (other must be the archive)"""
+        if other != self.archive:
+            raise ValueError(f"{self} is not in {other}")
+        return self.member
+
+    def open(self, mode: str = "rb") -> IO[bytes]:
+        """Stream the member's decompressed bytes (read-only: mode "rb")"""
+        if mode != "rb":
+            raise ValueError(f"Archive members are read-only, got mode {mode!r}")
+        try:
+            return _open_archive(self.archive).open(str(self.member))
+        except KeyError:
+            raise FileNotFoundError(f"No member {self.member} in {self.archive}") from None
+
+    def read_bytes(self) -> bytes:
+        with self.open() as f:
+            return f.read()
+
+
+# A job or repository item: a file on disk or a member of a .zip export
+ItemPath = Union[Path, ArchiveMember]
+
+
+def list_item_files(source: Path) -> List[ItemPath]:
+    """.item files under a folder (rglob order) or in a .zip (archive order)"""
+    if not source.is_file():
+        return list(source.rglob("*.item"))
+
+    import zipfile
+
+    if not zipfile.is_zipfile(source):
+        return []
+    return [
+        ArchiveMember(source, info.filename)
+        for info in _open_archive(source).infolist()
+        if not info.is_dir() and info.filename.endswith(".item")
+    ]
+
+
+# ============================================================
+# ITEM VERSION SELECTION
+# ============================================================
+
+
+def _version_tuple(version: str) -> Optional[Tuple[int, ...]]:
+    """"1.10" -> (1, 10); None for anything that is not a dotted number"""
+    if not re.fullmatch(r"\d+(?:\.\d+)*", version):
+        return None
+    return tuple(int(part) for part in version.split("."))
+
+
+def select_latest_versions(
+    item_files: List[ItemPath],
+) -> Tuple[List[ItemPath], Dict[str, List[str]]]:
+    """Keep only the latest saved version of each logical job
+
+    Talend exports keep every saved version side by side (Load_0.1.item,
+    Load_0.2.item, Load_1.0.item). Items in one folder are the same logical
+    job when their .properties label matches (the file stem without its
+    _<version> suffix when there is no .properties file); the highest
+    version wins, ties go to the file found last.
+
+    Returns the kept files in their original order, and for each kept job
+    the job names of its superseded versions (oldest first).
+    """
+    groups: Dict[Tuple[ItemPath, str], List[Tuple[Tuple[int, ...], int]]] = {}
+    for position, item_file in enumerate(item_files):
+        properties = read_item_properties(item_file)
+        match = JOB_VERSION_PATTERN.search(item_file.stem)
+        label = properties.get("label") or (
+            item_file.stem[: match.start()] if match else item_file.stem
+        )
+        version = _version_tuple(properties.get("version", "")) or (
+            _version_tuple(match.group(1)) if match else None
+        )
+        groups.setdefault((item_file.parent, label), []).append((version or (), position))
+
+    kept: List[int] = []
+    superseded: Dict[str, List[str]] = {}
+    for versions in groups.values():
+        versions.sort()
+        latest = versions[-1][1]
+        kept.append(latest)
+        if len(versions) > 1:
+            superseded[item_files[latest].stem] = [
+                item_files[position].stem for _, position in versions[:-1]
+            ]
+    return [item_files[position] for position in sorted(kept)], superseded
+
+
+# ============================================================
+# REPOSITORY ITEMS
+# ============================================================
+
+# Repository folder (path segment below the input folder) -> item type;
+# items outside these folders are classified by their root element
+REPOSITORY_FOLDERS = {
+    "process": "job",
+    "process_mr": "job",
+    "process_storm": "job",
+    "joblets": "joblet",
+    "metadata": "metadata",
+    "context": "context",
+    "code": "routine",
+    "sqlPatterns": "sql_template",
+}
+REPOSITORY_ROOT_TYPES = {"ProcessType": "job", "ContextType": "context", "ContextItem": "context"}
+
+# Metadata connection attributes copied to the index (never credentials)
+METADATA_CONNECTION_ATTRIBUTES = {
+    "DatabaseType": "database_type",
+    "DriverClass": "driver",
+    "ServerName": "server",
+    "Port": "port",
+    "SID": "database",
+    "UiSchema": "schema",
+    "FilePath": "file_path",
+    "FieldSeparatorValue": "field_separator",
+}
+
+XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+XML_START_PATTERN = re.compile(rb"(?:\xef\xbb\xbf)?\s*<[?!A-Za-z_]")
+ROOT_TAG_PATTERN = re.compile(rb"<([A-Za-z_][\w.:-]*)")
+ROUTINE_CLASS_PATTERN = re.compile(r"\bclass\s+(\w+)")
+ROUTINE_METHOD_PATTERN = re.compile(r"\bpublic\s+static\s+[\w<>\[\],.? ]+?\s+(\w+)\s*\(")
+
+
+def _local_name(tag: str) -> str:
+    """Tag or attribute name without its namespace ({uri}name or prefix:name)"""
+    return tag.rpartition("}")[2].rpartition(":")[2]
+
+
+def classify_item(item_file: ItemPath, folder: Path) -> str:
+    """Repository item type of an .item file (job, joblet, metadata, ...)
+
+    The first path segment below ``folder`` that names a repository folder
+    decides. Otherwise the root element does: ProcessType is a job, a
+    context type a context group, any *Connection a metadata connection.
+    Other XML stays a job (so a malformed job is still reported); content
+    that is not XML at all (routines, templates) is "other".
+    """
+    try:
+        segments = item_file.relative_to(folder).parts[:-1]
+    except ValueError:
+        segments = ()
+    for segment in segments:
+        if segment in REPOSITORY_FOLDERS:
+            return REPOSITORY_FOLDERS[segment]
+
+    try:
+        with item_file.open("rb") as f:
+            head = f.read(4096)
+    except OSError:
+        return "job"
+    if head.strip() and not XML_START_PATTERN.match(head):
+        return "other"
+    for match in ROOT_TAG_PATTERN.finditer(head):
+        root = _local_name(match.group(1).decode("ascii"))
+        if root == "XMI":
+            continue
+        if root.endswith("Connection"):
+            return "metadata"
+        return REPOSITORY_ROOT_TYPES.get(root, "job")
+    return "job"
+
+
+def _metadata_columns(table: ET.Element) -> List[Dict[str, Any]]:
+    columns = []
+    for column in table:
+        if _local_name(column.tag) not in ("columns", "feature"):
+            continue
+        entry = {
+            "name": column.get("label") or column.get("name", ""),
+            "type": column.get("talendType", ""),
+            "nullable": column.get("nullable", "true") != "false",
+        }
+        if column.get("sourceType"):
+            entry["db_type"] = column.get("sourceType")
+        if column.get("length") not in (None, "", "-1", "0"):
+            entry["length"] = column.get("length")
+        if column.get("key") == "true":
+            entry["key"] = True
+        columns.append(entry)
+    return columns
+
+
+def _extract_metadata_item(root: ET.Element) -> Dict[str, Any]:
+    """Connection settings and table schemas of a metadata connection"""
+    connection = root
+    if _local_name(root.tag) == "XMI":
+        connection = next(
+            (child for child in root if _local_name(child.tag).endswith("Connection")), root
+        )
+    entry: Dict[str, Any] = {"connection_type": _local_name(connection.tag)}
+    for attribute, key in METADATA_CONNECTION_ATTRIBUTES.items():
+        if connection.get(attribute):
+            entry[key] = connection.get(attribute)
+
+    tables: Dict[str, Any] = {}
+    for elem in connection.iter():
+        if _local_name(elem.tag) == "tables" or elem.get(XSI_TYPE, "").endswith(
+            "MetadataTable"
+        ):
+            name = elem.get("label") or elem.get("name") or elem.get("tableName", "")
+            tables[name] = {
+                "table": elem.get("tableName") or name,
+                "columns": _metadata_columns(elem),
+            }
+    entry["tables"] = tables
+    return entry
+
+
+def _extract_context_item(root: ET.Element) -> Dict[str, Any]:
+    """Variables of a context group, per environment (Default, Prod, ...)"""
+    environments: Dict[str, Dict[str, Any]] = {}
+    for context in root.iter():
+        if _local_name(context.tag) not in ("context", "ContextType"):
+            continue
+        variables = {}
+        for param in context:
+            if _local_name(param.tag) == "contextParameter" and param.get("name"):
+                variables[param.get("name")] = {
+                    "type": param.get("type", ""),
+                    "default": param.get("value", ""),
+                }
+        environments[context.get("name", "Default")] = variables
+    return {"environments": environments}
+
+
+def _joblet_index_entry(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Components of a parsed joblet with its input and output connectors"""
+    graph = (template["summary"] or {}).get("dependency_graph") or {"components": {}}
+    components = {name: node.comp_type for name, node in graph["components"].items()}
+    return {
+        "components": components,
+        "inputs": [name for name, kind in components.items() if kind == "tJobletInput"],
+        "outputs": [name for name, kind in components.items() if kind == "tJobletOutput"],
+    }
+
+
+def _extract_routine_item(text: str) -> Dict[str, Any]:
+    """Class and public static methods of a Java routine"""
+    class_match = ROUTINE_CLASS_PATTERN.search(text)
+    return {
+        "class": class_match.group(1) if class_match else None,
+        "methods": list(dict.fromkeys(ROUTINE_METHOD_PATTERN.findall(text))),
+    }
+
+
+def _extract_sql_template_item(text: str) -> Dict[str, Any]:
+    return {"template": text.strip()}
+
+
+def build_metadata_index(metadata_objects: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Repository id -> metadata connection, "<id> - <table>" -> table schema
+
+    Components point at a metadata connection by its item id
+    (REPOSITORY_PROPERTY_TYPE) and at one of its tables as "<id> - <table>"
+    (REPOSITORY_SCHEMA_TYPE). Items without an id cannot be referenced.
+    """
+    index: Dict[str, Any] = {}
+    for name, entry in metadata_objects.items():
+        repository_id = entry.get("id")
+        if not repository_id:
+            continue
+        index[repository_id] = {
+            "name": name,
+            **{key: value for key, value in entry.items() if key not in ("id", "file", "tables")},
+        }
+        for table_name, table in entry.get("tables", {}).items():
+            index[f"{repository_id} - {table_name}"] = {"connection": name, **table}
+    return index
+
+
+# Item type -> (parses as XML, extractor); jobs and joblets go through the
+# full parser (see TalendParserLLMOptimized._index_repository_items)
+REPOSITORY_EXTRACTORS: Dict[str, Tuple[bool, Callable[[Any], Dict[str, Any]]]] = {
+    "metadata": (True, _extract_metadata_item),
+    "context": (True, _extract_context_item),
+    "routine": (False, _extract_routine_item),
+    "sql_template": (False, _extract_sql_template_item),
+}
+
+
+def extract_repository_item(
+    item_type: str, item_file: ItemPath, content: bytes
+) -> Tuple[str, Dict[str, Any]]:
+    """Name and index entry of a non-job repository item
+
+    The name is the item's .properties label (the file stem without its
+    _<version> suffix when there is none), which is also how jobs refer to
+    joblets; metadata and context groups are referenced by the "id".
+    """
+    properties = read_item_properties(item_file)
+    match = JOB_VERSION_PATTERN.search(item_file.stem)
+    name = properties.get("label") or (
+        item_file.stem[: match.start()] if match else item_file.stem
+    )
+    entry: Dict[str, Any] = {
+        "id": properties.get("id"),
+        "version": properties.get("version") or (match.group(1) if match else None),
+        "file": item_file.name,
+    }
+    if item_type in REPOSITORY_EXTRACTORS:
+        as_xml, extractor = REPOSITORY_EXTRACTORS[item_type]
+        source = ET.fromstring(content) if as_xml else content.decode("utf-8", "replace")
+        entry.update(extractor(source))
+    return name, entry
+
+
+# ============================================================
+# TOKEN-BUDGET BUNDLES
+# ============================================================
+
+# Recent bundles considered per shared table when placing a unit; bounds
+# placement cost for tables that nearly every job touches (audit, logs)
+BUNDLE_CANDIDATES_PER_TABLE = 8
+
+
+def _call_tree_units(job_order: List[str], call_graph: JobCallGraph) -> List[List[str]]:
+    """Jobs linked by tRunJob (in either direction), each listed parent-first"""
+    units = []
+    assigned: Set[str] = set()
+    for job in job_order:
+        if job in assigned:
+            continue
+        members = {job: None}
+        queue = deque([job])
+        while queue:
+            current = queue.popleft()
+            for neighbour in call_graph.callees(current) + call_graph.callers.get(current, []):
+                if neighbour not in members:
+                    members[neighbour] = None
+                    queue.append(neighbour)
+
+        # Depth-first from the unit's roots, so children follow their parent
+        unit: Dict[str, None] = {}
+        roots = [m for m in members if not call_graph.callers.get(m)] or [job]
+        stack = list(reversed(roots))
+        while stack:
+            current = stack.pop()
+            if current not in unit:
+                unit[current] = None
+                stack.extend(reversed(call_graph.callees(current)))
+        unit.update(dict.fromkeys(members))
+        assigned.update(unit)
+        units.append(list(unit))
+    return units
+
+
+def plan_bundles(
+    job_tokens: Dict[str, int],
+    job_order: List[str],
+    call_graph: JobCallGraph,
+    job_tables: Dict[str, Iterable[str]],
+    budget: int,
+) -> List[List[str]]:
+    """Pack jobs into bundles of at most `budget` tokens
+
+    Jobs linked by tRunJob form one unit, listed parent-first; a unit over
+    budget is cut into consecutive runs of that order, so parents stay next
+    to their first children. Units are then placed in producers-first job
+    order into the open bundle sharing the most tables with them, else the
+    latest bundle if it has room, else a new bundle. A single job over
+    budget gets a bundle of its own.
+    """
+    pieces: List[List[str]] = []
+    for unit in _call_tree_units(job_order, call_graph):
+        piece: List[str] = []
+        piece_tokens = 0
+        for job in unit:
+            if piece and piece_tokens + job_tokens[job] > budget:
+                pieces.append(piece)
+                piece, piece_tokens = [], 0
+            piece.append(job)
+            piece_tokens += job_tokens[job]
+        pieces.append(piece)
+
+    bundles: List[List[str]] = []
+    used: List[int] = []
+    table_bundles: Dict[str, List[int]] = {}
+    for piece in pieces:
+        tokens = sum(job_tokens[job] for job in piece)
+        tables = dict.fromkeys(table for job in piece for table in job_tables.get(job, ()))
+
+        shared: Dict[int, int] = {}
+        for table in tables:
+            for bundle in table_bundles.get(table, [])[-BUNDLE_CANDIDATES_PER_TABLE:]:
+                if used[bundle] + tokens <= budget:
+                    shared[bundle] = shared.get(bundle, 0) + 1
+
+        if shared:
+            target = max(shared, key=lambda bundle: (shared[bundle], bundle))
+        elif bundles and used[-1] + tokens <= budget:
+            target = len(bundles) - 1
+        else:
+            target = len(bundles)
+            bundles.append([])
+            used.append(0)
+
+        bundles[target].extend(piece)
+        used[target] += tokens
+        for table in tables:
+            holders = table_bundles.setdefault(table, [])
+            if not holders or holders[-1] != target:
+                holders.append(target)
+    return bundles
+
+
+# ============================================================
+# TRACING
+# ============================================================
+
+
+class _NullSpan:
+    """No-op span returned while tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """One timed region, recorded as a complete event when it exits"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start_ns")
+
+    def __init__(
+        self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end_ns = time.perf_counter_ns()
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (self.start_ns - self.tracer.origin_ns) / 1000,
+            "dur": (end_ns - self.start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        # list.append is atomic, so tokenizer threads can share the tracer
+        self.tracer.events.append(event)
+
+
+class Tracer:
+    """Collects nested timing spans as Chrome trace events (--trace)
+
+    Spans are complete events (ph "X") on the recording process and thread,
+    so nesting follows from their timestamps; the file loads in
+    chrome://tracing, Perfetto or speedscope. perf_counter_ns() is
+    system-wide, so worker processes created with the parent's origin
+    record spans that line up with the parent's. A disabled tracer costs
+    one method call per span.
+    """
+
+    def __init__(self, enabled: bool = True, origin_ns: Optional[int] = None) -> None:
+        self.enabled = enabled
+        self.origin_ns = time.perf_counter_ns() if origin_ns is None else origin_ns
+        self.events: List[Dict[str, Any]] = []
+
+    def span(
+        self, name: str, category: str = "phase", **args: Any
+    ) -> Union[_Span, _NullSpan]:
+        """Context manager timing the enclosed block"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Return and clear the recorded events (to ship them from a worker)"""
+        events, self.events = self.events, []
+        return events
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Add events recorded by another tracer (e.g. in a worker process)"""
+        if self.enabled:
+            self.events.extend(events)
+
+    def write(self, path: Union[str, Path], process_name: str = "main") -> None:
+        """Write the recorded spans as a Chrome trace-event JSON file"""
+        main_pid = os.getpid()
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": process_name if pid == main_pid else f"worker {pid}"},
+            }
+            for pid in sorted({event["pid"] for event in self.events} | {main_pid})
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, f)
+
+
+NULL_TRACER = Tracer(enabled=False)
+
+
+# ============================================================
+# FILE STATISTICS
+# ============================================================
+
+
+@functools.lru_cache(maxsize=None)
+def load_token_encoder() -> Any:
+    """The cl100k_base encoder, imported and loaded once per process
+
+    Deferred until a token count is actually needed: loading tiktoken's BPE
+    ranks dominates startup, and runs with --no-token-stats never need it.
+    """
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _read_job_file(file_path: ItemPath) -> Optional[bytes]:
+    """Read a file's raw bytes once, for both parsing and statistics"""
+    try:
+        return file_path.read_bytes()
+    except OSError as e:
+        logger.warning(f"Error reading {file_path}: {e}")
+        return None
+
+
+def _sample_tokens(token_encoder: Any, file_path: ItemPath, text: str) -> Dict[str, Any]:
+    """Exactly encode a deterministic sample of a file's chunks
+
+    Returns the sampled bytes/tokens and the chunk-level moments
+    [n, sum b, sum t, sum b^2, sum t^2, sum b*t] used to calibrate the
+    per-type ratio and its confidence bound (see _resolve_token_estimates).
+    """
+    name = file_path.name
+    chunk_count = max(1, -(-len(text) // TOKEN_ESTIMATE_CHUNK_CHARS))
+    anchor = zlib.crc32(name.encode("utf-8")) % chunk_count
+    moments = [0] * 6
+    for index in range(chunk_count):
+        if (
+            index != anchor
+            and zlib.crc32(f"{name}:{index}".encode("utf-8")) % TOKEN_ESTIMATE_SAMPLE_EVERY
+        ):
+            continue
+        start = index * TOKEN_ESTIMATE_CHUNK_CHARS
+        chunk = text[start : start + TOKEN_ESTIMATE_CHUNK_CHARS]
+        b = len(chunk.encode("utf-8"))
+        t = len(token_encoder.encode(chunk))
+        for position, value in enumerate((1, b, t, b * b, t * t, b * t)):
+            moments[position] += value
+
+    return {
+        "file_type": TOKEN_FILE_TYPES.get(file_path.suffix.lower(), "text"),
+        "chunks": chunk_count,
+        "sampled_chunks": moments[0],
+        "sampled_bytes": moments[1],
+        "sampled_tokens": moments[2],
+        "moments": moments,
+    }
+
+
+def _file_stat_entry(
+    token_encoder: Any,
+    file_path: ItemPath,
+    content: Optional[bytes] = None,
+    estimate: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Size and token statistics for one file (None if it cannot be read)
+
+    With estimate, "tokens" is None and "token_sample" holds the exactly
+    encoded sample; FileStatsCollector.summarize fills in the estimate.
+    """
+    try:
+        if content is None:
+            content = file_path.read_bytes()
+        text = content.decode("utf-8", errors="ignore")
+        size_bytes = len(text.encode("utf-8"))
+
+        entry = {
+            "name": file_path.name,
+            "path": str(file_path),
+            "size_bytes": size_bytes,
+            "size_kb": round(size_bytes / 1024, 2),
+            "tokens": None,
+        }
+
+        # Calculate tokens
+        if estimate:
+            entry["token_sample"] = _sample_tokens(token_encoder, file_path, text)
+        else:
+            entry["tokens"] = len(token_encoder.encode(text))
+        return entry
+
+    except Exception as e:
+        logger.warning(f"Error calculating stats for {file_path}: {e}")
+        return None
+
+
+def _resolve_token_estimates(entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Fill in estimated token counts from the sampled chunks
+
+    Each file type gets the ratio estimator r = sum t / sum b over its
+    sampled chunks (pooled over all types if a type has no sample). A file's
+    estimate is its sampled tokens plus r times its unsampled bytes. The 95%
+    bound per type is 1.96 * sqrt(s^2 * (M + M^2 / n)), where s^2 is the
+    residual variance of t - r * b over the n sampled chunks and M is the
+    number of unsampled chunks: the chunk-level noise plus the uncertainty
+    of r itself.
+
+    Returns per-type calibration: ratio, sample size and the bound.
+    """
+    moments: Dict[str, List[int]] = {}
+    for entry in entries:
+        sample = entry.get("token_sample")
+        if sample:
+            totals = moments.setdefault(sample["file_type"], [0] * 6)
+            for position, value in enumerate(sample["moments"]):
+                totals[position] += value
+
+    pooled = [sum(values) for values in zip(*moments.values())] or [0] * 6
+    pooled_ratio = pooled[2] / pooled[1] if pooled[1] else 0.0
+    ratios = {
+        file_type: totals[2] / totals[1] if totals[1] else pooled_ratio
+        for file_type, totals in moments.items()
+    }
+
+    unsampled: Dict[str, List[int]] = {}
+    for entry in entries:
+        sample = entry.get("token_sample")
+        if entry["tokens"] is not None or not sample:
+            continue
+        file_type = sample["file_type"]
+        unsampled_bytes = entry["size_bytes"] - sample["sampled_bytes"]
+        entry["tokens"] = sample["sampled_tokens"] + round(
+            ratios[file_type] * unsampled_bytes
+        )
+        totals = unsampled.setdefault(file_type, [0, 0])
+        totals[0] += unsampled_bytes
+        totals[1] += sample["chunks"] - sample["sampled_chunks"]
+
+    calibration = {}
+    for file_type, (unsampled_bytes, unsampled_chunks) in unsampled.items():
+        n, sum_b, _, sum_bb, sum_tt, sum_bt = moments[file_type]
+        r = ratios[file_type]
+        residual = sum_tt - 2 * r * sum_bt + r * r * sum_bb
+        variance = residual / (n - 1) if n > 1 else float(r * r * sum_bb)
+        bound = 1.96 * (
+            max(variance, 0.0) * (unsampled_chunks + unsampled_chunks**2 / max(n, 1))
+        ) ** 0.5
+        calibration[file_type] = {
+            "tokens_per_byte": round(r, 4),
+            "sampled_chunks": n,
+            "sampled_bytes": sum_b,
+            "estimated_bytes": unsampled_bytes,
+            "margin_tokens": round(bound),
+        }
+    return calibration
+
+
+class FileStatsCollector:
+    """Collects per-file size/token statistics, preserving submission order
+
+    Tokenization runs on a thread pool while the caller keeps parsing. The
+    number of buffers waiting to be tokenized is bounded, so memory stays
+    flat on large exports. With estimate, only a sample of each file is
+    encoded and the totals are extrapolated (see _resolve_token_estimates).
+    """
+
+    def __init__(
+        self,
+        token_encoder: Any,
+        threads: int = TOKEN_STATS_THREADS,
+        tracer: Tracer = NULL_TRACER,
+        estimate: bool = False,
+    ) -> None:
+        self.token_encoder = token_encoder
+        self.tracer = tracer
+        self.estimate = estimate
+        self.max_pending = threads * 2
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._entries: List[Union[Future, Dict[str, Any], None]] = []
+        self._pending: Set[Future] = set()
+
+    def submit(
+        self,
+        file_path: ItemPath,
+        content: Optional[bytes] = None,
+        on_result: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None,
+    ) -> Future:
+        """Tokenize a file (read from disk if content is None) in the background
+
+        on_result, if given, is called with the entry on the pool thread
+        before the future completes, so summarize() also waits for it.
+        """
+        if len(self._pending) >= self.max_pending:
+            _, self._pending = wait(self._pending, return_when=FIRST_COMPLETED)
+        future = self._executor.submit(self._stat_entry, file_path, content, on_result)
+        self._pending.add(future)
+        return future
+
+    def _stat_entry(
+        self,
+        file_path: ItemPath,
+        content: Optional[bytes],
+        on_result: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        with self.tracer.span("tokenize", "tokens", file=file_path.name):
+            entry = _file_stat_entry(self.token_encoder, file_path, content, self.estimate)
+        if on_result is not None:
+            on_result(entry)
+        return entry
+
+    def add(self, entry: Union[Future, Dict[str, Any], None]) -> None:
+        """Record a computed entry or a pending submit() result"""
+        self._entries.append(entry)
+
+    def summarize(self, label: str, file_count: int) -> Dict[str, Any]:
+        """Wait for pending work and build the statistics summary"""
+        stats: Dict[str, Any] = {
+            "label": label,
+            "file_count": file_count,
+            "files": [],
+            "total_size_bytes": 0,
+            "total_tokens": 0,
+        }
+
+        for entry in self._entries:
+            if isinstance(entry, Future):
+                entry = entry.result()
+            if entry is None:
+                continue
+            stats["files"].append(entry)
+            stats["total_size_bytes"] += entry["size_bytes"]
+
+        self.close()
+
+        # Entries may mix exact counts (e.g. cached) and sampled estimates
+        calibration = _resolve_token_estimates(stats["files"])
+        stats["total_tokens"] = sum(entry["tokens"] for entry in stats["files"])
+        stats["token_mode"] = "estimate" if calibration else "exact"
+        if calibration:
+            stats["token_calibration"] = calibration
+            stats["token_margin"] = round(
+                sum(c["margin_tokens"] ** 2 for c in calibration.values()) ** 0.5
+            )
+
+        stats["total_size_kb"] = round(stats["total_size_bytes"] / 1024, 2)
+        stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
+
+        return stats
+
+    def close(self) -> None:
+        """Wait for pending work and shut down the thread pool"""
+        self._executor.shutdown()
+
+
+# ============================================================
+# EXTRACTION CACHE
+# ============================================================
+
+
+class ExtractionCache:
+    """Content-addressed on-disk store of per-job extraction results
+
+    Entries are keyed by the SHA-256 of the parser version, the job name and
+    the raw .item bytes, so editing a job or upgrading the parser is a miss.
+    Results are pickled as plain builtins (records flattened to dicts),
+    so entries stay readable whichever way the parser module was imported.
+    An entry file holds two pickles: the extraction, then the file's token
+    statistics, which are often only known after the job was merged.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, file_path: ItemPath, content: bytes) -> str:
+        """Cache key for a job file's raw bytes"""
+        digest = hashlib.sha256()
+        digest.update(f"{PARSER_VERSION}\0{file_path.stem}\0".encode("utf-8"))
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached job result, or None if missing or unreadable"""
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                entry = pickle.load(f)
+                entry["file_stats"] = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        entry["sql"] = [ExtractedSQL(**sql) for sql in entry["sql"]]
+        entry["tmap"] = [TMapExpression(**tmap) for tmap in entry["tmap"]]
+        graph = (entry["summary"] or {}).get("dependency_graph")
+        if graph:
+            graph["components"] = {
+                name: ComponentNode(**node) for name, node in graph["components"].items()
+            }
+        return entry
+
+    def encode(self, job_result: Dict[str, Any]) -> bytes:
+        """Snapshot a job result (without its file statistics) for write()
+
+        Taken before the result is merged, since merging mutates it.
+        """
+        entry = {key: value for key, value in job_result.items() if key != "file_stats"}
+        entry["sql"] = [asdict(sql) for sql in job_result["sql"]]
+        entry["tmap"] = [asdict(tmap) for tmap in job_result["tmap"]]
+        summary = job_result["summary"]
+        if summary and summary.get("dependency_graph"):
+            graph = summary["dependency_graph"]
+            entry["summary"] = {
+                **summary,
+                "dependency_graph": {
+                    **graph,
+                    "components": {
+                        name: asdict(node) for name, node in graph["components"].items()
+                    },
+                },
+            }
+        return pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def write(
+        self, key: str, payload: bytes, file_stats: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Atomically write an encode()d job result and its file statistics"""
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                pickle.dump(file_stats, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+
+    def store(self, key: str, job_result: Dict[str, Any]) -> None:
+        """Atomically write a job result to the cache"""
+        self.write(key, self.encode(job_result), job_result.get("file_stats"))
+
+
+# ============================================================
+# STREAMING JSON OUTPUT
+# ============================================================
+
+
+class StreamedList:
+    """List-valued output section serialized item by item"""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+
+class StreamedDict:
+    """Dict-valued output section serialized entry by entry"""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[Tuple[str, Any]]) -> None:
+        self.items = items
+
+
+def materialize_section(value: Any) -> Any:
+    """Turn a streamed section into a plain list/dict"""
+    if isinstance(value, StreamedList):
+        return list(value.items)
+    if isinstance(value, StreamedDict):
+        return dict(value.items)
+    return value
+
+
+def write_json_stream(
+    f: IO[str], sections: Iterable[Tuple[str, Any]], indent: Optional[int] = 2
+) -> None:
+    """Write a top-level JSON object section by section
+
+    Produces the same text as json.dump(dict(sections), f, indent=indent,
+    default=str), but StreamedList/StreamedDict sections are encoded one
+    item at a time so the whole document is never held in memory. With
+    indent=None the output is compact (no whitespace).
+    """
+    separators = (",", ":") if indent is None else (",", ": ")
+
+    def encode(value: Any, level: int) -> str:
+        text = json.dumps(value, indent=indent, separators=separators, default=str)
+        if indent is None:
+            return text
+        # JSON strings never contain raw newlines, so this only re-indents
+        return text.replace("\n", "\n" + " " * (indent * level))
+
+    def open_item(level: int, first: bool) -> str:
+        lead = "" if first else separators[0]
+        if indent is None:
+            return lead
+        return lead + "\n" + " " * (indent * level)
+
+    def write_container(
+        items: Iterable[Any], brackets: str, level: int, keyed: bool
+    ) -> None:
+        empty = True
+        for item in items:
+            f.write(brackets[0] if empty else "")
+            f.write(open_item(level + 1, empty))
+            if keyed:
+                key, value = item
+                f.write(json.dumps(key) + separators[1])
+                write_value(value, level + 1)
+            else:
+                write_value(item, level + 1)
+            empty = False
+        if empty:
+            f.write(brackets)
+        else:
+            f.write(open_item(level, True) + brackets[1])
+
+    def write_value(value: Any, level: int) -> None:
+        if isinstance(value, StreamedList):
+            write_container(value.items, "[]", level, keyed=False)
+        elif isinstance(value, StreamedDict):
+            write_container(value.items, "{}", level, keyed=True)
+        else:
+            f.write(encode(value, level))
+
+    write_container(sections, "{}", 0, keyed=True)
+
+
+# ============================================================
+# DERIVED SECTION MEMOIZATION
+# ============================================================
+
+T = TypeVar("T")
+
+
+def _memoized_section(method: Callable[..., T]) -> Callable[..., T]:
+    """Compute a derived output section once per extraction state
+
+    The cached value is dropped by _invalidate_derived_sections(), which every
+    method that changes job data calls. Callers must treat the returned
+    section as read-only.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "TalendParserLLMOptimized") -> T:
+        if name not in self._derived_sections:
+            self._derived_sections[name] = method(self)
+        return self._derived_sections[name]
+
+    return wrapper
+
 
 # ============================================================
 # MAIN PARSER CLASS
@@ -103,9 +1984,49 @@ class TMapExpression:
 class TalendParserLLMOptimized:
     """Extract Talend jobs into LLM-optimized format"""
 
-    def __init__(self) -> None:
-        # Token encoder for statistics
-        self.token_encoder = tiktoken.get_encoding("cl100k_base")
+    def __init__(
+        self,
+        streaming: bool = False,
+        cache_dir: Optional[str] = None,
+        token_stats: bool = True,
+        intern_expressions: bool = False,
+        keep_raw_sql: bool = True,
+        tracer: Optional[Tracer] = None,
+        estimate_tokens: bool = False,
+        all_versions: bool = False,
+    ) -> None:
+        """
+        Args:
+            streaming: Parse each job with ET.iterparse, releasing every
+                top-level element once handled (bounds memory on huge files)
+            cache_dir: Directory for the incremental extraction cache; only
+                new or changed .item files are parsed when set
+            token_stats: Compute size/token statistics and write
+                token_statistics.txt
+            intern_expressions: Write each repeated tMap expression once to
+                a shared dictionary and refer to it by ID in transformations
+            keep_raw_sql: Keep ExtractedSQL.raw_sql after merging; when False
+                only cleaned_sql is retained (raw_sql is not in any output)
+            tracer: Records per-phase, per-job and per-extractor spans
+                (--trace); tracing is off when None
+            estimate_tokens: Estimate source/destination token statistics
+                from an exactly encoded sample instead of encoding every
+                byte (statistics report the mode and a 95% bound)
+            all_versions: Parse every saved version of a job; by default
+                only the latest version of each job is parsed
+        """
+        self.streaming = streaming
+        self.cache = ExtractionCache(Path(cache_dir)) if cache_dir else None
+        self.token_stats = token_stats
+        self.intern_expressions = intern_expressions
+        self.keep_raw_sql = keep_raw_sql
+        self.tracer = tracer or NULL_TRACER
+        self.estimate_tokens = estimate_tokens
+        self.all_versions = all_versions
+        self._stats_collector: Optional[FileStatsCollector] = None
+
+        # Kept job -> older saved versions skipped by parse_folder
+        self.superseded_versions: Dict[str, List[str]] = {}
 
         # Enhanced data type mapping from Talend to BigQuery
         self.type_mappings = {
@@ -172,12 +2093,26 @@ class TalendParserLLMOptimized:
             },
         }
 
+        self._reset_extraction_state()
+
+    @property
+    def token_encoder(self) -> Any:
+        """Token encoder for statistics and bundles, loaded on first use"""
+        return load_token_encoder()
+
+    def _reset_extraction_state(self) -> None:
+        """Initialize (or clear) all per-run extraction storage"""
+        self._derived_sections: Dict[str, Any] = {}
         self.jobs_summary: Dict[str, Dict[str, Any]] = {}
         self.all_sql: List[ExtractedSQL] = []
         self.all_tmap: List[TMapExpression] = []
         self.all_tables: Set[str] = set()
         self.context_mappings: Dict[str, Dict[str, str]] = {}
+        self.context_usage: Dict[str, Dict[str, Any]] = {}
         self.job_hierarchy: Dict[str, str] = {}
+        self.table_lineage = TableLineageGraph()
+        self.call_graph = JobCallGraph({})
+        self.job_ids: Dict[str, str] = {}
 
         # Enhanced extraction storage
         self.transaction_patterns: Dict[str, Dict[str, Any]] = {}
@@ -186,94 +2121,604 @@ class TalendParserLLMOptimized:
         self.performance_hints: Dict[str, Dict[str, Any]] = {}
         self.connection_metadata: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
-    def parse_folder(self, folder_path: str) -> Dict:
-        """Parse all Talend jobs in folder"""
+        # Non-job repository items: item type -> name -> index entry
+        self.repository_objects: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.metadata_index: Dict[str, Any] = {}
+
+        # Joblet name -> the joblet parsed once when indexed, and whether its
+        # own joblets were expanded (False while that is in progress)
+        self._joblet_templates: Dict[str, Dict[str, Any]] = {}
+        self._joblets_expanded: Dict[str, bool] = {}
+
+    def _invalidate_derived_sections(self) -> None:
+        """Drop memoized output sections after job data changed"""
+        self._derived_sections.clear()
+
+    def parse_folder(
+        self, folder_path: str, workers: int = 1, build_output: bool = True
+    ) -> Dict:
+        """Parse all Talend jobs in folder
+
+        Args:
+            folder_path: Directory containing Talend .item files, or a .zip
+                export (members are streamed from the archive in archive
+                order; with workers, each worker decompresses its own jobs)
+            workers: Number of worker processes (1 = parse serially in-process)
+            build_output: Return the full LLM output dict; pass False when only
+                write_outputs() is needed, so the dict is never materialized
+        """
         folder = Path(folder_path)
-        item_files = list(folder.rglob("*.item"))
+        item_files = list_item_files(folder)
 
         if not item_files:
             logger.warning(f"No .item files found in {folder_path}")
             return {}
 
-        logger.info(f"Processing {len(item_files)} Talend jobs")
+        if not self.all_versions:
+            with self.tracer.span("select_versions", items=len(item_files)):
+                item_files, self.superseded_versions = select_latest_versions(item_files)
+            skipped = sum(len(versions) for versions in self.superseded_versions.values())
+            if skipped:
+                logger.info(f"Skipping {skipped} superseded job versions (see --all-versions)")
+
+        # Metadata, contexts, joblets, routines, ... are indexed, not parsed as jobs
+        source_count = len(item_files)
+        with self.tracer.span("classify_items", items=source_count):
+            item_types = [classify_item(item_file, folder) for item_file in item_files]
+        repository_items = [
+            (item_file, item_type)
+            for item_file, item_type in zip(item_files, item_types)
+            if item_type != "job"
+        ]
+        item_files = [
+            item_file for item_file, item_type in zip(item_files, item_types) if item_type == "job"
+        ]
+
+        logger.info(
+            f"Processing {len(item_files)} Talend jobs"
+            + (f" and {len(repository_items)} repository items" if repository_items else "")
+        )
+
+        # Source file statistics are computed from the same buffers as parsing
+        if self.token_stats:
+            self._stats_collector = FileStatsCollector(
+                self.token_encoder, tracer=self.tracer, estimate=self.estimate_tokens
+            )
+
+        if repository_items:
+            with self.tracer.span("repository_items", items=len(repository_items)):
+                self._index_repository_items(repository_items)
 
-        # Calculate source file statistics
-        self.source_stats = self._calculate_file_stats(item_files, "Source")
+        with self.tracer.span("parse_jobs", jobs=len(item_files), workers=workers):
+            cached = 0
+            for job_result in self._iter_job_results(item_files, workers):
+                cached += job_result.pop("cache_hit", False)
+                self._merge_job_result(job_result)
+        if self.cache is not None:
+            logger.info(f"Extraction cache: {cached} cached, {len(item_files) - cached} parsed")
 
-        for item_file in item_files:
-            self._process_job(item_file)
+        # tRunJob references may carry only the called job's repository id
+        if any(info["child_jobs"] for info in self.jobs_summary.values()):
+            with self.tracer.span("job_ids", jobs=len(item_files)):
+                self.job_ids = job_repository_ids(item_files)
+
+        if self._stats_collector is not None:
+            with self.tracer.span("source_stats"):
+                self.source_stats = self._stats_collector.summarize("Source", source_count)
+            self._stats_collector = None
 
         # Post-processing
-        self._deduplicate_sql()
-        self._build_hierarchy()
-        self._create_context_mappings()
+        with self.tracer.span("deduplicate_sql"):
+            self._deduplicate_sql()
+        with self.tracer.span("build_hierarchy"):
+            self._build_hierarchy()
+        with self.tracer.span("context_mappings"):
+            self._create_context_mappings()
+
+        if not build_output:
+            return {}
+        with self.tracer.span("create_llm_output"):
+            return self._create_llm_output()
+
+    def _iter_job_results(
+        self, item_files: List[ItemPath], workers: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse (or load cached) jobs into self-contained results, in file order"""
+        if workers <= 1 or len(item_files) <= 1:
+            job_parser = type(self)(
+                streaming=self.streaming,
+                token_stats=False,
+                tracer=self.tracer,
+                estimate_tokens=self.estimate_tokens,
+            )
+            job_parser.cache = self.cache
+            file_stats = self._stats_collector.submit if self._stats_collector else None
+            for item_file in item_files:
+                yield job_parser.extract_job_file(item_file, file_stats)
+            return
 
-        return self._create_llm_output()
+        from concurrent.futures import ProcessPoolExecutor
 
-    def _calculate_file_stats(self, files: List[Path], label: str) -> Dict[str, Any]:
-        """Calculate size and token statistics for files"""
-        stats = {
-            "label": label,
-            "file_count": len(files),
-            "files": [],
-            "total_size_bytes": 0,
-            "total_tokens": 0,
-        }
+        logger.info(f"Parsing with {workers} worker processes")
+        chunksize = max(1, min(32, len(item_files) // (workers * 4)))
 
-        for file_path in files:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                self.streaming,
+                self._stats_collector is not None,
+                self.tracer.origin_ns if self.tracer.enabled else None,
+                self.estimate_tokens,
+                str(self.cache.cache_dir) if self.cache is not None else None,
+            ),
+        ) as executor:
+            # map() yields in submission order, so the merge is deterministic
+            for job_result in executor.map(
+                _parse_job_in_worker,
+                [
+                    item_file if isinstance(item_file, ArchiveMember) else str(item_file)
+                    for item_file in item_files
+                ],
+                chunksize=chunksize,
+            ):
+                self.tracer.extend(job_result.pop("trace_events", ()))
+                yield job_result
+
+    def extract_job_file(
+        self,
+        item_file: ItemPath,
+        file_stats: Optional[Callable[..., Any]] = None,
+    ) -> Dict[str, Any]:
+        """Parse one job file, or load its result from the extraction cache
+
+        The file is buffered once, and only when the cache key or the token
+        statistics need its bytes; otherwise the parser reads it directly.
+        file_stats(item_file, content, on_result) counts the file's tokens,
+        returning the entry (or a Future of it) and handing it to on_result
+        when done. A parsed job is written to the cache from there, so cache
+        writes never wait on tokenization.
+        """
+        cache = self.cache
+        content = None
+        if cache is not None or file_stats is not None:
+            content = _read_job_file(item_file)
+        key = None
+        if cache is not None and content is not None:
+            key = cache.key_for(item_file, content)
+            job_result = cache.load(key)
+            if job_result is not None:
+                job_result["cache_hit"] = True
+                # Cached statistics avoid re-tokenizing unchanged files; an
+                # estimate cached by an --estimate-tokens run is not exact
+                cached_stats = job_result["file_stats"]
+                if file_stats is not None:
+                    if cached_stats is None or (
+                        cached_stats["tokens"] is None and not self.estimate_tokens
+                    ):
+                        job_result["file_stats"] = file_stats(item_file, content)
+                    else:
+                        cached_stats.update(name=item_file.name, path=str(item_file))
+                return job_result
+
+        job_result = self.parse_job_isolated(item_file, content)
+        job_result["cache_hit"] = False
+        on_result = None
+        if cache is not None and key is not None:
+            on_result = functools.partial(cache.write, key, cache.encode(job_result))
+        if file_stats is not None and content is not None:
+            job_result["file_stats"] = file_stats(item_file, content, on_result)
+        elif on_result is not None:
+            on_result(None)
+        return job_result
+
+    def _index_repository_items(self, repository_items: List[Tuple[ItemPath, str]]) -> None:
+        """Index non-job items as shared repository objects (in-process)"""
+        self._invalidate_derived_sections()
+        for item_file, item_type in repository_items:
+            content = _read_job_file(item_file)
+            if content is None:
+                continue
             try:
-                # Read file content
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                size_bytes = len(content.encode("utf-8"))
+                name, entry = extract_repository_item(item_type, item_file, content)
+            except Exception as e:
+                logger.error(f"Error indexing {item_type} {item_file.name}: {e}")
+                continue
+            self.repository_objects.setdefault(item_type, {})[name] = entry
+            if item_type == "joblet":
+                # Decoded once: jobs splice this parse, the index lists its components
+                with self.tracer.span("joblet", "job", joblet=name):
+                    template = type(self)(
+                        streaming=self.streaming, token_stats=False, tracer=self.tracer
+                    ).parse_job_isolated(item_file, content)
+                self._joblet_templates[name] = template
+                entry.update(_joblet_index_entry(template))
+            if self._stats_collector is not None:
+                self._stats_collector.add(self._stats_collector.submit(item_file, content))
+
+        # Built once per run; jobs resolve their references against it on merge
+        self.metadata_index = build_metadata_index(self.repository_objects.get("metadata", {}))
+
+    def parse_job_isolated(
+        self, file_path: ItemPath, content: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """Parse a single job into a self-contained result
+
+        Clears this parser's extraction storage first, so the returned dicts
+        only hold data for ``file_path``. Used by worker processes.
+        """
+        self._reset_extraction_state()
+        self._process_job(file_path, content)
 
-                # Calculate tokens
-                tokens = len(self.token_encoder.encode(content))
+        return {
+            "job_name": file_path.stem,
+            "summary": self.jobs_summary.get(file_path.stem),
+            "sql": self.all_sql,
+            "tmap": self.all_tmap,
+            "tables": sorted(self.all_tables),
+            "context_mappings": self.context_mappings,
+            "context_usage": self.context_usage,
+            "transaction_patterns": self.transaction_patterns,
+            "error_patterns": self.error_patterns,
+            "data_quality_rules": self.data_quality_rules,
+            "performance_hints": self.performance_hints,
+            "connection_metadata": self.connection_metadata,
+            "file_stats": None,
+        }
 
-                stats["files"].append(
-                    {
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size_bytes": size_bytes,
-                        "size_kb": round(size_bytes / 1024, 2),
-                        "tokens": tokens,
-                    }
+    def _merge_job_result(self, job_result: Dict[str, Any]) -> None:
+        """Merge a per-job result with the same semantics as serial parsing"""
+        self._invalidate_derived_sections()
+        job_name = job_result["job_name"]
+
+        if job_result["summary"] is not None:
+            if self._joblet_templates:
+                self._expand_joblets(job_name, job_result)
+            self.jobs_summary[job_name] = job_result["summary"]
+            if self.metadata_index:
+                self._resolve_repository_references(job_name, job_result)
+
+        # Results from worker processes arrive as fresh, un-interned copies
+        for sql in job_result["sql"]:
+            sql.intern_names()
+            if not self.keep_raw_sql:
+                sql.raw_sql = ""
+        for tmap in job_result["tmap"]:
+            tmap.intern_names()
+        self.all_sql.extend(job_result["sql"])
+        self.all_tmap.extend(job_result["tmap"])
+        self.all_tables.update(job_result["tables"])
+
+        # Lineage is taken before SQL deduplication drops statements shared
+        # with other jobs; a re-parsed job replaces only its own edges
+        summary = job_result["summary"] or {}
+        reads, writes = job_table_access(
+            job_result["sql"], summary.get("component_tables", {})
+        )
+        self.table_lineage.set_job(job_name, reads, writes)
+
+        # Later jobs overwrite context defaults; first classification wins
+        self.context_mappings.update(job_result["context_mappings"])
+        for var_name, usage in job_result["context_usage"].items():
+            self.context_usage.setdefault(var_name, usage)
+
+        # Same-named jobs replace these sections...
+        self.transaction_patterns.update(job_result["transaction_patterns"])
+        self.performance_hints.update(job_result["performance_hints"])
+
+        # ...and accumulate into these
+        for job, patterns in job_result["error_patterns"].items():
+            self.error_patterns.setdefault(job, []).extend(patterns)
+        for job, rules in job_result["data_quality_rules"].items():
+            self.data_quality_rules.setdefault(job, {}).update(rules)
+        for job, metadata in job_result["connection_metadata"].items():
+            self.connection_metadata.setdefault(job, {}).update(metadata)
+
+        if self._stats_collector is not None:
+            self._stats_collector.add(job_result.get("file_stats"))
+
+    def _joblet_template(self, joblet: str) -> Optional[Dict[str, Any]]:
+        """Indexed joblet parse, its own joblets expanded on first use"""
+        template = self._joblet_templates[joblet]
+        if template["summary"] is None:
+            return None
+        if joblet not in self._joblets_expanded:
+            self._joblets_expanded[joblet] = False  # guards joblets embedding themselves
+            self._expand_joblets(template["job_name"], template)
+            self._joblets_expanded[joblet] = True
+        elif not self._joblets_expanded[joblet]:
+            return None
+        return template
+
+    def _expand_joblets(self, job_name: str, job_result: Dict[str, Any]) -> None:
+        """Splice every joblet instance of a job result into the job
+
+        Each instance component is replaced in the dependency graph by the
+        joblet's components, named "<instance>.<component>"; data entering
+        the instance goes to its tJobletInput and leaves from its
+        tJobletOutput. The joblet's SQL, tMap expressions and structures,
+        tables, child jobs, transaction groups, error handling, data quality
+        rules and connection metadata are added to the job under the same
+        names; its context variables are added where the job has none of
+        that name. Performance hints are job-level settings, so the host
+        job's stay in effect.
+        """
+        summary = job_result["summary"]
+        graph = summary.get("dependency_graph")
+        if not graph:
+            return
+        instances = [
+            (name, node.comp_type)
+            for name, node in graph["components"].items()
+            if node.comp_type in self._joblet_templates
+        ]
+        expanded = False
+        for instance, joblet in instances:
+            template = self._joblet_template(joblet)
+            if template is not None and template["summary"] is not None:
+                self._splice_joblet(job_name, job_result, instance, joblet, template)
+                expanded = True
+        if expanded:
+            graph["execution_order"] = self._component_execution_order(graph)
+            graph["model_boundaries"] = self._model_boundaries(graph)
+
+    def _splice_joblet(
+        self,
+        job_name: str,
+        job_result: Dict[str, Any],
+        instance: str,
+        joblet: str,
+        template: Dict[str, Any],
+    ) -> None:
+        """Replace one joblet instance component with a copy of the joblet"""
+        summary = job_result["summary"]
+        graph = summary["dependency_graph"]
+        joblet_summary = template["summary"]
+        joblet_graph = joblet_summary.get("dependency_graph") or {
+            "components": {},
+            "connections": [],
+            "execution_order": [],
+        }
+        prefix = f"{instance}."
+        names = {name: prefix + name for name in joblet_graph["components"]}
+
+        def boundary(component_type: str, fallback: int) -> Optional[str]:
+            for name, node in joblet_graph["components"].items():
+                if node.comp_type == component_type:
+                    return names[name]
+            order = joblet_graph["execution_order"]
+            return names[order[fallback]] if order else None
+
+        entry = boundary("tJobletInput", 0)
+        exit_ = boundary("tJobletOutput", -1)
+
+        def rewire(name: str, replacement: Optional[str]) -> str:
+            return replacement if name == instance and replacement else name
+
+        # Components, spliced in at the instance's position
+        components: Dict[str, ComponentNode] = {}
+        for name, node in graph["components"].items():
+            if name != instance:
+                node.inputs = [rewire(n, exit_) for n in node.inputs]
+                node.outputs = [rewire(n, entry) for n in node.outputs]
+                components[name] = node
+                continue
+            for inner, inner_node in joblet_graph["components"].items():
+                components[names[inner]] = ComponentNode(
+                    inner_node.comp_type,
+                    x=inner_node.x,
+                    y=inner_node.y,
+                    inputs=[names.get(n, n) for n in inner_node.inputs],
+                    outputs=[names.get(n, n) for n in inner_node.outputs],
                 )
+        graph["components"] = components
+
+        # Connections: the job's own, rewired to the joblet's boundary...
+        connections = []
+        for conn in graph["connections"]:
+            if conn["to"] == instance and entry:
+                conn = {**conn, "to": entry}
+                if (
+                    conn["type"] not in TRIGGER_CONNECTORS
+                    and conn["from"] not in components[entry].inputs
+                ):
+                    components[entry].inputs.append(conn["from"])
+            elif conn["from"] == instance and exit_:
+                conn = {**conn, "from": exit_}
+                if (
+                    conn["type"] not in TRIGGER_CONNECTORS
+                    and conn["to"] not in components[exit_].outputs
+                ):
+                    components[exit_].outputs.append(conn["to"])
+            connections.append(conn)
+        # ...and the joblet's internal ones
+        for conn in joblet_graph["connections"]:
+            connections.append(
+                {
+                    **conn,
+                    "from": names.get(conn["from"], conn["from"]),
+                    "to": names.get(conn["to"], conn["to"]),
+                }
+            )
+        graph["connections"] = connections
 
-                stats["total_size_bytes"] += size_bytes
-                stats["total_tokens"] += tokens
+        # Extracted records, attributed to this job under namespaced names
+        job_result["sql"].extend(
+            replace(sql, job_name=job_name, component_name=prefix + sql.component_name)
+            for sql in template["sql"]
+        )
+        job_result["tmap"].extend(
+            replace(tmap, job_name=job_name, component_name=prefix + tmap.component_name)
+            for tmap in template["tmap"]
+        )
+        job_result["tables"] = sorted(set(job_result["tables"]) | set(template["tables"]))
+
+        tmap_structures = summary.setdefault("tmap_structures", {})
+        for name, structure in joblet_summary.get("tmap_structures", {}).items():
+            tmap_structures[prefix + name] = {
+                **structure,
+                "input_schemas": dict(structure["input_schemas"]),
+                "output_schemas": dict(structure["output_schemas"]),
+            }
+        for name, references in joblet_summary.get("repository_components", {}).items():
+            summary["repository_components"][prefix + name] = references
+        for name, access in joblet_summary.get("component_tables", {}).items():
+            summary["component_tables"][prefix + name] = access
+        for ref in joblet_summary.get("repository_refs", []):
+            if ref not in summary["repository_refs"]:
+                summary["repository_refs"].append(ref)
+
+        summary["components"] += joblet_summary["components"] - 1
+        summary["sql_count"] += joblet_summary["sql_count"]
+        summary["tmap_count"] += joblet_summary["tmap_count"]
+        summary["tables"] = set(summary["tables"]) | set(joblet_summary["tables"])
+        summary["child_jobs"].extend(joblet_summary["child_jobs"])
+        summary["has_child_jobs"] = summary["has_child_jobs"] or joblet_summary["has_child_jobs"]
+        summary.setdefault("joblet_instances", {})[instance] = joblet
+
+        # Per-component sections of the joblet, keyed by the joblet's job name
+        joblet_job = template["job_name"]
+        for pattern in template["error_patterns"].get(joblet_job, []):
+            job_result["error_patterns"].setdefault(job_name, []).append(
+                {**pattern, "component": prefix + pattern["component"]}
+            )
+        for name, rules in template["data_quality_rules"].get(joblet_job, {}).items():
+            job_result["data_quality_rules"].setdefault(job_name, {})[prefix + name] = list(rules)
+        for name, metadata in template["connection_metadata"].get(joblet_job, {}).items():
+            job_result["connection_metadata"].setdefault(job_name, {})[prefix + name] = dict(
+                metadata
+            )
 
-            except Exception as e:
-                logger.warning(f"Error calculating stats for {file_path}: {e}")
+        joblet_transactions = template["transaction_patterns"].get(joblet_job)
+        if joblet_transactions:
+            transactions = job_result["transaction_patterns"].setdefault(
+                job_name, {"transaction_groups": []}
+            )
+            groups = transactions["transaction_groups"]
+            for group in joblet_transactions["transaction_groups"]:
+                group = {
+                    **group,
+                    "connection_component": prefix + group["connection_component"],
+                    "components": [
+                        {**component, "name": prefix + component["name"]}
+                        for component in group["components"]
+                    ],
+                }
+                if "end_component" in group:
+                    group["end_component"] = prefix + group["end_component"]
+                groups.append(group)
+            transactions["atomic_operations_required"] = sum(
+                1 for group in groups if group.get("requires_atomicity", False)
+            )
+            transactions["tables_requiring_atomicity"] = sorted(
+                set().union(*(group.get("tables_modified", []) for group in groups))
+            )
 
-        stats["total_size_kb"] = round(stats["total_size_bytes"] / 1024, 2)
-        stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
+        for var_name, mapping in template["context_mappings"].items():
+            job_result["context_mappings"].setdefault(var_name, mapping)
+        for var_name, usage in template["context_usage"].items():
+            job_result["context_usage"].setdefault(var_name, usage)
+
+    def _resolve_repository_references(self, job_name: str, job_result: Dict[str, Any]) -> None:
+        """Fill repository-configured schemas and connections of one job
+
+        Done on merge rather than while parsing, so cached and worker results
+        always resolve against this run's metadata index. A tMap input or
+        output schema missing from the job file is taken from the repository
+        schema of the component at the other end of that data connection;
+        connection components get their metadata connection's settings.
+        """
+        summary = job_result["summary"]
+        references = summary.get("repository_components")
+        if not references:
+            return
+        index = self.metadata_index
 
-        return stats
+        schemas = {
+            component: index[reference["schema"]]["columns"]
+            for component, reference in references.items()
+            if reference.get("schema") in index
+        }
+        graph = summary.get("dependency_graph") or {}
+        for tmap_name, structure in summary.get("tmap_structures", {}).items():
+            for conn in graph.get("connections", []):
+                if conn["type"] in TRIGGER_CONNECTORS:
+                    continue
+                if conn["to"] == tmap_name and conn["from"] in schemas:
+                    row = conn.get("label") or conn["from"]
+                    if not structure["input_schemas"].get(row):
+                        structure["input_schemas"][row] = [
+                            {"name": c["name"], "type": c["type"], "nullable": c["nullable"]}
+                            for c in schemas[conn["from"]]
+                        ]
+                elif conn["from"] == tmap_name and conn["to"] in schemas:
+                    row = conn.get("label") or conn["to"]
+                    if not structure["output_schemas"].get(row):
+                        structure["output_schemas"][row] = [
+                            {"name": c["name"], "type": c["type"], "expression": ""}
+                            for c in schemas[conn["to"]]
+                        ]
+
+        connections = job_result["connection_metadata"].get(job_name, {})
+        for component, reference in references.items():
+            connection = index.get(reference.get("property", ""))
+            if connection is not None and component in connections:
+                connections[component].setdefault("repository", connection)
 
-    def _process_job(self, file_path: Path) -> None:
-        """Process single job file"""
+    def _calculate_file_stats(self, files: List[Path], label: str) -> Dict[str, Any]:
+        """Calculate size and token statistics for files (exact or estimated)"""
+        collector = FileStatsCollector(
+            self.token_encoder, tracer=self.tracer, estimate=self.estimate_tokens
+        )
+        for file_path in files:
+            collector.add(collector.submit(file_path))
+        return collector.summarize(label, len(files))
+
+    def _process_job(self, file_path: ItemPath, content: Optional[bytes] = None) -> None:
+        """Process single job file (from its already-read bytes if given)"""
         job_name = file_path.stem
         logger.info(f"Processing: {job_name}")
+        self._invalidate_derived_sections()
+
+        with self.tracer.span("job", "job", job=job_name):
+            if content is not None:
+                self._process_job_source(io.BytesIO(content), job_name)
+            elif isinstance(file_path, ArchiveMember):
+                # Decompressed incrementally as the parser consumes it
+                with file_path.open("rb") as source:
+                    self._process_job_source(source, job_name)
+            else:
+                self._process_job_source(file_path, job_name)
 
+    def _process_job_source(self, source: Union[Path, IO[bytes]], job_name: str) -> None:
+        """Extract one job from its file or buffer (tree or streaming path)"""
         try:
-            tree = ET.parse(file_path)
+            if self.streaming:
+                self._process_job_streaming(source, job_name)
+                return
+
+            with self.tracer.span("ET.parse", "xml"):
+                tree = ET.parse(source)
             root = tree.getroot()
 
             # Initialize job summary
-            self.jobs_summary[job_name] = {
-                "components": 0,
-                "sql_count": 0,
-                "tmap_count": 0,
-                "tables": set(),
-                "has_child_jobs": False,
-            }
+            self._init_job_summary(job_name)
 
-            # Extract components
+            # Extract components (each decoded once, shared with transactions)
+            transaction_state = self._new_transaction_state()
             for node in root.findall(".//node"):
-                self._process_component(node, job_name)
+                component = DecodedComponent(node)
+                self._process_component(component, job_name)
+                self._track_transaction_component(transaction_state, component)
+
+            # Component DAG from the process-level connections
+            with self.tracer.span("dependency_graph", "extractor"):
+                self._finish_dependency_graph(
+                    job_name, [dict(conn.attrib) for conn in root.findall("connection")]
+                )
 
             # Extract transaction patterns for this job
-            transaction_info = self._detect_transaction_patterns(root, job_name)
+            transaction_info = self._finish_transaction_patterns(transaction_state)
             if transaction_info and transaction_info.get("transaction_groups"):
                 self.transaction_patterns[job_name] = transaction_info
 
@@ -284,25 +2729,128 @@ class TalendParserLLMOptimized:
 
             # Extract context variables
             for context in root.findall(".//context"):
-                for param in context.findall(".//contextParameter"):
-                    var_name = param.get("name", "")
-                    var_type = param.get("type", "")
-                    var_value = param.get("value", "")
-
-                    if var_name:
-                        self.context_mappings[var_name] = {
-                            "type": var_type,
-                            "default": var_value,
-                            "dbt_mapping": self._map_to_dbt(var_name, var_type),
-                        }
+                self._extract_context_variables(context, job_name)
 
         except Exception as e:
             logger.error(f"Error processing {job_name}: {e}")
 
-    def _process_component(self, node: ET.Element, job_name: str) -> None:
+    def _process_job_streaming(self, source: Union[Path, IO[bytes]], job_name: str) -> None:
+        """Process a job with iterparse, handling each element as it closes
+
+        Every top-level element (<node>, <connection>, <context>, <subjob>,
+        screenshots, ...) is detached from the root once it has been handled,
+        so peak memory is bounded by the largest single element rather than
+        the whole file. Produces the same extraction as the tree-based path;
+        a file that turns out to be malformed is rolled back, so like a tree
+        parse that fails it leaves no partial job behind.
+        """
+        checkpoint = self._extraction_checkpoint()
+        self._init_job_summary(job_name)
+        transaction_state = self._new_transaction_state()
+        perf_hints = self._new_performance_hints()
+        connections: List[Dict[str, str]] = []
+
+        root = None
+        depth = 0
+        try:
+            for event, elem in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if elem.tag == "elementParameter":
+                    self._apply_performance_hint(perf_hints, elem)
+                elif elem.tag == "node":
+                    component = DecodedComponent(elem)
+                    self._process_component(component, job_name)
+                    self._track_transaction_component(transaction_state, component)
+                elif elem.tag == "context":
+                    self._extract_context_variables(elem, job_name)
+                elif elem.tag == "connection" and depth == 1:
+                    connections.append(dict(elem.attrib))
+
+                # Release top-level elements once handled
+                if depth == 1 and root is not None:
+                    root.remove(elem)
+        except ET.ParseError:
+            self._rollback_extraction(job_name, checkpoint)
+            raise
+
+        with self.tracer.span("dependency_graph", "extractor"):
+            self._finish_dependency_graph(job_name, connections)
+
+        transaction_info = self._finish_transaction_patterns(transaction_state)
+        if transaction_info.get("transaction_groups"):
+            self.transaction_patterns[job_name] = transaction_info
+
+        finished_hints = self._finish_performance_hints(perf_hints)
+        if finished_hints:
+            self.performance_hints[job_name] = finished_hints
+
+    def _extraction_checkpoint(self) -> Dict[str, Any]:
+        """State a streamed job extends in place, for _rollback_extraction"""
+        return {
+            "sql": len(self.all_sql),
+            "tmap": len(self.all_tmap),
+            "tables": set(self.all_tables),
+            "context_mappings": dict(self.context_mappings),
+        }
+
+    def _rollback_extraction(self, job_name: str, checkpoint: Dict[str, Any]) -> None:
+        """Drop everything extracted for a job since the checkpoint"""
+        del self.all_sql[checkpoint["sql"] :]
+        del self.all_tmap[checkpoint["tmap"] :]
+        self.all_tables = checkpoint["tables"]
+        self.context_mappings = checkpoint["context_mappings"]
+        for section in (
+            self.jobs_summary,
+            self.error_patterns,
+            self.data_quality_rules,
+            self.connection_metadata,
+        ):
+            section.pop(job_name, None)
+
+    def _init_job_summary(self, job_name: str) -> None:
+        """Initialize (or reset) the summary entry for a job"""
+        self.jobs_summary[job_name] = {
+            "components": 0,
+            "sql_count": 0,
+            "tmap_count": 0,
+            "tables": set(),
+            "has_child_jobs": False,
+            "child_jobs": [],
+            "repository_refs": [],
+            "repository_components": {},
+            "component_tables": {},
+        }
+
+    def _extract_context_variables(self, context: ET.Element, job_name: str) -> None:
+        """Extract context variables from a <context> element"""
+        repository_refs = self.jobs_summary[job_name]["repository_refs"]
+        for param in context.findall(".//contextParameter"):
+            var_name = param.get("name", "")
+            var_type = param.get("type", "")
+            var_value = param.get("value", "")
+
+            # Variables imported from a repository context group
+            context_id = param.get("repositoryContextId")
+            if context_id and context_id not in repository_refs:
+                repository_refs.append(context_id)
+
+            if var_name:
+                self.context_mappings[var_name] = {
+                    "type": var_type,
+                    "default": var_value,
+                    "dbt_mapping": self._map_to_dbt(var_name, var_type),
+                }
+
+    def _process_component(self, component: DecodedComponent, job_name: str) -> None:
         """Process individual component with dependency tracking"""
-        comp_type = node.get("componentName", "")
-        comp_name = node.get("uniqueName", "")
+        comp_type = component.comp_type
+        comp_name = component.comp_name
 
         # Build component dependency graph
         if "dependency_graph" not in self.jobs_summary[job_name]:
@@ -313,17 +2861,32 @@ class TalendParserLLMOptimized:
                 "model_boundaries": [],
             }
 
-        # Track component metadata
-        self.jobs_summary[job_name]["dependency_graph"]["components"][comp_name] = {
-            "type": comp_type,
-            "inputs": [],
-            "outputs": [],
-            "position": {"x": node.get("posX", 0), "y": node.get("posY", 0)},
+        # Track component metadata
+        self.jobs_summary[job_name]["dependency_graph"]["components"][comp_name] = (
+            ComponentNode(
+                comp_type,
+                x=component.node.get("posX", 0),
+                y=component.node.get("posY", 0),
+            )
+        )
+
+        # Metadata connection (PROPERTY) and table schema (SCHEMA) the
+        # component is configured from, resolved when the job is merged
+        references = {
+            kind.lower(): component.repository_value(kind) for kind in ("PROPERTY", "SCHEMA")
         }
+        references = {kind: ref for kind, ref in references.items() if ref}
+        if references:
+            job_info = self.jobs_summary[job_name]
+            job_info["repository_components"][comp_name] = references
+            for ref in references.values():
+                repository_id = ref.partition(" - ")[0]
+                if repository_id not in job_info["repository_refs"]:
+                    job_info["repository_refs"].append(repository_id)
 
         # Process connections to build dependency graph
-        for elem_param in node.findall('.//elementParameter[@field="TABLE"]'):
-            if elem_param.get("name") == "CONNECTION":
+        for elem_param in component.params("CONNECTION"):
+            if elem_param.get("field") == "TABLE":
                 for item in elem_param.findall(".//elementValue"):
                     connection = item.get("value", "")
                     conn_type = item.get("elementRef", "CONNECTION_TYPE")
@@ -337,11 +2900,12 @@ class TalendParserLLMOptimized:
                         if conn_type in ["FLOW_MAIN", "FLOW"]:
                             self.jobs_summary[job_name]["dependency_graph"][
                                 "components"
-                            ][comp_name]["outputs"].append(connection)
+                            ][comp_name].outputs.append(connection)
 
         # Handle special components that need extraction before exclusion
         if comp_type in ["tDie", "tWarn", "tLogRow"]:
-            self._extract_error_handling(node, job_name, comp_name, comp_type)
+            with self.tracer.span("error_handling", "extractor", component=comp_name):
+                self._extract_error_handling(component, job_name)
             # Don't count these as regular components
             return
 
@@ -356,7 +2920,8 @@ class TalendParserLLMOptimized:
             "tRedshiftRollback",
         ]:
             # Extract connection metadata but don't count as components
-            conn_meta = self._extract_connection_metadata(node)
+            with self.tracer.span("connection_metadata", "extractor", component=comp_name):
+                conn_meta = self._extract_connection_metadata(component)
             if conn_meta:
                 if job_name not in self.connection_metadata:
                     self.connection_metadata[job_name] = {}
@@ -372,33 +2937,193 @@ class TalendParserLLMOptimized:
         # Check for child jobs
         if comp_type == "tRunJob":
             self.jobs_summary[job_name]["has_child_jobs"] = True
+            child_job = self._extract_child_job_reference(component)
+            if child_job:
+                self.jobs_summary[job_name]["child_jobs"].append(child_job)
 
         # Extract SQL
-        self._extract_sql(node, job_name, comp_name, comp_type)
+        with self.tracer.span("sql", "extractor", component=comp_name):
+            self._extract_sql(component, job_name)
+
+        # Tables an input/output component reads or writes through its settings
+        if "Input" in comp_type or "Output" in comp_type:
+            tables = self._extract_tables_from_component(component)
+            if tables:
+                self.jobs_summary[job_name]["component_tables"][comp_name] = {
+                    "operation": self._detect_operation_from_component(component),
+                    "tables": tables,
+                }
 
         # Extract tMap
         if comp_type == "tMap":
-            self._extract_tmap_enhanced(node, job_name, comp_name)
+            with self.tracer.span("tmap", "extractor", component=comp_name):
+                self._extract_tmap_enhanced(component, job_name)
 
         # Extract data quality rules
         if comp_type in ["tSchemaComplianceCheck", "tFilterRow", "tAggregateRow"]:
-            self._extract_data_quality_rules(node, job_name, comp_name, comp_type)
+            with self.tracer.span("data_quality", "extractor", component=comp_name):
+                self._extract_data_quality_rules(component, job_name)
 
-    def _extract_sql(
-        self, node: ET.Element, job_name: str, comp_name: str, comp_type: str
+    def _finish_dependency_graph(
+        self, job_name: str, connections: List[Dict[str, str]]
     ) -> None:
+        """Add process-level connections, execution order and model boundaries
+
+        Args:
+            job_name: Job whose dependency_graph is completed
+            connections: Attributes of each process-level <connection>
+                (source, target, connectorName, label)
+        """
+        graph = self.jobs_summary[job_name].get("dependency_graph")
+        if not graph:
+            return
+        components = graph["components"]
+
+        for conn in connections:
+            source = conn.get("source", "")
+            target = conn.get("target", "")
+            if source not in components or target not in components:
+                continue
+            conn_type = conn.get("connectorName", "FLOW")
+            entry = {"from": source, "to": target, "type": conn_type}
+            if conn.get("label"):
+                entry["label"] = conn["label"]
+            graph["connections"].append(entry)
+
+            if conn_type not in TRIGGER_CONNECTORS:
+                if target not in components[source].outputs:
+                    components[source].outputs.append(target)
+                if source not in components[target].inputs:
+                    components[target].inputs.append(source)
+
+        graph["execution_order"] = self._component_execution_order(graph)
+        graph["model_boundaries"] = self._model_boundaries(graph)
+
+    def _component_execution_order(self, graph: Dict[str, Any]) -> List[str]:
+        """Topological order of a job's components (Kahn, O(V + E))
+
+        Ties keep document order; components caught in a cycle are appended
+        in document order.
+        """
+        components = graph["components"]
+        successors: Dict[str, Dict[str, None]] = {name: {} for name in components}
+        in_degree = dict.fromkeys(components, 0)
+        for conn in graph["connections"]:
+            source, target = conn["from"], conn["to"]
+            if (
+                source in successors
+                and target in successors
+                and source != target
+                and target not in successors[source]
+            ):
+                successors[source][target] = None
+                in_degree[target] += 1
+
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for target in successors[name]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+
+        if len(order) < len(components):
+            placed = set(order)
+            order.extend(name for name in components if name not in placed)
+        return order
+
+    def _model_boundaries(self, graph: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Subjobs (components joined by data flows) as candidate models
+
+        Each boundary lists its components in execution order (the CTE
+        order), its output points (components with no outgoing data flow)
+        and the trigger connections from other subjobs that start it.
+        """
+        components = graph["components"]
+        parent = {name: name for name in components}
+
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        for name, node in components.items():
+            for target in node.outputs:
+                if target in parent:
+                    parent[find(target)] = find(name)
+
+        subjobs: Dict[str, List[str]] = {}
+        for name in graph["execution_order"]:
+            subjobs.setdefault(find(name), []).append(name)
+        start_of = {root: members[0] for root, members in subjobs.items()}
+
+        triggers: DefaultDict[str, List[Dict[str, str]]] = defaultdict(list)
+        for conn in graph["connections"]:
+            source, target = conn["from"], conn["to"]
+            if conn["type"] in TRIGGER_CONNECTORS and source in parent and target in parent:
+                if find(source) != find(target):
+                    triggers[find(target)].append(
+                        {"from": start_of[find(source)], "type": conn["type"]}
+                    )
+
+        return [
+            {
+                "start": members[0],
+                "components": members,
+                "outputs": [
+                    name
+                    for name in members
+                    if not any(target in parent for target in components[name].outputs)
+                ],
+                "triggered_by": triggers.get(root, []),
+            }
+            for root, members in subjobs.items()
+        ]
+
+    def _extract_child_job_reference(self, component: DecodedComponent) -> str:
+        """Name (or repository id) of the job a tRunJob invokes
+
+        The PROCESS name, else the job's repository id (PROCESS_TYPE_PROCESS),
+        which JobCallGraph maps back to a job name. A pinned
+        PROCESS_TYPE_VERSION is appended the way job item files are named
+        (Child_Load_0.1); "Latest" leaves the bare name.
+        """
+        reference = ""
+        for value in (
+            component.value("PROCESS"),
+            component.group_value("PROCESS", "PROCESS_TYPE_PROCESS"),
+        ):
+            value = (value or "").strip('"')
+            if value and value != "null":
+                reference = value
+                break
+        if not reference:
+            return ""
+
+        version = (component.group_value("PROCESS", "PROCESS_TYPE_VERSION") or "").strip('"')
+        if re.fullmatch(r"\d+(?:\.\d+)*", version):
+            return f"{reference}_{version}"
+        return reference
+
+    def _extract_sql(self, component: DecodedComponent, job_name: str) -> None:
         """Extract SQL with enhanced pattern detection"""
+        comp_name = component.comp_name
+        comp_type = component.comp_type
         sql_params = ["QUERY", "DBTABLE", "TABLE", "DBQUERY", "SQL_QUERY", "QUERY_BAND"]
 
         for param_name in sql_params:
-            for elem in node.findall(f".//elementParameter[@name='{param_name}']"):
+            for elem in component.params(param_name):
                 sql_raw = elem.get("value", "")
                 if sql_raw and sql_raw != '""' and sql_raw != "null":
                     # Clean SQL
                     sql_cleaned = self._clean_sql(sql_raw)
 
                     # Extract tables with improved regex
-                    tables = self._extract_tables(sql_cleaned)
+                    with self.tracer.span("extract_tables", "extractor"):
+                        tables = self._extract_tables(sql_cleaned)
 
                     # Extract context variables
                     context_vars = self._extract_context_vars(sql_cleaned)
@@ -423,12 +3148,12 @@ class TalendParserLLMOptimized:
                     self.jobs_summary[job_name]["tables"].update(tables)
                     self.all_tables.update(tables)
 
-    def _extract_tmap_enhanced(
-        self, node: ET.Element, job_name: str, comp_name: str
-    ) -> None:
+    def _extract_tmap_enhanced(self, component: DecodedComponent, job_name: str) -> None:
         """Enhanced tMap extraction with complete lookup patterns and priorities"""
+        comp_name = component.comp_name
+
         # Call original extraction for backward compatibility
-        self._extract_tmap(node, job_name, comp_name)
+        self._extract_tmap(component, job_name)
 
         # Add enhanced lookup extraction
         tmap_structure = (
@@ -436,17 +3161,17 @@ class TalendParserLLMOptimized:
         )
         if tmap_structure:
             # Extract enhanced lookups with priorities
-            lookups_enhanced = self._extract_enhanced_lookups(node)
+            lookups_enhanced = self._extract_enhanced_lookups(component)
             tmap_structure["lookups_enhanced"] = lookups_enhanced
 
             # Store back the enhanced structure
             self.jobs_summary[job_name]["tmap_structures"][comp_name] = tmap_structure
 
-    def _extract_enhanced_lookups(self, node: ET.Element) -> List[Dict]:
+    def _extract_enhanced_lookups(self, component: DecodedComponent) -> List[Dict]:
         """Extract complete lookup patterns with priorities and fallback logic"""
         lookups_with_priority = []
 
-        for node_data in node.findall(".//nodeData"):
+        for node_data in component.node_data:
             for idx, input_table in enumerate(node_data.findall(".//inputTables")):
                 lookup_info = {
                     "table": input_table.get("name", ""),
@@ -484,8 +3209,9 @@ class TalendParserLLMOptimized:
 
         return lookups_with_priority
 
-    def _extract_tmap(self, node: ET.Element, job_name: str, comp_name: str) -> None:
+    def _extract_tmap(self, component: DecodedComponent, job_name: str) -> None:
         """Extract tMap transformations with deep expression parsing"""
+        comp_name = component.comp_name
 
         # Initialize tMap structure with complete schemas
         tmap_structure: Dict[str, Any] = {
@@ -498,7 +3224,7 @@ class TalendParserLLMOptimized:
         }
 
         # Extract input and output schemas
-        for metadata in node.findall(".//metadata[@connector='FLOW']"):
+        for metadata in component.metadata_for("FLOW"):
             table_name = metadata.get("name", "default")
             tmap_structure["input_schemas"][table_name] = []
             for column in metadata.findall(".//column"):
@@ -510,7 +3236,7 @@ class TalendParserLLMOptimized:
                     }
                 )
 
-        for metadata in node.findall(".//metadata[@connector='OUTPUT']"):
+        for metadata in component.metadata_for("OUTPUT"):
             table_name = metadata.get("name", "default")
             tmap_structure["output_schemas"][table_name] = []
             for column in metadata.findall(".//column"):
@@ -523,7 +3249,7 @@ class TalendParserLLMOptimized:
                 )
 
         # Extract filters, lookups, and reject conditions
-        for node_data in node.findall(".//nodeData"):
+        for node_data in component.node_data:
             # Extract filter expressions
             for filter_elem in node_data.findall(".//filterIncomingConnections"):
                 filter_expr = filter_elem.get("value", "")
@@ -573,7 +3299,7 @@ class TalendParserLLMOptimized:
                         }
 
         # Continue with existing extraction logic for expressions
-        for metadata in node.findall(".//metadata"):
+        for metadata in component.metadata:
             for column in metadata.findall(".//column"):
                 expression = column.get("expression", "")
                 if expression and expression != column.get("name", ""):
@@ -589,7 +3315,7 @@ class TalendParserLLMOptimized:
                     self.jobs_summary[job_name]["tmap_count"] += 1
 
         # Parse node data for detailed mappings
-        for node_data in node.findall(".//nodeData"):
+        for node_data in component.node_data:
             for var_table in node_data.findall(".//varTables"):
                 for mapping in var_table.findall(".//mapperTableEntries"):
                     expression = mapping.get("expression", "")
@@ -611,108 +3337,111 @@ class TalendParserLLMOptimized:
             self.jobs_summary[job_name]["tmap_structures"] = {}
         self.jobs_summary[job_name]["tmap_structures"][comp_name] = tmap_structure
 
-    def _detect_transaction_patterns(self, root: ET.Element, job_name: str) -> Dict:
-        """Detect transaction boundaries and atomic operation groups"""
-        transaction_groups = []
-        current_transaction = None
-        components_by_name = {}
-
-        # First pass: Build component index
-        for node in root.findall(".//node"):
-            comp_name = node.get("uniqueName", "")
-            comp_type = node.get("componentName", "")
-            components_by_name[comp_name] = {"type": comp_type, "node": node}
-
-        # Second pass: Detect transaction boundaries
-        for node in root.findall(".//node"):
-            comp_type = node.get("componentName", "")
-            comp_name = node.get("uniqueName", "")
-
-            # Detect transaction start
-            if comp_type in ["tDBConnection", "tRedshiftConnection"]:
-                # Extract connection settings
-                auto_commit = node.find(".//elementParameter[@name='AUTO_COMMIT']")
-                use_batch = node.find(".//elementParameter[@name='USE_BATCH']")
-                batch_size = node.find(".//elementParameter[@name='BATCH_SIZE']")
-
-                current_transaction = {
-                    "connection_component": comp_name,
-                    "auto_commit": (
-                        auto_commit.get("value", "true")
-                        if auto_commit is not None
-                        else "true"
-                    ),
-                    "use_batch": (
-                        use_batch.get("value", "false")
-                        if use_batch is not None
-                        else "false"
-                    ),
-                    "batch_size": (
-                        int(batch_size.get("value", "0"))
-                        if batch_size is not None
-                        else 0
-                    ),
-                    "components": [],
-                    "tables_modified": set(),
-                    "requires_atomicity": False,
+    def _new_transaction_state(self) -> Dict[str, Any]:
+        """Create the incremental state used by _track_transaction_component"""
+        return {"transaction_groups": [], "current_transaction": None}
+
+    def _track_transaction_component(
+        self, state: Dict[str, Any], component: DecodedComponent
+    ) -> None:
+        """Advance transaction detection by one component (document order)"""
+        transaction_groups = state["transaction_groups"]
+        current_transaction = state["current_transaction"]
+
+        comp_type = component.comp_type
+        comp_name = component.comp_name
+
+        # Detect transaction start
+        if comp_type in ["tDBConnection", "tRedshiftConnection"]:
+            # Extract connection settings
+            auto_commit = component.param("AUTO_COMMIT")
+            use_batch = component.param("USE_BATCH")
+            batch_size = component.param("BATCH_SIZE")
+
+            state["current_transaction"] = {
+                "connection_component": comp_name,
+                "auto_commit": (
+                    auto_commit.get("value", "true")
+                    if auto_commit is not None
+                    else "true"
+                ),
+                "use_batch": (
+                    use_batch.get("value", "false")
+                    if use_batch is not None
+                    else "false"
+                ),
+                "batch_size": (
+                    int(batch_size.get("value", "0"))
+                    if batch_size is not None
+                    else 0
+                ),
+                "components": [],
+                "tables_modified": set(),
+                "requires_atomicity": False,
+            }
+
+        # Track components within transaction
+        elif current_transaction and comp_type in [
+            "tDBInput",
+            "tDBOutput",
+            "tDBRow",
+            "tRedshiftInput",
+            "tRedshiftOutput",
+            "tRedshiftRow",
+        ]:
+            # Get SQL operation
+            sql_operation = self._detect_operation_from_component(component)
+            tables = self._extract_tables_from_component(component)
+
+            current_transaction["components"].append(
+                {
+                    "name": comp_name,
+                    "type": comp_type,
+                    "operation": sql_operation,
+                    "tables": tables,
                 }
+            )
 
-            # Track components within transaction
-            elif current_transaction and comp_type in [
-                "tDBInput",
-                "tDBOutput",
-                "tDBRow",
-                "tRedshiftInput",
-                "tRedshiftOutput",
-                "tRedshiftRow",
-            ]:
-                # Get SQL operation
-                sql_operation = self._detect_operation_from_component(node)
-                tables = self._extract_tables_from_component(node)
-
-                current_transaction["components"].append(
-                    {
-                        "name": comp_name,
-                        "type": comp_type,
-                        "operation": sql_operation,
-                        "tables": tables,
-                    }
+            # Mark as requiring atomicity if modifying data
+            if sql_operation in ["INSERT", "UPDATE", "DELETE", "MERGE"]:
+                current_transaction["requires_atomicity"] = True
+                current_transaction["tables_modified"].update(tables)
+
+        # Detect transaction end
+        elif comp_type in [
+            "tDBCommit",
+            "tDBRollback",
+            "tDBClose",
+            "tRedshiftCommit",
+            "tRedshiftRollback",
+            "tRedshiftClose",
+        ]:
+            if current_transaction:
+                current_transaction["end_component"] = comp_name
+                current_transaction["transaction_type"] = (
+                    "COMMIT"
+                    if "Commit" in comp_type
+                    else "ROLLBACK" if "Rollback" in comp_type else "CLOSE"
+                )
+                current_transaction["tables_modified"] = sorted(
+                    current_transaction["tables_modified"]
                 )
+                transaction_groups.append(current_transaction)
+                state["current_transaction"] = None
 
-                # Mark as requiring atomicity if modifying data
-                if sql_operation in ["INSERT", "UPDATE", "DELETE", "MERGE"]:
-                    current_transaction["requires_atomicity"] = True
-                    current_transaction["tables_modified"].update(tables)
-
-            # Detect transaction end
-            elif comp_type in [
-                "tDBCommit",
-                "tDBRollback",
-                "tDBClose",
-                "tRedshiftCommit",
-                "tRedshiftRollback",
-                "tRedshiftClose",
-            ]:
-                if current_transaction:
-                    current_transaction["end_component"] = comp_name
-                    current_transaction["transaction_type"] = (
-                        "COMMIT"
-                        if "Commit" in comp_type
-                        else "ROLLBACK" if "Rollback" in comp_type else "CLOSE"
-                    )
-                    current_transaction["tables_modified"] = list(
-                        current_transaction["tables_modified"]
-                    )
-                    transaction_groups.append(current_transaction)
-                    current_transaction = None
+    def _finish_transaction_patterns(self, state: Dict[str, Any]) -> Dict:
+        """Close any open transaction and summarize the detected groups"""
+        transaction_groups = state["transaction_groups"]
+        current_transaction = state["current_transaction"]
 
         # Handle unclosed transaction
         if current_transaction:
             current_transaction["transaction_type"] = "IMPLICIT_COMMIT"
-            current_transaction["tables_modified"] = list(
+            current_transaction["tables_modified"] = sorted(
                 current_transaction["tables_modified"]
             )
             transaction_groups.append(current_transaction)
+            state["current_transaction"] = None
 
         return {
             "transaction_groups": transaction_groups,
@@ -720,7 +3449,7 @@ class TalendParserLLMOptimized:
                 [t for t in transaction_groups if t.get("requires_atomicity", False)]
             ),
             "tables_requiring_atomicity": (
-                list(
+                sorted(
                     set().union(
                         *[set(t.get("tables_modified", [])) for t in transaction_groups]
                     )
@@ -730,16 +3459,16 @@ class TalendParserLLMOptimized:
             ),
         }
 
-    def _detect_operation_from_component(self, node: ET.Element) -> str:
+    def _detect_operation_from_component(self, component: DecodedComponent) -> str:
         """Detect SQL operation type from component configuration"""
-        comp_type = node.get("componentName", "")
+        comp_type = component.comp_type
 
         # Direct mapping for obvious components
         if "Input" in comp_type:
             return "SELECT"
         elif "Output" in comp_type:
             # Check for specific operation
-            action = node.find(".//elementParameter[@name='DATA_ACTION']")
+            action = component.param("DATA_ACTION")
             if action is not None:
                 action_value = action.get("value", "INSERT").upper()
                 if "INSERT" in action_value:
@@ -754,44 +3483,45 @@ class TalendParserLLMOptimized:
 
         # Check for SQL in tDBRow
         if "Row" in comp_type:
-            query = node.find(".//elementParameter[@name='QUERY']")
+            query = component.param("QUERY")
             if query is not None:
                 sql = query.get("value", "")
                 return self._detect_operation(sql)
 
         return "UNKNOWN"
 
-    def _extract_tables_from_component(self, node: ET.Element) -> List[str]:
+    def _extract_tables_from_component(self, component: DecodedComponent) -> List[str]:
         """Extract table names from a component"""
         tables = []
 
         # Check for table parameter
-        table_param = node.find(".//elementParameter[@name='TABLE']")
+        table_param = component.param("TABLE")
         if table_param is not None:
             table = table_param.get("value", "").strip('"')
             if table and table != "null":
-                tables.append(table)
+                tables.append(normalize_table_name(table))
 
         # Check for DBTABLE parameter
-        dbtable_param = node.find(".//elementParameter[@name='DBTABLE']")
+        dbtable_param = component.param("DBTABLE")
         if dbtable_param is not None:
             table = dbtable_param.get("value", "").strip('"')
             if table and table != "null":
-                tables.append(table)
+                tables.append(normalize_table_name(table))
 
         # Check for SQL query
-        query_param = node.find(".//elementParameter[@name='QUERY']")
+        query_param = component.param("QUERY")
         if query_param is not None:
             sql = query_param.get("value", "")
             sql_tables = self._extract_tables(self._clean_sql(sql))
             tables.extend(sql_tables)
 
-        return list(set(tables))  # Remove duplicates
+        return sorted(set(tables))  # Remove duplicates
 
-    def _extract_error_handling(
-        self, node: ET.Element, job_name: str, comp_name: str, comp_type: str
-    ) -> None:
+    def _extract_error_handling(self, component: DecodedComponent, job_name: str) -> None:
         """Extract error handling and recovery patterns"""
+        comp_name = component.comp_name
+        comp_type = component.comp_type
+
         if job_name not in self.error_patterns:
             self.error_patterns[job_name] = []
 
@@ -806,17 +3536,17 @@ class TalendParserLLMOptimized:
             }
 
             # Extract error message
-            message_param = node.find(".//elementParameter[@name='MESSAGE']")
+            message_param = component.param("MESSAGE")
             if message_param is not None:
                 error_info["message"] = message_param.get("value", "")
 
             # Extract error code
-            code_param = node.find(".//elementParameter[@name='CODE']")
+            code_param = component.param("CODE")
             if code_param is not None:
                 error_info["code"] = code_param.get("value", "")
 
             # Extract priority
-            priority_param = node.find(".//elementParameter[@name='PRIORITY']")
+            priority_param = component.param("PRIORITY")
             if priority_param is not None:
                 try:
                     error_info["priority"] = int(priority_param.get("value", "1"))
@@ -824,7 +3554,7 @@ class TalendParserLLMOptimized:
                     error_info["priority"] = 1
 
             # Find incoming connections for triggers
-            for connection in node.findall(".//connection"):
+            for connection in component.connections:
                 error_info["triggers"].append(
                     {
                         "source": connection.get("source", ""),
@@ -845,12 +3575,12 @@ class TalendParserLLMOptimized:
             }
 
             # Extract warning message
-            message_param = node.find(".//elementParameter[@name='MESSAGE']")
+            message_param = component.param("MESSAGE")
             if message_param is not None:
                 warning_info["message"] = message_param.get("value", "")
 
             # Extract warning code
-            code_param = node.find(".//elementParameter[@name='CODE']")
+            code_param = component.param("CODE")
             if code_param is not None:
                 warning_info["code"] = code_param.get("value", "")
 
@@ -867,27 +3597,25 @@ class TalendParserLLMOptimized:
             }
 
             # Extract log mode
-            mode_param = node.find(
-                ".//elementParameter[@name='PRINT_CONTENT_WITH_LOG4J']"
-            )
+            mode_param = component.param("PRINT_CONTENT_WITH_LOG4J")
             if mode_param is not None:
                 log_info["mode"] = (
                     "log4j" if mode_param.get("value", "false") == "true" else "basic"
                 )
 
             # Extract separator
-            separator_param = node.find(".//elementParameter[@name='FIELDSEPARATOR']")
+            separator_param = component.param("FIELDSEPARATOR")
             if separator_param is not None:
                 log_info["separator"] = separator_param.get("value", "|")
 
             # Extract header printing
-            header_param = node.find(".//elementParameter[@name='PRINT_HEADER']")
+            header_param = component.param("PRINT_HEADER")
             if header_param is not None:
                 log_info["print_header"] = header_param.get("value", "false") == "true"
 
             self.error_patterns[job_name].append(log_info)
 
-    def _extract_connection_metadata(self, node: ET.Element) -> Dict:
+    def _extract_connection_metadata(self, component: DecodedComponent) -> Dict:
         """Extract detailed connection configuration"""
         connection_meta = {
             "commit_mode": "auto",
@@ -897,7 +3625,7 @@ class TalendParserLLMOptimized:
         }
 
         # Extract commit settings
-        commit_every = node.find(".//elementParameter[@name='COMMIT_EVERY']")
+        commit_every = component.param("COMMIT_EVERY")
         if commit_every is not None:
             connection_meta["commit_mode"] = "batch"
             connection_meta["batch_settings"]["commit_interval"] = int(
@@ -905,8 +3633,8 @@ class TalendParserLLMOptimized:
             )
 
         # Extract batch configuration
-        use_batch = node.find(".//elementParameter[@name='USE_BATCH']")
-        batch_size = node.find(".//elementParameter[@name='BATCH_SIZE']")
+        use_batch = component.param("USE_BATCH")
+        batch_size = component.param("BATCH_SIZE")
         if use_batch is not None and use_batch.get("value") == "true":
             connection_meta["batch_settings"]["enabled"] = True
             if batch_size is not None:
@@ -915,14 +3643,10 @@ class TalendParserLLMOptimized:
                 )
 
         # Extract parallel execution hints
-        parallel_exec = node.find(
-            ".//elementParameter[@name='ENABLE_PARALLEL_EXECUTION']"
-        )
+        parallel_exec = component.param("ENABLE_PARALLEL_EXECUTION")
         if parallel_exec is not None and parallel_exec.get("value") == "true":
             connection_meta["parallel_hints"]["enabled"] = True
-            num_parallel = node.find(
-                ".//elementParameter[@name='NUMBER_OF_PARALLEL_EXECUTORS']"
-            )
+            num_parallel = component.param("NUMBER_OF_PARALLEL_EXECUTORS")
             if num_parallel is not None:
                 connection_meta["parallel_hints"]["threads"] = int(
                     num_parallel.get("value", "4")
@@ -930,21 +3654,24 @@ class TalendParserLLMOptimized:
 
         # Extract resource limits
         for param in ["MAX_MEMORY", "TIMEOUT", "MAX_ROWS"]:
-            elem = node.find(f".//elementParameter[@name='{param}']")
+            elem = component.param(param)
             if elem is not None:
                 connection_meta["resource_limits"][param.lower()] = elem.get("value")
 
         # Extract auto-commit setting
-        auto_commit = node.find(".//elementParameter[@name='AUTO_COMMIT']")
+        auto_commit = component.param("AUTO_COMMIT")
         if auto_commit is not None:
             connection_meta["auto_commit"] = auto_commit.get("value", "true") == "true"
 
         return connection_meta
 
     def _extract_data_quality_rules(
-        self, node: ET.Element, job_name: str, comp_name: str, comp_type: str
+        self, component: DecodedComponent, job_name: str
     ) -> None:
         """Extract data quality and validation rules"""
+        comp_name = component.comp_name
+        comp_type = component.comp_type
+
         if job_name not in self.data_quality_rules:
             self.data_quality_rules[job_name] = {}
 
@@ -952,8 +3679,8 @@ class TalendParserLLMOptimized:
 
         # For tSchemaComplianceCheck
         if comp_type == "tSchemaComplianceCheck":
-            for rule in node.findall(".//elementParameter[@field='TABLE']"):
-                if rule.get("name") == "SCHEMA_COLUMN":
+            for rule in component.params("SCHEMA_COLUMN"):
+                if rule.get("field") == "TABLE":
                     for item in rule.findall(".//elementValue"):
                         dq_rules.append(
                             {
@@ -978,9 +3705,7 @@ class TalendParserLLMOptimized:
 
         # For tFilterRow (data validation)
         elif comp_type == "tFilterRow":
-            conditions = node.find(
-                ".//elementParameter[@field='TABLE'][@name='CONDITIONS']"
-            )
+            conditions = component.table_param("CONDITIONS")
             if conditions is not None:
                 for condition in conditions.findall(".//elementValue"):
                     # Build condition from multiple elementValues
@@ -1008,9 +3733,7 @@ class TalendParserLLMOptimized:
 
         # For tAggregateRow (aggregation validations)
         elif comp_type == "tAggregateRow":
-            operations = node.find(
-                ".//elementParameter[@field='TABLE'][@name='OPERATIONS']"
-            )
+            operations = component.table_param("OPERATIONS")
             if operations is not None:
                 for op in operations.findall(".//elementValue"):
                     agg_info = {
@@ -1042,34 +3765,48 @@ class TalendParserLLMOptimized:
 
     def _extract_performance_hints(self, root: ET.Element, job_name: str) -> Dict:
         """Extract performance-related configurations"""
-        perf_hints = {
+        perf_hints = self._new_performance_hints()
+
+        # Job-level performance settings
+        for param in root.findall(".//elementParameter"):
+            self._apply_performance_hint(perf_hints, param)
+
+        return self._finish_performance_hints(perf_hints)
+
+    def _new_performance_hints(self) -> Dict[str, Any]:
+        """Create an empty performance hints structure"""
+        return {
             "memory_settings": {},
             "parallelism": {},
             "caching": {},
             "optimization_flags": [],
         }
 
-        # Job-level performance settings
-        for param in root.findall(".//elementParameter"):
-            param_name = param.get("name", "")
-            param_value = param.get("value", "")
-
-            if param_name == "JOB_RUN_VM_ARGUMENTS":
-                perf_hints["memory_settings"]["jvm_args"] = param_value
-            elif param_name == "JOB_RUN_VM_ARGUMENTS_OPTION":
-                perf_hints["memory_settings"]["custom_jvm"] = param_value == "true"
-            elif param_name == "MULTI_THREAD_EXECUTION":
-                perf_hints["parallelism"]["enabled"] = param_value == "true"
-            elif param_name == "PARALLELIZE_UNIT_SIZE":
-                try:
-                    perf_hints["parallelism"]["unit_size"] = int(param_value)
-                except ValueError:
-                    perf_hints["parallelism"]["unit_size"] = 1
-            elif param_name == "IMPLICIT_TCONTEXTLOAD":
-                perf_hints["optimization_flags"].append("implicit_context_load")
-            elif param_name == "UPDATE_COMPONENTS":
-                perf_hints["optimization_flags"].append("auto_update_components")
-
+    def _apply_performance_hint(
+        self, perf_hints: Dict[str, Any], param: ET.Element
+    ) -> None:
+        """Record a single elementParameter if it is a performance setting"""
+        param_name = param.get("name", "")
+        param_value = param.get("value", "")
+
+        if param_name == "JOB_RUN_VM_ARGUMENTS":
+            perf_hints["memory_settings"]["jvm_args"] = param_value
+        elif param_name == "JOB_RUN_VM_ARGUMENTS_OPTION":
+            perf_hints["memory_settings"]["custom_jvm"] = param_value == "true"
+        elif param_name == "MULTI_THREAD_EXECUTION":
+            perf_hints["parallelism"]["enabled"] = param_value == "true"
+        elif param_name == "PARALLELIZE_UNIT_SIZE":
+            try:
+                perf_hints["parallelism"]["unit_size"] = int(param_value)
+            except ValueError:
+                perf_hints["parallelism"]["unit_size"] = 1
+        elif param_name == "IMPLICIT_TCONTEXTLOAD":
+            perf_hints["optimization_flags"].append("implicit_context_load")
+        elif param_name == "UPDATE_COMPONENTS":
+            perf_hints["optimization_flags"].append("auto_update_components")
+
+    def _finish_performance_hints(self, perf_hints: Dict[str, Any]) -> Dict:
+        """Drop empty performance hint sections"""
         # Clean up empty sections
         if not perf_hints["memory_settings"]:
             del perf_hints["memory_settings"]
@@ -1142,7 +3879,7 @@ class TalendParserLLMOptimized:
                         "values",
                         "into",
                     ]:
-                        tables.add(table.lower())
+                        tables.add(normalize_table_name(table))
 
         # Special handling for explicit table names in specific contexts
         # Look for patterns like: FROM context_var.table_name
@@ -1150,7 +3887,7 @@ class TalendParserLLMOptimized:
         for match in re.finditer(context_table_pattern, sql, re.IGNORECASE):
             table = match.group(1)
             if not re.match(r"^t[A-Z]", table):
-                tables.add(table.lower())
+                tables.add(normalize_table_name(table))
 
         return sorted(list(tables))
 
@@ -1308,10 +4045,6 @@ class TalendParserLLMOptimized:
             },
         }
 
-        # Track usage context for better classification
-        if not hasattr(self, "context_usage"):
-            self.context_usage: Dict[str, Dict[str, Any]] = {}
-
         # Classify variable based on patterns
         for category, config in variable_patterns.items():
             # Check type-specific match first
@@ -1353,7 +4086,13 @@ class TalendParserLLMOptimized:
         return f"var('{var_lower}')"
 
     def _deduplicate_sql(self) -> None:
-        """Deduplicate SQL by hash"""
+        """Deduplicate SQL by hash and cluster near-duplicates
+
+        Byte-identical statements are dropped. The rest are fingerprinted on
+        their canonical form and clustered with MinHash/LSH (per operation);
+        every non-representative member points to its cluster representative.
+        """
+        self._invalidate_derived_sections()
         seen = set()
         unique_sql = []
 
@@ -1365,11 +4104,54 @@ class TalendParserLLMOptimized:
 
         logger.info(f"Deduplicated SQL: {len(self.all_sql)} -> {len(unique_sql)}")
         self.all_sql = unique_sql
+        self._cluster_sql()
+
+    def _cluster_sql(self) -> None:
+        """Assign fingerprints and cluster representatives to self.all_sql"""
+        # Cluster distinct canonical forms only; fingerprint duplicates follow
+        first_by_fingerprint: Dict[str, int] = {}
+        forms: List[str] = []
+        operations: List[str] = []
+        form_index: List[int] = []
+        for sql_obj in self.all_sql:
+            canonical = canonicalize_sql(sql_obj.cleaned_sql)
+            sql_obj.fingerprint = sql_fingerprint(canonical)
+            if sql_obj.fingerprint not in first_by_fingerprint:
+                first_by_fingerprint[sql_obj.fingerprint] = len(forms)
+                forms.append(canonical)
+                operations.append(sql_obj.sql_operation)
+            form_index.append(first_by_fingerprint[sql_obj.fingerprint])
+
+        representatives = cluster_near_duplicates(forms, operations)
+        rep_sql: Dict[int, ExtractedSQL] = {}
+        for sql_obj, index in zip(self.all_sql, form_index):
+            rep = rep_sql.setdefault(representatives[index], sql_obj)
+            sql_obj.cluster = "" if rep is sql_obj else rep.fingerprint
+            sql_obj.cluster_size = 1
+            sql_obj.literals = None
+            if rep is not sql_obj:
+                rep.cluster_size += 1
+            if sql_obj.is_fingerprint_duplicate:
+                sql_obj.literals = differing_literals(sql_obj.cleaned_sql, rep.cleaned_sql)
+
+        logger.info(
+            f"Clustered SQL: {len(self.all_sql)} statements, "
+            f"{len(forms)} fingerprints, {len(rep_sql)} clusters"
+        )
 
     def _build_hierarchy(self) -> None:
-        """Determine job hierarchy"""
+        """Determine job hierarchy
+
+        Roles come from the resolved tRunJob call graph; jobs outside it
+        (no resolved callers or children) fall back to naming conventions.
+        """
+        self._invalidate_derived_sections()
+        self.call_graph = JobCallGraph(self.jobs_summary, self.job_ids)
         for job_name in self.jobs_summary:
-            if "grandmaster" in job_name.lower():
+            role = self.call_graph.role(job_name)
+            if role:
+                self.job_hierarchy[job_name] = role
+            elif "grandmaster" in job_name.lower():
                 self.job_hierarchy[job_name] = "orchestrator_top"
             elif "master" in job_name.lower():
                 self.job_hierarchy[job_name] = "orchestrator_mid"
@@ -1382,101 +4164,243 @@ class TalendParserLLMOptimized:
 
     def _create_context_mappings(self) -> None:
         """Create clean context variable mappings"""
+        self._invalidate_derived_sections()
         for var_name, info in self.context_mappings.items():
             # Ensure clean DBT mapping
             if not info.get("dbt_mapping"):
                 info["dbt_mapping"] = self._map_to_dbt(var_name, info.get("type", ""))
 
+    @_memoized_section
     def _create_llm_output(self) -> Dict:
         """Create enhanced LLM-optimized output structure with migration intelligence"""
-        # Generate performance suggestions
-        performance_suggestions = self._generate_performance_suggestions()
+        return {
+            key: materialize_section(value)
+            for key, value in self._llm_output_sections()
+        }
 
-        # Create dependency graphs for jobs
-        dependency_graphs = self._generate_dependency_graphs()
+    def _llm_output_sections(self) -> Iterator[Tuple[str, Any]]:
+        """Top-level sections of the LLM output, in document order
+
+        The per-job, SQL and transformation sections are yielded as
+        StreamedDict/StreamedList so write_json_stream can encode them one
+        entry at a time.
+        """
+        yield "extraction_metadata", {
+            "timestamp": datetime.now().isoformat(),
+            "total_jobs": len(self.jobs_summary),
+            "total_sql_queries": len(self.all_sql),
+            "total_tmap_expressions": len(self.all_tmap),
+            "unique_tables": len(self.all_tables),
+            "context_variables": len(self.context_mappings),
+            "transaction_groups": sum(
+                len(tp.get("transaction_groups", []))
+                for tp in self.transaction_patterns.values()
+            ),
+            "error_patterns": sum(len(ep) for ep in self.error_patterns.values()),
+            "data_quality_rules": sum(
+                len(dq)
+                for dq_job in self.data_quality_rules.values()
+                for dq in dq_job.values()
+            ),
+            **(
+                {"superseded_versions": self.superseded_versions}
+                if self.superseded_versions
+                else {}
+            ),
+            "migration_version": "3.0",  # Updated version for enhanced extraction
+            "source_platform": "Talend",
+            "target_platform": "BigQuery",
+            "framework_version": "talend2dbt-3.0.0",
+        }
+        yield "job_hierarchy", self.job_hierarchy
+        yield "call_graph", self._call_graph_section()
+        yield "jobs_summary", StreamedDict(
+            (job, self._job_summary_entry(job, info))
+            for job, info in self.jobs_summary.items()
+        )
+        yield "sql_queries", StreamedList(sql.to_llm_format() for sql in self.all_sql)
+        if self.intern_expressions:
+            yield "expression_dictionary", self._expression_dictionary()
+        yield "transformations", StreamedList(
+            self._transformation_entry(tmap) for tmap in self.all_tmap
+        )
+        yield "tables", {
+            "all_tables": sorted(list(self.all_tables)),
+            "table_operations": self._analyze_table_operations(),
+        }
+        yield "table_lineage", self._table_lineage_section()
+        yield "context_mappings", self._context_mappings_section()
+        if self.repository_objects:
+            yield "repository_objects", self._repository_objects_section()
+        yield "transaction_patterns", self.transaction_patterns  # NEW: Transaction boundaries
+        yield "error_patterns", self.error_patterns  # NEW: Error handling patterns
+        yield "data_quality_rules", self.data_quality_rules  # NEW: DQ validation rules
+        yield "performance_hints", self.performance_hints  # NEW: Performance optimization hints
+        yield "connection_metadata", self.connection_metadata  # NEW: Connection configurations
+        yield "performance_suggestions", self._generate_performance_suggestions()
+        yield "dependency_graphs", self._generate_dependency_graphs()
+        yield "validation_queries", self._generate_validation_queries()
+        yield "migration_recommendations", self._generate_migration_recommendations()
+
+    def _repository_objects_section(self) -> Dict[str, Dict[str, Any]]:
+        """Indexed repository items by type, each with the jobs that use it
+
+        Jobs use metadata connections and context groups by repository id
+        (jobs_summary[job]["repository_refs"]) and joblets as components
+        whose type is the joblet name (expanded ones in "joblet_instances").
+        """
+        section = {
+            item_type: {name: {**entry, "used_by": []} for name, entry in objects.items()}
+            for item_type, objects in sorted(self.repository_objects.items())
+        }
+        by_id = {
+            entry["id"]: entry
+            for objects in section.values()
+            for entry in objects.values()
+            if entry.get("id")
+        }
+        joblets = section.get("joblet", {})
+        for job, info in self.jobs_summary.items():
+            used = [by_id[ref] for ref in info.get("repository_refs", []) if ref in by_id]
+            graph = info.get("dependency_graph") or {}
+            used.extend(
+                joblets[node.comp_type]
+                for node in graph.get("components", {}).values()
+                if node.comp_type in joblets
+            )
+            used.extend(
+                joblets[joblet]
+                for joblet in info.get("joblet_instances", {}).values()
+                if joblet in joblets
+            )
+            for entry in used:
+                if entry["used_by"][-1:] != [job]:
+                    entry["used_by"].append(job)
+        return section
 
-        # Generate validation queries
-        validation_queries = self._generate_validation_queries()
+    def _job_summary_entry(self, job: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM output entry for one job in jobs_summary"""
+        return {
+            "role": self.job_hierarchy.get(job, "unknown"),
+            "components": info["components"],
+            "sql_queries": info["sql_count"],
+            "transformations": info["tmap_count"],
+            "tables": sorted(list(info["tables"])),
+            "dependency_graph": dependency_graph_entry(info.get("dependency_graph", {})),
+            "tmap_structures": info.get("tmap_structures", {}),  # Include enhanced tMap
+            "complexity_score": self._calculate_complexity(info),
+            "has_transactions": job in self.transaction_patterns,
+            "has_error_handling": job in self.error_patterns,
+            "has_data_quality": job in self.data_quality_rules,
+        }
 
+    def _transformation_entry(self, tmap: TMapExpression) -> Dict[str, Any]:
+        """LLM output entry for one tMap expression"""
+        expression_id = self._interned_expression_id(tmap.expression)
+        if expression_id:
+            return {
+                "job": tmap.job_name,
+                "component": tmap.component_name,
+                "column": tmap.input_column or tmap.output_column,
+                "expression_id": expression_id,
+                "type": tmap.data_type,
+                "safe_cast": self._get_safe_cast(tmap.data_type),
+            }
         return {
-            "extraction_metadata": {
-                "timestamp": datetime.now().isoformat(),
-                "total_jobs": len(self.jobs_summary),
-                "total_sql_queries": len(self.all_sql),
-                "total_tmap_expressions": len(self.all_tmap),
-                "unique_tables": len(self.all_tables),
-                "context_variables": len(self.context_mappings),
-                "transaction_groups": sum(
-                    len(tp.get("transaction_groups", []))
-                    for tp in self.transaction_patterns.values()
-                ),
-                "error_patterns": sum(len(ep) for ep in self.error_patterns.values()),
-                "data_quality_rules": sum(
-                    len(dq)
-                    for dq_job in self.data_quality_rules.values()
-                    for dq in dq_job.values()
-                ),
-                "migration_version": "3.0",  # Updated version for enhanced extraction
-                "source_platform": "Talend",
-                "target_platform": "BigQuery",
-                "framework_version": "talend2dbt-3.0.0",
-            },
-            "job_hierarchy": self.job_hierarchy,
-            "jobs_summary": {
-                job: {
-                    "role": self.job_hierarchy.get(job, "unknown"),
-                    "components": info["components"],
-                    "sql_queries": info["sql_count"],
-                    "transformations": info["tmap_count"],
-                    "tables": sorted(list(info["tables"])),
-                    "dependency_graph": info.get("dependency_graph", {}),
-                    "tmap_structures": info.get(
-                        "tmap_structures", {}
-                    ),  # Include enhanced tMap
-                    "complexity_score": self._calculate_complexity(info),
-                    "has_transactions": job in self.transaction_patterns,
-                    "has_error_handling": job in self.error_patterns,
-                    "has_data_quality": job in self.data_quality_rules,
-                }
-                for job, info in self.jobs_summary.items()
-            },
-            "sql_queries": [sql.to_llm_format() for sql in self.all_sql],
-            "transformations": [
-                {
-                    "job": tmap.job_name,
-                    "component": tmap.component_name,
-                    "mapping": f"{tmap.input_column or tmap.output_column} = {tmap.expression}",
-                    "type": tmap.data_type,
-                    "safe_cast": self._get_safe_cast(tmap.data_type),
-                }
-                for tmap in self.all_tmap
-            ],
-            "tables": {
-                "all_tables": sorted(list(self.all_tables)),
-                "table_operations": self._analyze_table_operations(),
-            },
-            "context_mappings": {
-                var: {
-                    "type": info["type"],
-                    "dbt": info["dbt_mapping"],
-                    "category": getattr(self, "context_usage", {})
-                    .get(var, {})
-                    .get("category", "generic"),
-                    "validation": getattr(self, "context_usage", {})
-                    .get(var, {})
-                    .get("validation", ""),
-                }
-                for var, info in self.context_mappings.items()
-            },
-            "transaction_patterns": self.transaction_patterns,  # NEW: Transaction boundaries
-            "error_patterns": self.error_patterns,  # NEW: Error handling patterns
-            "data_quality_rules": self.data_quality_rules,  # NEW: DQ validation rules
-            "performance_hints": self.performance_hints,  # NEW: Performance optimization hints
-            "connection_metadata": self.connection_metadata,  # NEW: Connection configurations
-            "performance_suggestions": performance_suggestions,
-            "dependency_graphs": dependency_graphs,
-            "validation_queries": validation_queries,
-            "migration_recommendations": self._generate_migration_recommendations(),
+            "job": tmap.job_name,
+            "component": tmap.component_name,
+            "mapping": f"{tmap.input_column or tmap.output_column} = {tmap.expression}",
+            "type": tmap.data_type,
+            "safe_cast": self._get_safe_cast(tmap.data_type),
+        }
+
+    @_memoized_section
+    def _expression_ids(self) -> Dict[str, str]:
+        """Short IDs for tMap expressions repeated across the extraction
+
+        Only expressions that occur more than once and are at least
+        INTERN_MIN_EXPRESSION_LENGTH characters long are interned; IDs are
+        assigned in order of first occurrence.
+        """
+        counts: DefaultDict[str, int] = defaultdict(int)
+        for tmap in self.all_tmap:
+            counts[tmap.expression] += 1
+
+        expression_ids: Dict[str, str] = {}
+        for expression, count in counts.items():
+            if count > 1 and len(expression) >= INTERN_MIN_EXPRESSION_LENGTH:
+                expression_ids[expression] = f"e{len(expression_ids) + 1}"
+        return expression_ids
+
+    def _expression_dictionary(self) -> Dict[str, str]:
+        """expression_dictionary section: ID -> expression"""
+        return {
+            expression_id: expression
+            for expression, expression_id in self._expression_ids().items()
+        }
+
+    def _interned_expression_id(self, expression: str) -> Optional[str]:
+        """ID to write instead of the expression, if interning is enabled"""
+        if not self.intern_expressions:
+            return None
+        return self._expression_ids().get(expression)
+
+    def _expression_interning_stats(self) -> Dict[str, Any]:
+        """Token cost of repeated tMap expressions, inline vs interned"""
+        expression_ids = self._expression_ids()
+        counts: DefaultDict[str, int] = defaultdict(int)
+        for tmap in self.all_tmap:
+            if tmap.expression in expression_ids:
+                counts[tmap.expression] += 1
+
+        expressions = list(expression_ids)
+        expression_tokens = [
+            len(tokens) for tokens in self.token_encoder.encode_batch(expressions)
+        ]
+        id_tokens = [
+            len(tokens)
+            for tokens in self.token_encoder.encode_batch(list(expression_ids.values()))
+        ]
+
+        # Interned: the expression once plus its ID in the dictionary and in
+        # every reference
+        inline_tokens = sum(
+            counts[expr] * tokens for expr, tokens in zip(expressions, expression_tokens)
+        )
+        interned_tokens = sum(
+            tokens + (counts[expr] + 1) * ref_tokens
+            for expr, tokens, ref_tokens in zip(expressions, expression_tokens, id_tokens)
+        )
+        return {
+            "unique_expressions": len({tmap.expression for tmap in self.all_tmap}),
+            "interned_expressions": len(expressions),
+            "interned_occurrences": sum(counts.values()),
+            "inline_tokens": inline_tokens,
+            "interned_tokens": interned_tokens,
+            "tokens_saved": inline_tokens - interned_tokens,
+        }
+
+    @_memoized_section
+    def _call_graph_section(self) -> Dict[str, Any]:
+        """tRunJob call graph: edges, roots, depth levels, cycles, reachability"""
+        return self.call_graph.to_llm_format()
+
+    @_memoized_section
+    def _table_lineage_section(self) -> Dict[str, Any]:
+        """Job order and table producers/consumers from the lineage graph"""
+        return self.table_lineage.to_llm_format()
+
+    @_memoized_section
+    def _context_mappings_section(self) -> Dict[str, Dict[str, str]]:
+        """Context variable mappings with their usage classification"""
+        return {
+            var: {
+                "type": info["type"],
+                "dbt": info["dbt_mapping"],
+                "category": self.context_usage.get(var, {}).get("category", "generic"),
+                "validation": self.context_usage.get(var, {}).get("validation", ""),
+            }
+            for var, info in self.context_mappings.items()
         }
 
     def _calculate_complexity(self, job_info: Dict) -> int:
@@ -1500,6 +4424,7 @@ class TalendParserLLMOptimized:
                 return "SAFE.PARSE_TIMESTAMP('%Y-%m-%d %H:%M:%S', {column})"
         return "{column}"
 
+    @_memoized_section
     def _generate_performance_suggestions(self) -> List[str]:
         """Generate performance optimization suggestions"""
         suggestions = []
@@ -1542,20 +4467,22 @@ class TalendParserLLMOptimized:
 
         return suggestions
 
+    @_memoized_section
     def _generate_dependency_graphs(self) -> Dict[str, Dict]:
         """Generate job dependency graphs"""
         graphs = {}
         for job_name, job_info in self.jobs_summary.items():
             if "dependency_graph" in job_info and job_info["dependency_graph"]:
-                graphs[job_name] = job_info["dependency_graph"]
+                graphs[job_name] = dependency_graph_entry(job_info["dependency_graph"])
         return graphs
 
+    @_memoized_section
     def _generate_validation_queries(self) -> List[Dict]:
         """Generate validation queries for migration testing"""
         queries = []
 
         # Row count validations
-        for table in list(self.all_tables)[:10]:  # Top 10 tables
+        for table in sorted(self.all_tables)[:10]:  # Top 10 tables
             queries.append(
                 {
                     "type": "row_count",
@@ -1579,7 +4506,7 @@ class TalendParserLLMOptimized:
 
         # Null checks for critical columns
         if self.all_tmap:
-            sample_columns = list(
+            sample_columns = sorted(
                 set(tm.output_column for tm in self.all_tmap if tm.output_column)
             )[:5]
             for col in sample_columns:
@@ -1594,6 +4521,7 @@ class TalendParserLLMOptimized:
 
         return queries
 
+    @_memoized_section
     def _generate_migration_recommendations(self) -> Dict[str, List[str]]:
         """Generate migration recommendations"""
         recommendations = {
@@ -1636,6 +4564,7 @@ class TalendParserLLMOptimized:
 
         return recommendations
 
+    @_memoized_section
     def _analyze_table_operations(self) -> Dict[str, Dict[str, Any]]:
         """Analyze operations per table"""
         table_ops: DefaultDict[str, Dict[str, Any]] = defaultdict(
@@ -1657,23 +4586,72 @@ class TalendParserLLMOptimized:
             for table, info in table_ops.items()
         }
 
-    def write_outputs(self, output_dir: str) -> None:
-        """Write LLM-optimized outputs"""
+    def write_outputs(
+        self,
+        output_dir: str,
+        compact_json: bool = False,
+        sharded: bool = False,
+        bundle_tokens: Optional[int] = None,
+    ) -> None:
+        """Write LLM-optimized outputs
+
+        Args:
+            output_dir: Output directory
+            compact_json: Write talend_extraction.json without indentation
+            sharded: Also write one jobs/<job>.json shard per job plus a
+                manifest.json index
+            bundle_tokens: Also pack jobs into bundles/ of at most this many
+                tokens each, plus bundles/index.json
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Get LLM output
-        llm_output = self._create_llm_output()
+        with self.tracer.span("write_outputs"):
+            output_files = self._write_output_files(output_path, compact_json)
+
+            # 6. Per-job shards and token-budget bundles (duplicates of the
+            # above, excluded from statistics)
+            if sharded:
+                with self.tracer.span("write_job_shards", "output"):
+                    self.write_job_shards(
+                        output_path, indent=None if compact_json else 2
+                    )
+            if bundle_tokens:
+                with self.tracer.span("write_bundles", "output"):
+                    self.write_bundles(
+                        output_path, bundle_tokens, indent=None if compact_json else 2
+                    )
+
+            if self.token_stats:
+                # Calculate destination file statistics
+                with self.tracer.span("destination_stats"):
+                    self.destination_stats = self._calculate_file_stats(
+                        output_files, "Destination"
+                    )
+
+                # Write token statistics report
+                with self.tracer.span("token_statistics.txt", "output"):
+                    self._write_token_statistics(output_path)
+
+        logger.info(f"LLM-optimized extraction complete. Output in: {output_dir}")
 
-        # 1. Write main JSON output (structured for LLM)
-        with open(output_path / "talend_extraction.json", "w") as f:
-            json.dump(llm_output, f, indent=2, default=str)
+    def _write_output_files(self, output_path: Path, compact_json: bool) -> List[Path]:
+        """Write the five main output files, returning their paths"""
+        # 1. Write main JSON output (structured for LLM), streamed section by section
+        with self.tracer.span("talend_extraction.json", "output"), open(
+            output_path / "talend_extraction.json", "w"
+        ) as f:
+            write_json_stream(
+                f, self._llm_output_sections(), indent=None if compact_json else 2
+            )
 
         # Track output files for statistics
         output_files = [output_path / "talend_extraction.json"]
 
         # 2. Write SQL file (clean, ready for LLM)
-        with open(output_path / "sql_queries.sql", "w") as f:
+        with self.tracer.span("sql_queries.sql", "output"), open(
+            output_path / "sql_queries.sql", "w"
+        ) as f:
             f.write("-- TALEND SQL EXTRACTION FOR LLM PROCESSING\n")
             f.write(f"-- Total Queries: {len(self.all_sql)}\n")
             f.write(f"-- Unique Tables: {len(self.all_tables)}\n")
@@ -1687,28 +4665,48 @@ class TalendParserLLMOptimized:
                     f.write(
                         f"-- Context Variables: {', '.join(sql.context_variables)}\n"
                     )
+                if sql.is_fingerprint_duplicate:
+                    f.write(f"-- Same as: {sql.cluster}\n")
+                    if sql.literals:
+                        f.write(
+                            "-- Literals: "
+                            + ", ".join(f"{rep} -> {own}" for rep, own in sql.literals)
+                            + "\n"
+                        )
+                    if sql.literals is not None:
+                        f.write("\n-- " + "-" * 50 + "\n\n")
+                        continue
+                elif sql.cluster_size > 1:
+                    f.write(
+                        f"-- Fingerprint: {sql.fingerprint} "
+                        f"(cluster of {sql.cluster_size})\n"
+                    )
+                elif sql.cluster:
+                    f.write(f"-- Near-duplicate of: {sql.cluster}\n")
                 f.write(f"\n{sql.cleaned_sql};\n\n")
                 f.write("-- " + "-" * 50 + "\n\n")
 
         output_files.append(output_path / "sql_queries.sql")
 
         # 3. Write transformations file (tMap expressions)
-        with open(output_path / "transformations.json", "w") as f:
-            json.dump(
-                {
-                    "total_transformations": len(self.all_tmap),
-                    "by_job": self._group_tmap_by_job(),
-                },
-                f,
-                indent=2,
-            )
+        transformations: Dict[str, Any] = {"total_transformations": len(self.all_tmap)}
+        if self.intern_expressions:
+            transformations["expressions"] = self._expression_dictionary()
+        with self.tracer.span("transformations.json", "output"):
+            transformations["by_job"] = self._group_tmap_by_job()
+            with open(output_path / "transformations.json", "w") as f:
+                json.dump(transformations, f, indent=2)
 
         output_files.append(output_path / "transformations.json")
 
         # 4. Write context mappings YAML (for DBT reference)
-        with open(output_path / "context_to_dbt.yml", "w") as f:
+        import yaml
+
+        with self.tracer.span("context_to_dbt.yml", "output"), open(
+            output_path / "context_to_dbt.yml", "w"
+        ) as f:
             yaml.dump(
-                {"context_variable_mappings": llm_output["context_mappings"]},
+                {"context_variable_mappings": self._context_mappings_section()},
                 f,
                 default_flow_style=False,
                 sort_keys=False,
@@ -1717,7 +4715,9 @@ class TalendParserLLMOptimized:
         output_files.append(output_path / "context_to_dbt.yml")
 
         # 5. Write summary report
-        with open(output_path / "extraction_summary.txt", "w") as f:
+        with self.tracer.span("extraction_summary.txt", "output"), open(
+            output_path / "extraction_summary.txt", "w"
+        ) as f:
             f.write("TALEND EXTRACTION SUMMARY FOR LLM\n")
             f.write("=" * 50 + "\n\n")
             f.write(f"Jobs Processed: {len(self.jobs_summary)}\n")
@@ -1744,15 +4744,205 @@ class TalendParserLLMOptimized:
                 f.write(f"  Operations: {', '.join(ops['operations'])}\n")
                 f.write(f"  Used in {len(ops['used_in_jobs'])} jobs\n")
 
+            if self.repository_objects:
+                f.write("\nREPOSITORY OBJECTS (indexed, not jobs):\n")
+                f.write("-" * 30 + "\n")
+                for item_type, objects in sorted(self.repository_objects.items()):
+                    f.write(f"{item_type}: {len(objects)} ({', '.join(sorted(objects))})\n")
+
+            if self.superseded_versions:
+                f.write("\nSUPERSEDED VERSIONS (not parsed):\n")
+                f.write("-" * 30 + "\n")
+                for job, versions in sorted(self.superseded_versions.items()):
+                    f.write(f"{job}: replaces {', '.join(versions)}\n")
+
         output_files.append(output_path / "extraction_summary.txt")
 
-        # Calculate destination file statistics
-        self.destination_stats = self._calculate_file_stats(output_files, "Destination")
+        return output_files
 
-        # Write token statistics report
-        self._write_token_statistics(output_path)
+    def write_job_shards(self, output_path: Path, indent: Optional[int] = 2) -> None:
+        """Write one JSON shard per job and a manifest.json index
 
-        logger.info(f"LLM-optimized extraction complete. Output in: {output_dir}")
+        Each shard holds everything extracted for a single job (summary,
+        SQL, tMap expressions, transactions, error and DQ patterns), so a
+        migration session can load only the jobs it works on. The manifest
+        lists per-shard sizes, token counts, tables and child-job references.
+        """
+        shards_dir = output_path / "jobs"
+        shards_dir.mkdir(parents=True, exist_ok=True)
+
+        stats = (
+            FileStatsCollector(self.token_encoder, tracer=self.tracer)
+            if self.token_stats
+            else None
+        )
+        shard_entries = []
+        used_names: Set[str] = set()
+
+        for job, info, shard in self._iter_job_shards():
+            shard_name = re.sub(r"[^A-Za-z0-9_.-]", "_", job)
+            while shard_name.lower() in used_names:
+                shard_name += "_"
+            used_names.add(shard_name.lower())
+            shard_file = shards_dir / f"{shard_name}.json"
+
+            content = json.dumps(shard, indent=indent, default=str).encode("utf-8")
+            shard_file.write_bytes(content)
+
+            shard_entries.append(
+                {
+                    "job": job,
+                    "file": f"jobs/{shard_file.name}",
+                    "role": self.job_hierarchy.get(job, "unknown"),
+                    "size_bytes": len(content),
+                    "tokens": stats.submit(shard_file, content) if stats else None,
+                    "tables": sorted(info["tables"]),
+                    "child_jobs": info.get("child_jobs", []),
+                }
+            )
+
+        # Resolve token counts computed in the background
+        for entry in shard_entries:
+            if isinstance(entry["tokens"], Future):
+                file_stats = entry["tokens"].result()
+                entry["tokens"] = file_stats["tokens"] if file_stats else None
+        if stats is not None:
+            stats.close()
+
+        manifest = {
+            "manifest_version": 1,
+            "generated": datetime.now().isoformat(),
+            "total_jobs": len(shard_entries),
+            "total_size_bytes": sum(e["size_bytes"] for e in shard_entries),
+            "total_tokens": (
+                sum(e["tokens"] or 0 for e in shard_entries) if stats else None
+            ),
+            "shards": shard_entries,
+        }
+        with open(output_path / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        logger.info(f"Wrote {len(shard_entries)} job shards to: {shards_dir}")
+
+    def _iter_job_shards(self) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """(job, summary info, shard) for every job; a shard holds everything
+        extracted for that job (SQL, tMap, transactions, error/DQ patterns)"""
+        sql_by_job: DefaultDict[str, List[ExtractedSQL]] = defaultdict(list)
+        for sql in self.all_sql:
+            sql_by_job[sql.job_name].append(sql)
+        tmap_by_job: DefaultDict[str, List[TMapExpression]] = defaultdict(list)
+        for tmap in self.all_tmap:
+            tmap_by_job[tmap.job_name].append(tmap)
+
+        for job, info in self.jobs_summary.items():
+            expressions = {}
+            for tmap in tmap_by_job[job]:
+                expression_id = self._interned_expression_id(tmap.expression)
+                if expression_id:
+                    expressions[expression_id] = tmap.expression
+
+            yield job, info, {
+                "job": job,
+                "summary": self._job_summary_entry(job, info),
+                "sql_queries": [sql.to_llm_format() for sql in sql_by_job[job]],
+                "expressions": expressions,
+                "transformations": [
+                    self._transformation_entry(tmap) for tmap in tmap_by_job[job]
+                ],
+                "transaction_patterns": self.transaction_patterns.get(job, {}),
+                "error_patterns": self.error_patterns.get(job, []),
+                "data_quality_rules": self.data_quality_rules.get(job, {}),
+                "performance_hints": self.performance_hints.get(job, {}),
+                "connection_metadata": self.connection_metadata.get(job, {}),
+            }
+
+    def write_bundles(
+        self, output_path: Path, token_budget: int, indent: Optional[int] = 2
+    ) -> None:
+        """Pack job shards into bundles/bundle_NNN.json under a token budget
+
+        Each bundle is sized for one LLM session: jobs linked by tRunJob and
+        jobs sharing tables are kept together where the budget allows (see
+        plan_bundles). bundles/index.json lists every bundle's jobs, exact
+        token count, tables and the bundles it depends on (for called child
+        jobs and tables read from other bundles), so sessions whose bundles
+        do not depend on each other can run in parallel.
+        """
+        bundles_dir = output_path / "bundles"
+        bundles_dir.mkdir(parents=True, exist_ok=True)
+
+        # Token cost of each shard at the nesting depth it has in a bundle
+        shards: Dict[str, Dict[str, Any]] = {}
+        job_tokens: Dict[str, int] = {}
+        for job, _, shard in self._iter_job_shards():
+            shards[job] = shard
+            fragment = json.dumps({"shards": {job: shard}}, indent=indent, default=str)
+            job_tokens[job] = len(self.token_encoder.encode(fragment))
+
+        job_order, _ = self.table_lineage.topological_order()
+        job_order += [job for job in self.jobs_summary if job not in self.table_lineage.job_reads]
+        bundles = plan_bundles(
+            job_tokens,
+            [job for job in job_order if job in shards],
+            self.call_graph,
+            {job: info["tables"] for job, info in self.jobs_summary.items()},
+            token_budget,
+        )
+
+        job_bundle = {job: number for number, jobs in enumerate(bundles, 1) for job in jobs}
+        width = max(3, len(str(len(bundles))))
+        entries = []
+        for number, jobs in enumerate(bundles, 1):
+            bundle_file = bundles_dir / f"bundle_{number:0{width}d}.json"
+            content = json.dumps(
+                {
+                    "bundle": number,
+                    "total_bundles": len(bundles),
+                    "jobs": jobs,
+                    "shards": {job: shards[job] for job in jobs},
+                },
+                indent=indent,
+                default=str,
+            )
+            bundle_file.write_text(content)
+
+            dependencies = {
+                job_bundle[dependency]
+                for job in jobs
+                for dependency in chain(
+                    self.call_graph.callees(job), self.table_lineage.producers(job)
+                )
+                if job_bundle.get(dependency, number) != number
+            }
+            tokens = len(self.token_encoder.encode(content))
+            entries.append(
+                {
+                    "bundle": number,
+                    "file": f"bundles/{bundle_file.name}",
+                    "jobs": jobs,
+                    "tokens": tokens,
+                    "over_budget": tokens > token_budget,
+                    "tables": sorted({t for job in jobs for t in self.jobs_summary[job]["tables"]}),
+                    "depends_on": sorted(dependencies),
+                }
+            )
+
+        index = {
+            "index_version": 1,
+            "generated": datetime.now().isoformat(),
+            "token_budget": token_budget,
+            "total_jobs": len(job_bundle),
+            "total_bundles": len(entries),
+            "total_tokens": sum(entry["tokens"] for entry in entries),
+            "bundles": entries,
+            "job_bundles": job_bundle,
+        }
+        with open(bundles_dir / "index.json", "w") as f:
+            json.dump(index, f, indent=2)
+
+        logger.info(
+            f"Wrote {len(entries)} bundles (budget {token_budget:,} tokens) to: {bundles_dir}"
+        )
 
     def _write_token_statistics(self, output_path: Path) -> None:
         """Write comprehensive token and size statistics report"""
@@ -1771,7 +4961,7 @@ class TalendParserLLMOptimized:
                 f"Total Size: {self.source_stats['total_size_mb']:.2f} MB "
                 f"({self.source_stats['total_size_kb']:.2f} KB)\n"
             )
-            f.write(f"Total Tokens: {self.source_stats['total_tokens']:,}\n\n")
+            self._write_token_totals(f, self.source_stats)
 
             # Top 10 largest source files
             source_files_sorted = sorted(
@@ -1794,7 +4984,7 @@ class TalendParserLLMOptimized:
                 f"Total Size: {self.destination_stats['total_size_mb']:.2f} MB "
                 f"({self.destination_stats['total_size_kb']:.2f} KB)\n"
             )
-            f.write(f"Total Tokens: {self.destination_stats['total_tokens']:,}\n\n")
+            self._write_token_totals(f, self.destination_stats)
 
             # Destination file breakdown
             f.write("Destination Files:\n")
@@ -1806,6 +4996,10 @@ class TalendParserLLMOptimized:
                 )
             f.write("\n")
 
+            # Repeated tMap expressions: encodes each one, so exact mode only
+            if not self.estimate_tokens:
+                self._write_expression_interning(f)
+
             # Comparison and conversion value
             f.write("CONVERSION IMPACT:\n")
             f.write("-" * 70 + "\n")
@@ -1852,46 +5046,576 @@ class TalendParserLLMOptimized:
 
         logger.info(f"Token statistics written to: {stats_file}")
 
+    def _write_expression_interning(self, f: IO[str]) -> None:
+        """EXPRESSION INTERNING section: token cost of repeated tMap expressions"""
+        interning = self._expression_interning_stats()
+        f.write("EXPRESSION INTERNING:\n")
+        f.write("-" * 70 + "\n")
+        f.write(
+            f"Repeated Expressions: {interning['interned_expressions']:,} of "
+            f"{interning['unique_expressions']:,} unique "
+            f"({interning['interned_occurrences']:,} occurrences)\n"
+        )
+        f.write(f"Inline Tokens: {interning['inline_tokens']:,}\n")
+        f.write(f"Interned Tokens: {interning['interned_tokens']:,}\n")
+        if self.intern_expressions:
+            f.write(f"Tokens Saved: {interning['tokens_saved']:,}\n\n")
+        else:
+            f.write(
+                f"Potential Savings: {interning['tokens_saved']:,} tokens "
+                "(--intern-expressions)\n\n"
+            )
+
+    def _write_token_totals(self, f: IO[str], stats: Dict[str, Any]) -> None:
+        """Total Tokens line plus how the count was obtained"""
+        if stats.get("token_mode") != "estimate":
+            f.write(f"Total Tokens: {stats['total_tokens']:,}\n")
+            f.write("Token Counting: exact (tiktoken cl100k_base)\n\n")
+            return
+
+        f.write(
+            f"Total Tokens: ~{stats['total_tokens']:,} "
+            f"(±{stats['token_margin']:,}, 95% bound)\n"
+        )
+        f.write("Token Counting: estimate (sampled chunks, bytes -> tokens per file type)\n")
+        for file_type, calibration in sorted(stats["token_calibration"].items()):
+            sampled = calibration["sampled_bytes"]
+            share = sampled / max(sampled + calibration["estimated_bytes"], 1)
+            f.write(
+                f"  {file_type}: {calibration['tokens_per_byte']:.4f} tokens/byte from "
+                f"{calibration['sampled_chunks']:,} chunks ({share:.1%} of bytes encoded), "
+                f"±{calibration['margin_tokens']:,} tokens\n"
+            )
+        f.write("\n")
+
+    @_memoized_section
     def _group_tmap_by_job(self) -> Dict:
         """Group tMap expressions by job for clarity"""
         by_job = defaultdict(list)
         for tmap in self.all_tmap:
-            by_job[tmap.job_name].append(
-                {
+            expression_id = self._interned_expression_id(tmap.expression)
+            if expression_id:
+                entry = {
+                    "component": tmap.component_name,
+                    "column": tmap.output_column,
+                    "expression_id": expression_id,
+                    "type": tmap.data_type,
+                }
+            else:
+                entry = {
                     "component": tmap.component_name,
                     "expression": f"{tmap.output_column} = {tmap.expression}",
                     "type": tmap.data_type,
                 }
-            )
+            by_job[tmap.job_name].append(entry)
         return dict(by_job)
 
 
 # ============================================================
-# MAIN EXECUTION
+# SQLITE EXTRACTION STORE
 # ============================================================
 
+EXTRACTION_STORE_SCHEMA = """
+CREATE TABLE jobs (
+    job TEXT PRIMARY KEY,
+    role TEXT,
+    components INTEGER,
+    sql_count INTEGER,
+    tmap_count INTEGER,
+    complexity INTEGER,
+    has_child_jobs INTEGER
+);
+CREATE TABLE job_children (job TEXT, child_job TEXT);
+CREATE TABLE components (job TEXT, component TEXT, component_type TEXT);
+CREATE TABLE sql_statements (
+    id INTEGER PRIMARY KEY,
+    job TEXT,
+    component TEXT,
+    component_type TEXT,
+    operation TEXT,
+    sql TEXT,
+    fingerprint TEXT,
+    cluster TEXT
+);
+CREATE TABLE sql_context_vars (sql_id INTEGER, variable TEXT);
+CREATE TABLE table_usage (
+    table_name TEXT,
+    job TEXT,
+    component TEXT,
+    operation TEXT,
+    access TEXT,
+    sql_id INTEGER
+);
+CREATE TABLE tables (table_name TEXT PRIMARY KEY, operations TEXT, component_count INTEGER);
+CREATE TABLE tmap_expressions (
+    job TEXT,
+    component TEXT,
+    input_column TEXT,
+    output_column TEXT,
+    expression TEXT,
+    data_type TEXT
+);
+CREATE TABLE context_variables (
+    name TEXT PRIMARY KEY,
+    type TEXT,
+    default_value TEXT,
+    dbt_mapping TEXT,
+    category TEXT
+);
+CREATE INDEX idx_job_children_child ON job_children (child_job);
+CREATE INDEX idx_components_job ON components (job);
+CREATE INDEX idx_components_type ON components (component_type);
+CREATE INDEX idx_sql_job ON sql_statements (job);
+CREATE INDEX idx_sql_component_type ON sql_statements (component_type);
+CREATE INDEX idx_sql_fingerprint ON sql_statements (fingerprint);
+CREATE INDEX idx_sql_context_vars_variable ON sql_context_vars (variable);
+CREATE INDEX idx_table_usage_table ON table_usage (table_name, access);
+CREATE INDEX idx_table_usage_job ON table_usage (job);
+CREATE INDEX idx_tmap_job ON tmap_expressions (job);
+"""
 
-def main() -> None:
-    import sys
 
-    if len(sys.argv) != 3:
-        print(
-            "Usage: python talend_parser_llm_optimized.py <input_folder> <output_dir>"
+class ExtractionStore:
+    """Normalized SQLite copy of an extraction for indexed lookups
+
+    Answers questions such as "which jobs write dim_customer" without loading
+    talend_extraction.json. The database is rebuilt from scratch on every
+    write and swapped into place atomically.
+    """
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        self.db_path = Path(db_path)
+
+    def write(self, parser: "TalendParserLLMOptimized") -> None:
+        """Write the parser's aggregated extraction state to the database"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.db_path.with_suffix(f".tmp{os.getpid()}")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(EXTRACTION_STORE_SCHEMA)
+            with conn:
+                self._write_jobs(conn, parser)
+                self._write_sql(conn, parser)
+                self._write_component_tables(conn, parser)
+                conn.executemany(
+                    "INSERT INTO tables VALUES (?, ?, ?)",
+                    (
+                        (table, ",".join(info["operations"]), info["component_count"])
+                        for table, info in parser._analyze_table_operations().items()
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO tmap_expressions VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (
+                            tmap.job_name,
+                            tmap.component_name,
+                            tmap.input_column,
+                            tmap.output_column,
+                            tmap.expression,
+                            tmap.data_type,
+                        )
+                        for tmap in parser.all_tmap
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO context_variables VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (
+                            var,
+                            info["type"],
+                            info["default"],
+                            info["dbt_mapping"],
+                            parser.context_usage.get(var, {}).get("category", "generic"),
+                        )
+                        for var, info in parser.context_mappings.items()
+                    ),
+                )
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.db_path)
+
+    def _write_jobs(
+        self, conn: sqlite3.Connection, parser: "TalendParserLLMOptimized"
+    ) -> None:
+        for job, info in parser.jobs_summary.items():
+            conn.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job,
+                    parser.job_hierarchy.get(job, "unknown"),
+                    info["components"],
+                    info["sql_count"],
+                    info["tmap_count"],
+                    parser._calculate_complexity(info),
+                    int(info["has_child_jobs"]),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO job_children VALUES (?, ?)",
+                ((job, child) for child in info.get("child_jobs", [])),
+            )
+            components = info.get("dependency_graph", {}).get("components", {})
+            conn.executemany(
+                "INSERT INTO components VALUES (?, ?, ?)",
+                ((job, name, comp.comp_type) for name, comp in components.items()),
+            )
+
+    def _write_sql(
+        self, conn: sqlite3.Connection, parser: "TalendParserLLMOptimized"
+    ) -> None:
+        for sql_id, sql in enumerate(parser.all_sql, start=1):
+            conn.execute(
+                "INSERT INTO sql_statements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    sql_id,
+                    sql.job_name,
+                    sql.component_name,
+                    sql.component_type,
+                    sql.sql_operation,
+                    sql.cleaned_sql,
+                    sql.fingerprint,
+                    sql.cluster or sql.fingerprint,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO sql_context_vars VALUES (?, ?)",
+                ((sql_id, var) for var in sql.context_variables),
+            )
+
+            targets = sql_write_targets(sql)
+            conn.executemany(
+                "INSERT INTO table_usage VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        table,
+                        sql.job_name,
+                        sql.component_name,
+                        sql.sql_operation,
+                        "write" if table in targets else "read",
+                        sql_id,
+                    )
+                    for table in sql.tables
+                ),
+            )
+
+    def _write_component_tables(
+        self, conn: sqlite3.Connection, parser: "TalendParserLLMOptimized"
+    ) -> None:
+        """Table usage known from component settings (e.g. tDBOutput TABLE)"""
+        for job, info in parser.jobs_summary.items():
+            for name, comp in info.get("component_tables", {}).items():
+                access = "write" if comp["operation"] in WRITE_OPERATIONS else "read"
+                conn.executemany(
+                    "INSERT INTO table_usage VALUES (?, ?, ?, ?, ?, NULL)",
+                    (
+                        (table, job, name, comp["operation"], access)
+                        for table in comp["tables"]
+                    ),
+                )
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Extraction store not found: {self.db_path}")
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read-only SQL query against the store"""
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(sql, tuple(params))]
+        finally:
+            conn.close()
+
+    def jobs_using_table(
+        self, table: str, access: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Jobs that read and/or write a table (access: 'read', 'write' or None)"""
+        sql = (
+            "SELECT job, access, group_concat(DISTINCT operation) AS operations, "
+            "group_concat(DISTINCT component) AS components "
+            "FROM table_usage WHERE table_name = ?"
+        )
+        params = [normalize_table_name(table)]
+        if access:
+            sql += " AND access = ?"
+            params.append(access)
+        sql += " GROUP BY job, access ORDER BY job, access"
+        return self.query(sql, params)
+
+    def sql_using_context_var(self, variable: str) -> List[Dict[str, Any]]:
+        """SQL statements that reference a context variable"""
+        variable = variable[len("context.") :] if variable.startswith("context.") else variable
+        return self.query(
+            "SELECT id, job, component, component_type, operation, sql "
+            "FROM sql_statements WHERE id IN ("
+            "SELECT sql_id FROM sql_context_vars WHERE variable = ?) "
+            "OR sql LIKE ? ESCAPE '\\' ORDER BY id",
+            (variable, "%context." + re.sub(r"([%_\\])", r"\\\1", variable) + "%"),
+        )
+
+    def components_of_type(self, component_type: str) -> List[Dict[str, Any]]:
+        """Components of a given Talend type across all jobs"""
+        return self.query(
+            "SELECT job, component, component_type FROM components "
+            "WHERE component_type = ? ORDER BY job, component",
+            (component_type,),
+        )
+
+    def job_details(self, job: str) -> List[Dict[str, Any]]:
+        """Summary row for a job plus its child jobs and tables"""
+        rows = self.query("SELECT * FROM jobs WHERE job = ?", (job,))
+        for row in rows:
+            row["child_jobs"] = [
+                r["child_job"]
+                for r in self.query(
+                    "SELECT child_job FROM job_children WHERE job = ?", (job,)
+                )
+            ]
+            row["tables"] = self.query(
+                "SELECT DISTINCT table_name, access FROM table_usage "
+                "WHERE job = ? ORDER BY table_name, access",
+                (job,),
+            )
+        return rows
+
+
+# ============================================================
+# PARALLEL WORKERS
+# ============================================================
+
+# One parser per worker process, reused for every job the worker handles
+_worker_parser: Optional[TalendParserLLMOptimized] = None
+
+
+def _init_worker(
+    streaming: bool,
+    token_stats: bool,
+    trace_origin_ns: Optional[int] = None,
+    estimate_tokens: bool = False,
+    cache_dir: Optional[str] = None,
+) -> None:
+    """Create the per-process parser used by _parse_job_in_worker
+
+    With a trace origin, spans are recorded against the parent's clock and
+    shipped back in each job result's "trace_events".
+    """
+    global _worker_parser
+    # Forked workers must not share the parent's archive handles (file offset)
+    _open_archive.cache_clear()
+    _worker_parser = TalendParserLLMOptimized(
+        streaming=streaming,
+        token_stats=token_stats,
+        tracer=Tracer(origin_ns=trace_origin_ns) if trace_origin_ns is not None else None,
+        estimate_tokens=estimate_tokens,
+        cache_dir=cache_dir,
+    )
+
+
+def _worker_file_stats(
+    file_path: ItemPath,
+    content: bytes,
+    on_result: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Token statistics for one file, computed inline in a worker process"""
+    assert _worker_parser is not None, "worker not initialized"
+    with _worker_parser.tracer.span("tokenize", "tokens", file=file_path.name):
+        entry = _file_stat_entry(
+            _worker_parser.token_encoder, file_path, content, _worker_parser.estimate_tokens
         )
-        sys.exit(1)
+    if on_result is not None:
+        on_result(entry)
+    return entry
+
+
+def _parse_job_in_worker(file_path: Union[str, ArchiveMember]) -> Dict[str, Any]:
+    """Parse (or load cached) one job file in a worker, reading it at most once"""
+    assert _worker_parser is not None, "worker not initialized"
+    path = file_path if isinstance(file_path, ArchiveMember) else Path(file_path)
+    tracer = _worker_parser.tracer
+    job_result = _worker_parser.extract_job_file(
+        path, _worker_file_stats if _worker_parser.token_stats else None
+    )
+    if tracer.enabled:
+        job_result["trace_events"] = tracer.drain()
+    return job_result
+
 
-    input_folder = sys.argv[1]
-    output_dir = sys.argv[2]
+# ============================================================
+# MAIN EXECUTION
+# ============================================================
+
+
+def query_main(argv: List[str]) -> None:
+    """talend-parser query: indexed lookups against an --sqlite store"""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        prog="talend-parser query",
+        description="Query an extraction store written with --sqlite",
+    )
+    arg_parser.add_argument("db", help="SQLite extraction store")
+    lookup = arg_parser.add_mutually_exclusive_group(required=True)
+    lookup.add_argument("--writes", metavar="TABLE", help="Jobs that write a table")
+    lookup.add_argument("--reads", metavar="TABLE", help="Jobs that read a table")
+    lookup.add_argument("--table", metavar="TABLE", help="Jobs that use a table")
+    lookup.add_argument(
+        "--context-var", metavar="VAR", help="SQL that references a context variable"
+    )
+    lookup.add_argument(
+        "--component-type", metavar="TYPE", help="Components of a Talend type"
+    )
+    lookup.add_argument("--job", metavar="JOB", help="Summary, child jobs and tables")
+    lookup.add_argument("--sql", metavar="QUERY", help="Raw read-only SQL")
+    args = arg_parser.parse_args(argv)
+
+    store = ExtractionStore(args.db)
+    if args.writes:
+        rows = store.jobs_using_table(args.writes, access="write")
+    elif args.reads:
+        rows = store.jobs_using_table(args.reads, access="read")
+    elif args.table:
+        rows = store.jobs_using_table(args.table)
+    elif args.context_var:
+        rows = store.sql_using_context_var(args.context_var)
+    elif args.component_type:
+        rows = store.components_of_type(args.component_type)
+    elif args.job:
+        rows = store.job_details(args.job)
+    else:
+        rows = store.query(args.sql)
+
+    print(json.dumps(rows, indent=2, default=str))
+
+
+def main() -> None:
+    import argparse
+
+    if len(sys.argv) > 1 and sys.argv[1] == "query":
+        query_main(sys.argv[2:])
+        return
+
+    arg_parser = argparse.ArgumentParser(
+        description="Talend Parser - extract Talend jobs into LLM-optimized format"
+    )
+    arg_parser.add_argument(
+        "input_folder", help="Folder (or .zip export) containing Talend .item files"
+    )
+    arg_parser.add_argument("output_dir", help="Output directory for extraction files")
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parse jobs in N worker processes (default: 1, serial)",
+    )
+    arg_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream each .item file with iterparse to bound memory on very large jobs",
+    )
+    arg_parser.add_argument(
+        "--cache-dir",
+        help="Incremental extraction cache; only new or changed jobs are re-parsed",
+    )
+    arg_parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write talend_extraction.json without indentation",
+    )
+    arg_parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Also write one jobs/<job>.json shard per job plus manifest.json",
+    )
+    arg_parser.add_argument(
+        "--bundle-tokens",
+        type=int,
+        metavar="N",
+        help="Also pack jobs into bundles/ of at most N tokens each (one per LLM session)",
+    )
+    arg_parser.add_argument(
+        "--intern-expressions",
+        action="store_true",
+        help="Write repeated tMap expressions once to a shared dictionary",
+    )
+    arg_parser.add_argument(
+        "--drop-raw-sql",
+        action="store_true",
+        help="Keep only cleaned SQL in memory (lower peak memory on huge corpora)",
+    )
+    arg_parser.add_argument(
+        "--sqlite",
+        metavar="DB",
+        help="Also write a normalized SQLite store for `talend-parser query`",
+    )
+    arg_parser.add_argument(
+        "--no-token-stats",
+        action="store_true",
+        help="Skip size/token statistics and token_statistics.txt (e.g. for CI)",
+    )
+    arg_parser.add_argument(
+        "--estimate-tokens",
+        action="store_true",
+        help="Estimate token statistics from a calibrated sample instead of encoding everything",
+    )
+    arg_parser.add_argument(
+        "--all-versions",
+        action="store_true",
+        help="Parse every saved version of each job (default: only the latest)",
+    )
+    arg_parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write per-phase/job/extractor timing spans as a Chrome trace (JSON)",
+    )
+    args = arg_parser.parse_args()
+    if args.bundle_tokens is not None and args.bundle_tokens <= 0:
+        arg_parser.error("--bundle-tokens must be a positive token count")
+
+    input_folder = args.input_folder
+    output_dir = args.output_dir
+    tracer = Tracer() if args.trace else None
 
     # Create parser
-    parser = TalendParserLLMOptimized()
+    parser = TalendParserLLMOptimized(
+        streaming=args.streaming,
+        cache_dir=args.cache_dir,
+        token_stats=not args.no_token_stats,
+        intern_expressions=args.intern_expressions,
+        keep_raw_sql=not args.drop_raw_sql,
+        tracer=tracer,
+        estimate_tokens=args.estimate_tokens,
+        all_versions=args.all_versions,
+    )
 
     # Parse jobs
     logger.info(f"Parsing Talend jobs from: {input_folder}")
-    parser.parse_folder(input_folder)
+    with parser.tracer.span("parse_folder"):
+        parser.parse_folder(input_folder, workers=args.workers, build_output=False)
 
     # Write outputs
-    parser.write_outputs(output_dir)
+    parser.write_outputs(
+        output_dir,
+        compact_json=args.compact_json,
+        sharded=args.sharded,
+        bundle_tokens=args.bundle_tokens,
+    )
+    if args.sqlite:
+        with parser.tracer.span("sqlite_store"):
+            ExtractionStore(args.sqlite).write(parser)
+        logger.info(f"Wrote extraction store to: {args.sqlite}")
+    if tracer is not None:
+        tracer.write(args.trace, process_name="talend-parser")
+        logger.info(f"Wrote trace ({len(tracer.events)} spans) to: {args.trace}")
 
     # Summary
     print("\n" + "=" * 60)
@@ -1905,7 +5629,8 @@ def main() -> None:
 
     # Token statistics summary
     if hasattr(parser, "source_stats") and hasattr(parser, "destination_stats"):
-        print("\nToken Statistics:")
+        estimated = parser.destination_stats.get("token_mode") == "estimate"
+        print("\nToken Statistics (estimated):" if estimated else "\nToken Statistics:")
         print(
             f"  Source: {parser.source_stats['total_tokens']:,} tokens "
             f"({parser.source_stats['total_size_mb']:.2f} MB)"
@@ -1931,7 +5656,14 @@ def main() -> None:
     print(f"  - {output_dir}/transformations.json (tMap)")
     print(f"  - {output_dir}/context_to_dbt.yml (variable mappings)")
     print(f"  - {output_dir}/extraction_summary.txt (summary)")
-    print(f"  - {output_dir}/token_statistics.txt (size & token analysis)")
+    if parser.token_stats:
+        print(f"  - {output_dir}/token_statistics.txt (size & token analysis)")
+    if args.sharded:
+        print(f"  - {output_dir}/manifest.json + jobs/ (per-job shards)")
+    if args.bundle_tokens:
+        print(f"  - {output_dir}/bundles/index.json + bundles/ (token-budget bundles)")
+    if args.sqlite:
+        print(f"  - {args.sqlite} (SQLite store, see `talend-parser query`)")
     print("=" * 60)
 
 
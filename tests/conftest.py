@@ -0,0 +1,117 @@
+"""Shared fixtures: a synthetic Talend export and a parse-and-read helper
+
+Runs are compared through their written outputs, so every mode (workers,
+cache, streaming, .zip) is checked against what a plain serial run writes.
+Token statistics are off, so no tiktoken download is needed. node/flow/
+write_item build small hand-written jobs for focused tests.
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict
+from xml.sax.saxutils import quoteattr
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from synthetic_corpus import CorpusSpec, write_corpus  # noqa: E402
+from talend_parser.talend_parser import TalendParserLLMOptimized  # noqa: E402
+
+PROCESS_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<talendfile:ProcessType xmlns:talendfile='
+    '"platform:/resource/org.talend.model/model/TalendFile.xsd" defaultContext="Default">\n'
+)
+
+PROPERTIES = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<xmi:XMI xmlns:xmi="http://www.omg.org/XMI" '
+    'xmlns:TalendProperties="http://www.talend.org/properties">'
+    '<TalendProperties:Property id="{id}" label="{label}" version="{version}"/></xmi:XMI>\n'
+)
+
+
+def node(comp_type: str, name: str, **params: str) -> str:
+    """A component <node>; params become elementParameters"""
+    elements = "".join(
+        f'    <elementParameter field="TEXT" name="{key}" value={quoteattr(value)}/>\n'
+        for key, value in {"UNIQUE_NAME": name, **params}.items()
+    )
+    return f'  <node componentName="{comp_type}" posX="0" posY="0">\n{elements}  </node>\n'
+
+
+def flow(source: str, target: str, connector: str = "FLOW") -> str:
+    """A process-level <connection> (FLOW unless a trigger is given)"""
+    return (
+        f'  <connection connectorName="{connector}" label="{source}_{target}" '
+        f'source="{source}" target="{target}"/>\n'
+    )
+
+
+def write_item(path: Path, body: str, **properties: str) -> Path:
+    """Write a job .item (and its .properties when id/label/version are given)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(PROCESS_HEADER + body + "</talendfile:ProcessType>\n", encoding="utf-8")
+    if properties:
+        path.with_suffix(".properties").write_text(PROPERTIES.format(**properties))
+    return path
+
+
+def parse_export(export: Path, **options: Any) -> TalendParserLLMOptimized:
+    """Parse an export serially, without building the output dict"""
+    parser = TalendParserLLMOptimized(token_stats=False, **options)
+    parser.parse_folder(str(export), build_output=False)
+    return parser
+
+
+def read_outputs(output_dir: Path) -> Dict[str, str]:
+    """Every written file by relative path, minus the extraction timestamp"""
+    outputs = {}
+    for path in sorted(output_dir.rglob("*")):
+        if path.is_file():
+            lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+            outputs[path.relative_to(output_dir).as_posix()] = "".join(
+                line for line in lines if '"timestamp":' not in line
+            )
+    return outputs
+
+
+def zip_export(export_dir: Path, archive: Path) -> Path:
+    """Pack an export folder into a .zip
+
+    Members are written in rglob order, the order list_item_files gives for
+    the folder, so both inputs parse the jobs in the same sequence.
+    """
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in export_dir.rglob("*"):
+            if path.is_file():
+                zf.write(path, path.relative_to(export_dir).as_posix())
+    return archive
+
+
+@pytest.fixture(scope="session")
+def export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Synthetic export: 14 jobs in 6 folders, linked by tRunJob call trees"""
+    dest = tmp_path_factory.mktemp("export")
+    write_corpus(CorpusSpec(jobs=14, components=8, tmap_columns=6, sql_length=120), dest)
+    return dest
+
+
+@pytest.fixture
+def run_parser(tmp_path: Path) -> Callable[..., Dict[str, str]]:
+    """Parse an export into a fresh output directory and read its outputs"""
+    runs = []
+
+    def run(input_path: Path, workers: int = 1, **options: Any) -> Dict[str, str]:
+        output_dir = tmp_path / f"output_{len(runs)}"
+        runs.append(output_dir)
+        parser = TalendParserLLMOptimized(token_stats=False, **options)
+        parser.parse_folder(str(input_path), workers=workers, build_output=False)
+        parser.write_outputs(str(output_dir))
+        return read_outputs(output_dir)
+
+    return run
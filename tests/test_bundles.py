@@ -0,0 +1,47 @@
+"""plan_bundles packs jobs into bundles that respect the token budget"""
+
+import random
+from typing import Dict, List
+
+import pytest
+
+from talend_parser.talend_parser import JobCallGraph, plan_bundles
+
+
+def call_graph(children: Dict[str, List[str]], jobs: List[str]) -> JobCallGraph:
+    return JobCallGraph({job: {"child_jobs": children.get(job, [])} for job in jobs})
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bundles_stay_within_budget(seed):
+    rng = random.Random(seed)
+    jobs = [f"Job_{index}_0.1" for index in range(60)]
+    job_tokens = {job: rng.randint(50, 900) for job in jobs}
+    children = {jobs[index]: [jobs[index * 3 + 1]] for index in range(19)}
+    tables = {job: rng.sample(["orders", "customers", "audit", "dates"], 2) for job in jobs}
+
+    bundles = plan_bundles(job_tokens, jobs, call_graph(children, jobs), tables, budget=2000)
+
+    assert sorted(job for bundle in bundles for job in bundle) == sorted(jobs)
+    for bundle in bundles:
+        assert sum(job_tokens[job] for job in bundle) <= 2000
+
+
+def test_job_over_budget_gets_its_own_bundle():
+    jobs = ["Small_0.1", "Huge_0.1", "Tiny_0.1"]
+    job_tokens = {"Small_0.1": 300, "Huge_0.1": 5000, "Tiny_0.1": 200}
+
+    bundles = plan_bundles(job_tokens, jobs, call_graph({}, jobs), {}, budget=1000)
+
+    assert ["Huge_0.1"] in bundles
+    assert all(len(bundle) == 1 for bundle in bundles if "Huge_0.1" in bundle)
+
+
+def test_call_tree_stays_together_when_it_fits():
+    jobs = ["Parent_0.1", "Other_0.1", "Child_0.1"]
+    job_tokens = {"Parent_0.1": 400, "Other_0.1": 700, "Child_0.1": 400}
+    children = {"Parent_0.1": ["Child_0.1"]}
+
+    bundles = plan_bundles(job_tokens, jobs, call_graph(children, jobs), {}, budget=1000)
+
+    assert ["Parent_0.1", "Child_0.1"] in bundles
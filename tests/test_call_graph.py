@@ -0,0 +1,77 @@
+"""tRunJob references resolve to the jobs they call"""
+
+from conftest import node, parse_export, write_item
+
+from talend_parser.talend_parser import JobCallGraph
+
+
+def run_job(name: str, **params: str) -> str:
+    return node("tRunJob", name, **params)
+
+
+def test_reference_by_name_and_by_repository_id(tmp_path):
+    write_item(
+        tmp_path / "Master_0.1.item",
+        run_job("tRunJob_1", PROCESS='"LoadOrders"')
+        + run_job(
+            "tRunJob_2",
+            **{"PROCESS:PROCESS_TYPE_PROCESS": "_refunds", "PROCESS:PROCESS_TYPE_VERSION": "0.1"},
+        ),
+        id="_master",
+        label="Master",
+        version="0.1",
+    )
+    for version in ("0.1", "0.2"):
+        write_item(
+            tmp_path / f"LoadOrders_{version}.item",
+            "",
+            id="_orders",
+            label="LoadOrders",
+            version=version,
+        )
+    write_item(tmp_path / "Refunds_0.1.item", "", id="_refunds", label="Refunds", version="0.1")
+
+    parser = parse_export(tmp_path)
+
+    assert parser.jobs_summary["Master_0.1"]["child_jobs"] == ["LoadOrders", "_refunds_0.1"]
+    assert parser.call_graph.callees("Master_0.1") == ["LoadOrders_0.2", "Refunds_0.1"]
+    assert parser.call_graph.unresolved == {}
+    assert parser.call_graph.roots() == ["Master_0.1"]
+
+
+def test_bare_parameter_names_and_latest_version(tmp_path):
+    write_item(
+        tmp_path / "Master_0.1.item",
+        run_job("tRunJob_1", PROCESS_TYPE_PROCESS="_child", PROCESS_TYPE_VERSION="Latest"),
+    )
+    write_item(tmp_path / "Child_0.1.item", "", id="_child", label="Child", version="0.1")
+
+    parser = parse_export(tmp_path)
+
+    assert parser.jobs_summary["Master_0.1"]["child_jobs"] == ["_child"]
+    assert parser.call_graph.callees("Master_0.1") == ["Child_0.1"]
+
+
+def test_pinned_version_that_was_not_parsed_falls_back_to_latest():
+    graph = JobCallGraph(
+        {"Master_0.1": {"child_jobs": ["Child_0.3", "_id_0.1"]}, "Child_0.2": {}, "Other_1.0": {}},
+        job_ids={"_id": "Other"},
+    )
+
+    assert graph.callees("Master_0.1") == ["Child_0.2", "Other_1.0"]
+    assert graph.role("Master_0.1") == "orchestrator_top"
+    assert graph.role("Child_0.2") == "processor"
+
+
+def test_unknown_references_are_kept_as_unresolved():
+    graph = JobCallGraph({"Master_0.1": {"child_jobs": ["Missing", "_gone_0.1"]}})
+
+    assert graph.callees("Master_0.1") == []
+    assert graph.unresolved == {"Master_0.1": ["Missing", "_gone_0.1"]}
+
+
+def test_synthetic_corpus_references_all_resolve(export_dir):
+    parser = parse_export(export_dir)
+
+    assert any(parser.call_graph.callees(job) for job in parser.jobs_summary)
+    assert parser.call_graph.unresolved == {}
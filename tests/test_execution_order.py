@@ -0,0 +1,68 @@
+"""Component execution order and the subjob boundaries proposed as models"""
+
+from conftest import flow, node, parse_export, write_item
+
+
+def dependency_graph(tmp_path, body: str):
+    write_item(tmp_path / "Load_0.1.item", body)
+    return parse_export(tmp_path).jobs_summary["Load_0.1"]["dependency_graph"]
+
+
+def test_order_follows_flows_with_document_order_ties(tmp_path):
+    graph = dependency_graph(
+        tmp_path,
+        node("tDBOutput", "tDBOutput_1", TABLE='"orders_clean"')
+        + node("tMap", "tMap_1")
+        + node("tDBInput", "tDBInput_2", QUERY='"SELECT id FROM customers"')
+        + node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM orders"')
+        + flow("tDBInput_1", "tMap_1")
+        + flow("tDBInput_2", "tMap_1", connector="LOOKUP")
+        + flow("tMap_1", "tDBOutput_1"),
+    )
+
+    assert graph["execution_order"] == ["tDBInput_2", "tDBInput_1", "tMap_1", "tDBOutput_1"]
+
+
+def test_components_in_a_cycle_are_appended_in_document_order(tmp_path):
+    graph = dependency_graph(
+        tmp_path,
+        node("tMap", "tMap_2")
+        + node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM orders"')
+        + node("tMap", "tMap_1")
+        + flow("tMap_1", "tMap_2")
+        + flow("tMap_2", "tMap_1"),
+    )
+
+    assert graph["execution_order"] == ["tDBInput_1", "tMap_2", "tMap_1"]
+
+
+def test_subjobs_become_model_boundaries(tmp_path):
+    graph = dependency_graph(
+        tmp_path,
+        node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM orders"')
+        + node("tFilterRow", "tFilterRow_1")
+        + node("tDBOutput", "tDBOutput_1", TABLE='"orders_clean"')
+        + node("tDBOutput", "tDBOutput_2", TABLE='"orders_rejected"')
+        + node("tDBInput", "tDBInput_2", QUERY='"SELECT id FROM orders_clean"')
+        + node("tDBOutput", "tDBOutput_3", TABLE='"orders_summary"')
+        + flow("tDBInput_1", "tFilterRow_1")
+        + flow("tFilterRow_1", "tDBOutput_1")
+        + flow("tFilterRow_1", "tDBOutput_2", connector="REJECT")
+        + flow("tDBInput_2", "tDBOutput_3")
+        + flow("tDBInput_1", "tDBInput_2", connector="SUBJOB_OK"),
+    )
+
+    assert graph["model_boundaries"] == [
+        {
+            "start": "tDBInput_1",
+            "components": ["tDBInput_1", "tFilterRow_1", "tDBOutput_1", "tDBOutput_2"],
+            "outputs": ["tDBOutput_1", "tDBOutput_2"],
+            "triggered_by": [],
+        },
+        {
+            "start": "tDBInput_2",
+            "components": ["tDBInput_2", "tDBOutput_3"],
+            "outputs": ["tDBOutput_3"],
+            "triggered_by": [{"from": "tDBInput_1", "type": "SUBJOB_OK"}],
+        },
+    ]
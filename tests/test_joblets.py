@@ -0,0 +1,91 @@
+"""Joblets are spliced into the jobs that embed them, decoded once per run"""
+
+from pathlib import Path
+
+import pytest
+from conftest import flow, node, parse_export, write_item
+
+from talend_parser.talend_parser import TalendParserLLMOptimized
+
+
+def host_job(table: str) -> str:
+    return (
+        node("tDBInput", "tDBInput_1", QUERY=f'"SELECT id, amount FROM {table}"')
+        + node("Cleanup", "Cleanup_1")
+        + node("tDBOutput", "tDBOutput_1", TABLE=f'"{table}_clean"')
+        + flow("tDBInput_1", "Cleanup_1")
+        + flow("Cleanup_1", "tDBOutput_1")
+    )
+
+
+@pytest.fixture
+def joblet_export(tmp_path: Path) -> Path:
+    """Two jobs embedding the Cleanup joblet (input -> tDBRow -> output, tDie)"""
+    write_item(
+        tmp_path / "joblets" / "Cleanup_0.1.item",
+        '  <context name="Default">\n'
+        '    <contextParameter name="purge_days" type="id_Integer" value="30"/>\n'
+        "  </context>\n"
+        + node("tJobletInput", "INPUT_1")
+        + node("tDBRow", "tDBRow_1", QUERY='"DELETE FROM staging WHERE id IS NULL"')
+        + node("tDie", "tDie_1", MESSAGE='"cleanup failed"')
+        + node("tJobletOutput", "OUTPUT_1")
+        + flow("INPUT_1", "tDBRow_1")
+        + flow("tDBRow_1", "OUTPUT_1"),
+    )
+    write_item(tmp_path / "process" / "LoadOrders_0.1.item", host_job("orders"))
+    write_item(tmp_path / "process" / "LoadRefunds_0.1.item", host_job("refunds"))
+    return tmp_path
+
+
+def test_joblet_instance_is_replaced_by_its_components(joblet_export):
+    parser = parse_export(joblet_export)
+    summary = parser.jobs_summary["LoadOrders_0.1"]
+    components = summary["dependency_graph"]["components"]
+
+    assert "Cleanup_1" not in components
+    assert components["Cleanup_1.tDBRow_1"].comp_type == "tDBRow"
+    assert components["tDBInput_1"].outputs == ["Cleanup_1.INPUT_1"]
+    assert components["Cleanup_1.INPUT_1"].outputs == ["Cleanup_1.tDBRow_1"]
+    assert components["Cleanup_1.OUTPUT_1"].outputs == ["tDBOutput_1"]
+    assert components["tDBOutput_1"].inputs == ["Cleanup_1.OUTPUT_1"]
+    assert summary["joblet_instances"] == {"Cleanup_1": "Cleanup"}
+
+
+def test_joblet_sections_are_namespaced_into_the_job(joblet_export):
+    parser = parse_export(joblet_export, keep_raw_sql=True)
+
+    # Both jobs extract the joblet's statement; deduplication keeps the first
+    joblet_sql = [sql for sql in parser.all_sql if sql.component_name == "Cleanup_1.tDBRow_1"]
+    assert len(joblet_sql) == 1
+    assert joblet_sql[0].job_name in ("LoadOrders_0.1", "LoadRefunds_0.1")
+    assert "staging" in parser.jobs_summary["LoadOrders_0.1"]["tables"]
+    assert [pattern["component"] for pattern in parser.error_patterns["LoadRefunds_0.1"]] == [
+        "Cleanup_1.tDie_1"
+    ]
+    assert "purge_days" in parser.context_mappings
+
+
+def test_joblet_is_indexed_with_its_connectors(joblet_export):
+    entry = parse_export(joblet_export).repository_objects["joblet"]["Cleanup"]
+
+    assert entry["inputs"] == ["INPUT_1"]
+    assert entry["outputs"] == ["OUTPUT_1"]
+    assert entry["components"]["tDBRow_1"] == "tDBRow"
+
+
+def test_joblet_is_decoded_once(joblet_export, monkeypatch):
+    parsed = []
+    process_job = TalendParserLLMOptimized._process_job
+
+    def record(self, file_path, content=None):
+        parsed.append(file_path.stem)
+        process_job(self, file_path, content)
+
+    monkeypatch.setattr(TalendParserLLMOptimized, "_process_job", record)
+    parse_export(joblet_export)
+    assert sorted(parsed) == ["Cleanup_0.1", "LoadOrders_0.1", "LoadRefunds_0.1"]
+
+
+def test_workers_splice_like_serial(joblet_export, run_parser):
+    assert run_parser(joblet_export, workers=2) == run_parser(joblet_export)
@@ -0,0 +1,73 @@
+"""write_json_stream writes exactly what json.dump would"""
+
+import io
+import json
+import re
+from pathlib import Path
+
+import pytest
+from conftest import parse_export
+
+from talend_parser.talend_parser import StreamedDict, StreamedList, write_json_stream
+
+
+def sections():
+    """Plain and streamed sections, nested and empty, with non-JSON values"""
+    return [
+        ("metadata", {"version": "3", "tables": {"orders"}, "path": Path("a/b")}),
+        ("empty_list", StreamedList(iter([]))),
+        ("empty_dict", StreamedDict(iter([]))),
+        (
+            "jobs",
+            StreamedList(
+                {"job": f"Job_{i}", "sql": ["SELECT 1", 'é "q"\n']} for i in range(3)
+            ),
+        ),
+        (
+            "by_job",
+            StreamedDict(
+                (f"Job_{i}", StreamedList(iter([i, None, True, 1.5]))) for i in range(2)
+            ),
+        ),
+        ("plain", [[], {}, [{"a": []}]]),
+    ]
+
+
+def materialized():
+    def plain(value):
+        if isinstance(value, StreamedList):
+            return [plain(item) for item in value.items]
+        if isinstance(value, StreamedDict):
+            return {key: plain(item) for key, item in value.items}
+        return value
+
+    return {key: plain(value) for key, value in sections()}
+
+
+@pytest.mark.parametrize(
+    "indent, expected",
+    [
+        (2, lambda data: json.dumps(data, indent=2, default=str)),
+        (None, lambda data: json.dumps(data, separators=(",", ":"), default=str)),
+    ],
+    ids=["indent", "compact"],
+)
+def test_matches_json_dump(indent, expected):
+    f = io.StringIO()
+    write_json_stream(f, sections(), indent=indent)
+    assert f.getvalue() == expected(materialized())
+
+
+def without_timestamp(text: str) -> str:
+    return re.sub(r'"timestamp": ?"[^"]*"', '"timestamp": ""', text)
+
+
+@pytest.mark.parametrize("compact_json", [False, True], ids=["indent", "compact"])
+def test_extraction_file_matches_json_dump(export_dir, tmp_path, compact_json):
+    parser = parse_export(export_dir)
+    parser.write_outputs(str(tmp_path), compact_json=compact_json)
+
+    options = {"separators": (",", ":")} if compact_json else {"indent": 2}
+    expected = json.dumps(parser._create_llm_output(), default=str, **options)
+    written = (tmp_path / "talend_extraction.json").read_text(encoding="utf-8")
+    assert without_timestamp(written) == without_timestamp(expected)
@@ -0,0 +1,79 @@
+"""Table-level lineage between jobs, built from SQL and component settings"""
+
+import random
+
+from conftest import flow, node, parse_export, write_item
+
+from talend_parser.talend_parser import TableLineageGraph, strongly_connected_components
+
+
+def test_components_are_topologically_ordered():
+    edges = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": ["e"], "e": ["d", "f"], "f": []}
+
+    components = strongly_connected_components(edges, edges.__getitem__)
+
+    assert components == [["a"], ["c"], ["b"], ["d", "e"], ["f"]]
+
+
+def test_components_of_a_long_chain_do_not_recurse():
+    jobs = [f"job_{i}" for i in range(5000)]
+    edges = {job: [jobs[i + 1]] if i + 1 < len(jobs) else [] for i, job in enumerate(jobs)}
+    edges[jobs[-1]] = [jobs[0]]
+
+    assert strongly_connected_components(edges, edges.__getitem__) == [jobs]
+
+
+def test_every_edge_points_forward_in_the_order():
+    rng = random.Random(7)
+    edges = {i: rng.sample(range(40), 3) for i in range(40)}
+
+    components = strongly_connected_components(edges, edges.__getitem__)
+
+    position = {node: index for index, group in enumerate(components) for node in group}
+    assert sorted(position) == list(range(40))
+    for source, targets in edges.items():
+        assert all(position[source] <= position[target] for target in targets)
+
+
+def test_lineage_graph_orders_producers_first():
+    graph = TableLineageGraph()
+    graph.set_job("Report", reads=["dim_customer", "fact_sales"], writes=[])
+    graph.set_job("LoadFacts", reads=["stg_sales"], writes=["fact_sales"])
+    graph.set_job("LoadDims", reads=["stg_customer", "audit"], writes=["DIM_CUSTOMER", "audit"])
+    graph.set_job("Audit", reads=["audit"], writes=["audit"])
+
+    order, cycles = graph.topological_order()
+
+    assert order.index("LoadDims") < order.index("Report")
+    assert order.index("LoadFacts") < order.index("Report")
+    assert cycles == [["LoadDims", "Audit"]]
+    assert graph.upstream_tables("Dim_Customer") == ["stg_customer", "audit"]
+    assert graph.downstream_jobs("LoadFacts") == ["Report"]
+
+    graph.set_job("LoadFacts", reads=["stg_sales"], writes=[])
+    assert graph.downstream_jobs("LoadFacts") == []
+    assert "fact_sales" not in graph.table_writers
+
+
+def test_output_table_setting_without_a_connection_is_a_write(tmp_path):
+    write_item(
+        tmp_path / "LoadCustomers_0.1.item",
+        node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM stg_customer"')
+        + node("tDBOutput", "tDBOutput_1", TABLE='"DIM_CUSTOMER"')
+        + flow("tDBInput_1", "tDBOutput_1"),
+    )
+    write_item(
+        tmp_path / "Report_0.1.item",
+        node(
+            "tDBInput",
+            "tDBInput_1",
+            TABLE='"Dim_Customer"',
+            QUERY='"SELECT * FROM dim_customer"',
+        ),
+    )
+
+    lineage = parse_export(tmp_path).table_lineage
+
+    assert lineage.table_writers == {"dim_customer": {"LoadCustomers_0.1": None}}
+    assert list(lineage.table_readers["dim_customer"]) == ["Report_0.1"]
+    assert lineage.downstream_jobs("LoadCustomers_0.1") == ["Report_0.1"]
@@ -0,0 +1,108 @@
+"""Workers, the extraction cache, streaming and .zip input match serial output"""
+
+from pathlib import Path
+
+import pytest
+from conftest import flow, node, parse_export, write_item, zip_export
+
+from talend_parser.talend_parser import TalendParserLLMOptimized
+
+
+def test_workers_match_serial(export_dir, run_parser):
+    assert run_parser(export_dir, workers=3) == run_parser(export_dir)
+
+
+def test_streaming_matches_serial(export_dir, run_parser):
+    serial = run_parser(export_dir)
+    assert run_parser(export_dir, streaming=True) == serial
+    assert run_parser(export_dir, workers=2, streaming=True) == serial
+
+
+def test_streaming_drops_a_malformed_job_like_the_tree_parser(tmp_path):
+    write_item(
+        tmp_path / "Good_0.1.item",
+        node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM orders"'),
+    )
+    broken = write_item(
+        tmp_path / "Broken_0.1.item",
+        node("tDBInput", "tDBInput_1", QUERY='"SELECT id FROM refunds"')
+        + node("tMap", "tMap_1")
+        + flow("tDBInput_1", "tMap_1"),
+    )
+    broken.write_text(broken.read_text(encoding="utf-8")[:-40], encoding="utf-8")
+
+    tree = parse_export(tmp_path)
+    streamed = parse_export(tmp_path, streaming=True)
+
+    assert list(streamed.jobs_summary) == list(tree.jobs_summary) == ["Good_0.1"]
+    assert [sql.job_name for sql in streamed.all_sql] == ["Good_0.1"]
+    assert streamed.all_tables == tree.all_tables == {"orders"}
+
+
+def test_cache_cold_and_warm_runs_match_serial(export_dir, run_parser, tmp_path):
+    serial = run_parser(export_dir)
+    cache_dir = tmp_path / "cache"
+
+    assert run_parser(export_dir, cache_dir=str(cache_dir)) == serial
+    assert len(list(cache_dir.rglob("*.pkl"))) == len(list(export_dir.rglob("*.item")))
+    assert run_parser(export_dir, cache_dir=str(cache_dir)) == serial
+    assert run_parser(export_dir, workers=2, cache_dir=str(cache_dir)) == serial
+
+
+def test_warm_cache_does_not_parse_jobs(export_dir, run_parser, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    cold = run_parser(export_dir, cache_dir=cache_dir)
+
+    def fail(self, file_path, content=None):
+        pytest.fail(f"{file_path.name} parsed despite a cache entry")
+
+    monkeypatch.setattr(TalendParserLLMOptimized, "parse_job_isolated", fail)
+    assert run_parser(export_dir, cache_dir=cache_dir) == cold
+
+
+def test_edited_job_is_a_cache_miss(export_dir, run_parser, tmp_path):
+    edited = tmp_path / "edited"
+    for path in export_dir.rglob("*.item"):
+        target = edited / path.relative_to(export_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(path.read_bytes())
+    cache_dir = str(tmp_path / "cache")
+    run_parser(edited, cache_dir=cache_dir)
+
+    job_file = sorted(edited.rglob("*.item"))[0]
+    job_file.write_text(
+        job_file.read_text(encoding="utf-8").replace("tDBOutput", "tDBOutputBulk"),
+        encoding="utf-8",
+    )
+    assert run_parser(edited, cache_dir=cache_dir) == run_parser(edited)
+
+
+def test_zip_export_matches_folder(export_dir, run_parser, tmp_path):
+    archive = zip_export(export_dir, tmp_path / "export.zip")
+    serial = run_parser(export_dir)
+
+    assert run_parser(archive) == serial
+    assert run_parser(archive, workers=2) == serial
+    assert run_parser(archive, streaming=True) == serial
+
+
+def test_zip_member_is_streamed_without_buffering(export_dir, tmp_path, monkeypatch):
+    archive = zip_export(export_dir, tmp_path / "export.zip")
+
+    def fail(self):
+        pytest.fail("archive member read into memory without token statistics")
+
+    monkeypatch.setattr("talend_parser.talend_parser.ArchiveMember.read_bytes", fail)
+    parser = TalendParserLLMOptimized(token_stats=False, streaming=True)
+    parser.parse_folder(str(archive), build_output=False)
+    assert len(parser.jobs_summary) == 14
+
+
+def test_path_is_parsed_without_buffering(export_dir, monkeypatch):
+    def fail(self):
+        pytest.fail("job file read into memory without token statistics")
+
+    monkeypatch.setattr(Path, "read_bytes", fail)
+    parser = TalendParserLLMOptimized(token_stats=False, streaming=True)
+    parser.parse_folder(str(export_dir), build_output=False)
+    assert len(parser.jobs_summary) == len(list(export_dir.rglob("*.item")))
@@ -0,0 +1,110 @@
+"""Repository items are classified and jobs resolve their metadata references"""
+
+from pathlib import Path
+
+import pytest
+from conftest import PROPERTIES, flow, node, parse_export, write_item
+
+from talend_parser.talend_parser import build_metadata_index, classify_item
+
+METADATA_CONNECTION = """<?xml version="1.0" encoding="UTF-8"?>
+<TalendMetadata:DatabaseConnection xmi:version="2.0" xmlns:xmi="http://www.omg.org/XMI" \
+xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
+xmlns:TalendMetadata="http://www.talend.org/metadata/connection/2010" \
+xmlns:relational="http:///orgomg/cwm/resource/relational.ecore" \
+id="_dwh" label="pg_dwh" DatabaseType="PostgreSQL" ServerName="db" Port="5432" SID="dwh" \
+UiSchema="public" Username="etl" Password="secret">
+  <dataPackage xsi:type="relational:Catalog" name="dwh">
+    <ownedElement xsi:type="TalendMetadata:MetadataTable" label="dim_customer" \
+tableName="dim_customer">
+      <feature xsi:type="TalendMetadata:MetadataColumn" label="id" talendType="id_Integer" \
+sourceType="INT4" nullable="false" key="true"/>
+      <feature xsi:type="TalendMetadata:MetadataColumn" label="email" talendType="id_String"/>
+    </ownedElement>
+  </dataPackage>
+</TalendMetadata:DatabaseConnection>
+"""
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "relative, text, item_type",
+    [
+        ("process/sales/Load_0.1.item", "<talendfile:ProcessType/>", "job"),
+        ("joblets/Cleanup_0.1.item", "<talendfile:ProcessType/>", "joblet"),
+        ("metadata/connections/pg_0.1.item", "<ignored/>", "metadata"),
+        ("context/Globals_0.1.item", "<ignored/>", "context"),
+        ("code/routines/Util_0.1.item", "package routines;", "routine"),
+        ("sqlPatterns/Generic/Tpl_0.1.item", "SELECT 1", "sql_template"),
+        ("Load_0.1.item", '<?xml version="1.0"?>\n<talendfile:ProcessType/>', "job"),
+        ("pg_0.1.item", METADATA_CONNECTION, "metadata"),
+        ("Globals_0.1.item", '<xmi:XMI><talendfile:ContextType name="Default"/>', "context"),
+        ("Broken_0.1.item", "<talendfile:ProcessType", "job"),
+        ("Util_0.1.item", "package routines;\npublic class Util {}", "other"),
+    ],
+)
+def test_classify_item(tmp_path, relative, text, item_type):
+    assert classify_item(write(tmp_path / relative, text), tmp_path) == item_type
+
+
+def test_metadata_index_keys_connections_and_tables_by_id():
+    index = build_metadata_index(
+        {
+            "pg_dwh": {
+                "id": "_dwh",
+                "file": "metadata/pg_dwh_0.1.item",
+                "database_type": "PostgreSQL",
+                "tables": {"dim_customer": {"table": "dim_customer", "columns": []}},
+            },
+            "no_id": {"id": None, "tables": {"t": {"table": "t", "columns": []}}},
+        }
+    )
+
+    assert index == {
+        "_dwh": {"name": "pg_dwh", "database_type": "PostgreSQL"},
+        "_dwh - dim_customer": {"connection": "pg_dwh", "table": "dim_customer", "columns": []},
+    }
+
+
+def test_jobs_resolve_repository_schemas_and_connections(tmp_path):
+    write(tmp_path / "metadata" / "connections" / "pg_dwh_0.1.item", METADATA_CONNECTION)
+    write(
+        tmp_path / "metadata" / "connections" / "pg_dwh_0.1.properties",
+        PROPERTIES.format(id="_dwh", label="pg_dwh", version="0.1"),
+    )
+    repository = {
+        "PROPERTY:PROPERTY_TYPE": "REPOSITORY",
+        "PROPERTY:REPOSITORY_PROPERTY_TYPE": "_dwh",
+    }
+    write_item(
+        tmp_path / "process" / "Load_0.1.item",
+        node("tDBConnection", "tDBConnection_1", **repository)
+        + node(
+            "tDBInput",
+            "tDBInput_1",
+            QUERY='"SELECT id, email FROM dim_customer"',
+            **{"SCHEMA:SCHEMA_TYPE": "REPOSITORY"},
+            **{"SCHEMA:REPOSITORY_SCHEMA_TYPE": "_dwh - dim_customer"},
+        )
+        + node("tMap", "tMap_1")
+        + flow("tDBInput_1", "tMap_1"),
+    )
+
+    parser = parse_export(tmp_path)
+    summary = parser.jobs_summary["Load_0.1"]
+
+    assert parser.repository_objects["metadata"]["pg_dwh"]["id"] == "_dwh"
+    assert "secret" not in str(parser.repository_objects["metadata"])
+    assert summary["repository_refs"] == ["_dwh"]
+    assert summary["tmap_structures"]["tMap_1"]["input_schemas"]["tDBInput_1_tMap_1"] == [
+        {"name": "id", "type": "id_Integer", "nullable": False},
+        {"name": "email", "type": "id_String", "nullable": True},
+    ]
+    connection = parser.connection_metadata["Load_0.1"]["tDBConnection_1"]["repository"]
+    assert connection["name"] == "pg_dwh"
+    assert connection["server"] == "db"
@@ -0,0 +1,86 @@
+"""SQL fingerprints, near-duplicate clusters and what duplicates keep"""
+
+from conftest import node, parse_export, write_item
+
+from talend_parser.talend_parser import (
+    canonicalize_sql,
+    cluster_near_duplicates,
+    sql_fingerprint,
+)
+
+
+def test_literals_aliases_and_case_share_a_canonical_form():
+    forms = {
+        canonicalize_sql(sql)
+        for sql in [
+            "SELECT o.id, o.amount FROM orders o WHERE o.region = 'EU' AND o.qty > 10",
+            "select x.id , x.amount\nfrom ORDERS AS x where x.region='US' and x.qty>250",
+            "SELECT t.id, t.amount FROM \"orders\" t WHERE t.region = 'APAC' AND t.qty > 0",
+        ]
+    }
+    assert len(forms) == 1
+
+
+def test_context_variables_share_a_canonical_form():
+    assert canonicalize_sql(
+        "DELETE FROM audit WHERE run_date < '\"+context.run_date+\"'"
+    ) == canonicalize_sql("DELETE FROM audit WHERE run_date < '${context.load_date}'")
+
+
+def test_different_tables_keep_different_fingerprints():
+    assert sql_fingerprint(canonicalize_sql("SELECT id FROM orders")) != sql_fingerprint(
+        canonicalize_sql("SELECT id FROM refunds")
+    )
+
+
+def test_join_keywords_are_not_aliases():
+    canonical = canonicalize_sql("SELECT * FROM orders NATURAL JOIN customers")
+    assert canonical == "select*from orders natural join customers"
+    assert "?a" not in canonicalize_sql("SELECT * FROM a LEFT JOIN b ON a.id = b.id")
+
+
+def test_near_duplicates_cluster_per_partition():
+    columns = ", ".join(f"col_{i}" for i in range(30))
+    forms = [
+        canonicalize_sql(f"SELECT {columns} FROM orders WHERE id = 1"),
+        canonicalize_sql(f"SELECT {columns}, extra FROM orders WHERE id = 1"),
+        canonicalize_sql("DELETE FROM audit WHERE run_date < ?"),
+        canonicalize_sql(f"SELECT {columns}, extra FROM orders WHERE id = 1"),
+    ]
+
+    assert cluster_near_duplicates(forms) == [0, 0, 2, 0]
+    assert cluster_near_duplicates(forms, ["SELECT", "INSERT", "DELETE", "SELECT"]) == [
+        0,
+        1,
+        2,
+        0,
+    ]
+
+
+def test_fingerprint_duplicates_keep_their_differing_literals(tmp_path):
+    queries = [
+        "SELECT id FROM orders WHERE region = 'EU' AND age < 30",
+        "SELECT id FROM orders WHERE region = 'US' AND age < 30",
+        "SELECT id FROM orders WHERE region = 'EU' AND age < 90",
+        "SELECT id FROM refunds WHERE id IN (1, 2, 3)",
+        "SELECT id FROM refunds WHERE id IN (4)",
+    ]
+    write_item(
+        tmp_path / "Load_0.1.item",
+        "".join(
+            node("tDBInput", f"tDBInput_{index}", QUERY=f'"{query}"')
+            for index, query in enumerate(queries)
+        ),
+    )
+
+    entries = [sql.to_llm_format() for sql in parse_export(tmp_path).all_sql]
+
+    assert entries[0]["cluster_size"] == 3
+    assert entries[1]["same_as"] == entries[0]["fingerprint"]
+    assert entries[1]["literals"] == [["'EU'", "'US'"]]
+    assert "sql" not in entries[1]
+    assert entries[2]["literals"] == [["30", "90"]]
+    # IN lists of different length cannot be paired up, so the SQL is kept
+    assert entries[4]["same_as"] == entries[3]["fingerprint"]
+    assert entries[4]["sql"] == queries[4]
+    assert "literals" not in entries[4]
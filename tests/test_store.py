@@ -0,0 +1,82 @@
+"""The SQLite extraction store and the `talend-parser query` subcommand"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from conftest import flow, node, parse_export, write_item
+
+from talend_parser.talend_parser import ExtractionStore, main
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ExtractionStore:
+    """LoadCustomers writes DIM_CUSTOMER through a TABLE setting (no SQL and
+    no tDBConnection); Report reads it back with a query"""
+    export = tmp_path / "export"
+    write_item(
+        export / "LoadCustomers_0.1.item",
+        node("tDBInput", "tDBInput_1", QUERY='"SELECT id, name FROM stg_customer"')
+        + node("tDBOutput", "tDBOutput_1", TABLE='"DIM_CUSTOMER"', DATA_ACTION="INSERT")
+        + flow("tDBInput_1", "tDBOutput_1"),
+    )
+    write_item(
+        export / "Report_0.1.item",
+        node(
+            "tDBInput",
+            "tDBInput_1",
+            QUERY='"SELECT * FROM dim_customer WHERE region = \'"+context.region+"\'"',
+        )
+        + node("tLogRow", "tLogRow_1")
+        + flow("tDBInput_1", "tLogRow_1"),
+    )
+    store = ExtractionStore(tmp_path / "extraction.db")
+    store.write(parse_export(export))
+    return store
+
+
+def test_jobs_using_table_match_any_case(store):
+    writers = store.jobs_using_table("Dim_Customer", access="write")
+    readers = store.jobs_using_table("dim_customer", access="read")
+
+    assert [(row["job"], row["components"]) for row in writers] == [
+        ("LoadCustomers_0.1", "tDBOutput_1")
+    ]
+    assert [row["job"] for row in readers] == ["Report_0.1"]
+    assert [row["job"] for row in store.jobs_using_table("STG_CUSTOMER")] == [
+        "LoadCustomers_0.1"
+    ]
+
+
+def test_lookups(store):
+    assert [row["job"] for row in store.sql_using_context_var("context.region")] == [
+        "Report_0.1"
+    ]
+    assert [row["job"] for row in store.components_of_type("tDBOutput")] == [
+        "LoadCustomers_0.1"
+    ]
+    rows = store.query("SELECT job, components FROM jobs ORDER BY job")
+    assert rows == [
+        {"job": "LoadCustomers_0.1", "components": 2},
+        {"job": "Report_0.1", "components": 1},
+    ]
+
+
+def test_store_is_replaced_on_rewrite(store, tmp_path):
+    store.write(parse_export(tmp_path / "export"))
+    assert len(store.query("SELECT * FROM jobs")) == 2
+
+
+def test_query_subcommand(store, monkeypatch, capsys):
+    argv = ["talend-parser", "query", str(store.db_path), "--writes", "DIM_CUSTOMER"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row["job"], row["access"]) for row in rows] == [("LoadCustomers_0.1", "write")]
+
+
+def test_missing_store_is_an_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ExtractionStore(tmp_path / "missing.db").query("SELECT 1")
@@ -0,0 +1,58 @@
+"""--estimate-tokens stays within its reported margin of the exact count"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from synthetic_corpus import CorpusSpec, write_corpus
+
+from talend_parser.talend_parser import FileStatsCollector
+
+
+class WordEncoder:
+    """Stand-in for tiktoken: one token per word or punctuation mark"""
+
+    def encode(self, text: str) -> List[str]:
+        return re.findall(r"\w+|[^\w\s]", text)
+
+
+def collect(files: List[Path], estimate: bool) -> Dict[str, Any]:
+    collector = FileStatsCollector(WordEncoder(), estimate=estimate)
+    for path in files:
+        collector.add(collector.submit(path))
+    return collector.summarize("Source", len(files))
+
+
+@pytest.fixture(scope="module")
+def large_export(tmp_path_factory: pytest.TempPathFactory) -> List[Path]:
+    """Jobs large enough that most of their chunks are extrapolated"""
+    dest = tmp_path_factory.mktemp("large_export")
+    write_corpus(CorpusSpec(jobs=12, components=60, tmap_columns=12, sql_length=400), dest)
+    return sorted(path for path in dest.rglob("*") if path.is_file())
+
+
+def test_estimate_is_within_its_margin(large_export):
+    exact = collect(large_export, estimate=False)
+    estimated = collect(large_export, estimate=True)
+
+    assert exact["token_mode"] == "exact"
+    assert estimated["token_mode"] == "estimate"
+    assert estimated["total_size_bytes"] == exact["total_size_bytes"]
+    assert estimated["token_calibration"]["xml"]["estimated_bytes"] > 0
+
+    error = abs(estimated["total_tokens"] - exact["total_tokens"])
+    assert error <= estimated["token_margin"]
+    assert error <= 0.01 * exact["total_tokens"]
+
+
+def test_single_chunk_files_are_counted_exactly(export_dir):
+    files = sorted(path for path in export_dir.rglob("*") if path.is_file())
+    files = [path for path in files if path.stat().st_size < 4096]
+
+    exact = collect(files, estimate=False)
+    estimated = collect(files, estimate=True)
+
+    assert files
+    assert estimated["total_tokens"] == exact["total_tokens"]
+    assert estimated["token_margin"] == 0
@@ -0,0 +1,66 @@
+"""select_latest_versions keeps the latest saved version of each job"""
+
+from pathlib import Path
+
+from conftest import PROPERTIES
+
+from talend_parser.talend_parser import select_latest_versions
+
+
+def touch(path: Path, **properties: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("<talendfile:ProcessType/>\n", encoding="utf-8")
+    if properties:
+        path.with_suffix(".properties").write_text(PROPERTIES.format(**properties))
+    return path
+
+
+def test_highest_version_wins_numerically(tmp_path):
+    files = [
+        touch(tmp_path / "Load_0.9.item"),
+        touch(tmp_path / "Load_0.10.item"),
+        touch(tmp_path / "Load_0.2.item"),
+        touch(tmp_path / "Other_0.1.item"),
+    ]
+
+    kept, superseded = select_latest_versions(files)
+
+    assert [path.name for path in kept] == ["Load_0.10.item", "Other_0.1.item"]
+    assert superseded == {"Load_0.10": ["Load_0.2", "Load_0.9"]}
+
+
+def test_jobs_in_other_folders_are_separate(tmp_path):
+    files = [
+        touch(tmp_path / "sales" / "Load_0.1.item"),
+        touch(tmp_path / "finance" / "Load_0.1.item"),
+        touch(tmp_path / "finance" / "Load_1.0.item"),
+    ]
+
+    kept, superseded = select_latest_versions(files)
+
+    assert kept == [files[0], files[2]]
+    assert superseded == {"Load_1.0": ["Load_0.1"]}
+
+
+def test_properties_label_and_version_take_precedence(tmp_path):
+    files = [
+        touch(tmp_path / "Load_old.item", id="_a", label="Load", version="1.1"),
+        touch(tmp_path / "Load_0.3.item", id="_a", label="Load", version="0.3"),
+    ]
+
+    kept, superseded = select_latest_versions(files)
+
+    assert kept == [files[0]]
+    assert superseded == {"Load_old": ["Load_0.3"]}
+
+
+def test_kept_files_keep_their_original_order(tmp_path):
+    files = [
+        touch(tmp_path / "B_0.2.item"),
+        touch(tmp_path / "A_0.1.item"),
+        touch(tmp_path / "B_0.1.item"),
+    ]
+
+    kept, _ = select_latest_versions(files)
+
+    assert kept == [files[0], files[1]]